@@ -0,0 +1,102 @@
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+import pandas as pd
+from Services.FileSystem import File_Management
+from Services.Predictions import Model_Export
+from Services.Statistics import Runtime_Statistics
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+
+
+def handle_args():
+    """
+    Parse the given arguments
+    :return:
+    """
+    parser = argparse.ArgumentParser(description='Predicts the runtime and memory of queued jobs using exported models.',
+                                     epilog='Accepts csv files with the same columns as the files used for training')
+    parser.add_argument('-mo', '--models', dest='models', required=True,
+                        help="The folder containing the exported models. E.g. Data/Results/<run>/Models")
+    parser.add_argument('-j', '--jobs', dest='jobs', nargs='+', required=True,
+                        help="One or more csv files containing the queued jobs.")
+    parser.add_argument('-t', '--tool', dest='tool', required=False,
+                        help="The tool of all jobs. If not set, the tool is detected using the name of the file.")
+    parser.add_argument('-tc', '--tool-column', dest='tool_column', required=False,
+                        help="A column containing the tool of each job. Used for files containing multiple tools.")
+    parser.add_argument('-o', '--output', dest='output', default='.', required=False,
+                        help="The folder the predictions are written to.")
+    parser.add_argument('-po', '--predictions-only', dest='predictions_only', action='store_true', required=False,
+                        help="Only write the predictions instead of the jobs and their predictions.")
+    parser.add_argument('-c', '--cores', dest='cores', type=int, default=-1, required=False,
+                        help="The amount of cores used to evaluate the models. Defaults to all cores.")
+    parser.add_argument('-cm', '--compiled', dest='compiled', action='store_true', required=False,
+                        help="Uses the compiled forests, which only require numpy, instead of the scikit-learn models.")
+    return parser.parse_args()
+
+
+def predict_jobs(models: dict, jobs, tool_names):
+    """
+    Predicts all labels for all jobs. The jobs of each tool are predicted in one vectorized pass.
+    :param models: The artifacts of each label for each tool
+    :param jobs:
+    :param tool_names: A series containing the tool of each job
+    :return:
+    """
+    predictions = []
+    for tool_name, indices in tool_names.groupby(tool_names).groups.items():
+        if tool_name not in models:
+            logging.warning(f"No model available for tool {tool_name}. Skipping {len(indices)} jobs.")
+            continue
+
+        predictions.append(Model_Export.predict_labels(models[tool_name], jobs.loc[indices]))
+
+    if len(predictions) == 0:
+        return pd.DataFrame(index=jobs.index)
+
+    return pd.concat(predictions, sort=False).reindex(jobs.index)
+
+
+if __name__ == '__main__':
+    args = handle_args()
+    start_time = time.time()
+
+    # Created before predicting, so a missing folder does not discard the predictions
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+
+    models = Model_Export.load_models(args.models, args.compiled)
+    if len(models) == 0:
+        logging.error(f"No models found in {args.models}")
+        sys.exit(1)
+
+    for artifacts in models.values():
+        for artifact in artifacts.values():
+            if 'model' in artifact:
+                # Only some engines use threads. Pipelines set the threads of their steps.
+                model = artifact['model']
+                model.set_params(**{key: args.cores for key in model.get_params() if key.endswith('n_jobs')})
+
+    for path in args.jobs:
+        jobs = pd.read_csv(path)
+
+        if args.tool_column is not None:
+            if args.tool_column not in jobs:
+                logging.error(f"Column {args.tool_column} not found in {path}")
+                continue
+            tool_names = jobs[args.tool_column]
+        else:
+            tool_name = args.tool if args.tool is not None else File_Management.get_tool_name(path)
+            tool_names = pd.Series(tool_name, index=jobs.index)
+
+        predictions = predict_jobs(models, jobs, tool_names)
+
+        if not args.predictions_only:
+            predictions = pd.concat([jobs.drop(columns=predictions.columns, errors='ignore'), predictions], axis=1)
+
+        output = Path(args.output, f"{Path(path).stem}_predictions.csv")
+        predictions.to_csv(output, index=False)
+        logging.info(f"Predicted {len(jobs)} jobs of {path}. Predictions written to {output}")
+
+    logging.info(f"Done in {Runtime_Statistics.get_duration(start_time)} seconds")
@@ -3,31 +3,46 @@ import pandas as pd
 from Services.FileSystem import Folder_Management, File_Management
 import os
 from Services.Configuration.Config import Config
-from Services.Processing import PreProcessing
-from time import sleep
+from Services.Processing import PreProcessing, Category_Encoding, Column_Profile, Dataset_Cache, Memory_Map
+from Services.Logging import Console
 import numpy as np
 import logging
 from sklearn.metrics import r2_score
 from sklearn.model_selection import train_test_split, KFold
 from sklearn.ensemble import RandomForestRegressor
-import seaborn as sns
-import matplotlib.pyplot as plt
 from sklearn.decomposition import PCA
-from Services.Predictions import Predictions
-
-sns.set()
+from Services.Predictions import Predictions, Cross_Validation, Learning_Curve, Model_Engines
+from Services.Parallel import Core_Budget, Shared_Memory, Task_Executor
+from Services.Plotting import Plot_Data, Plot_Specs
 
 
 class File:
-    def __init__(self, full_name: str, tool_folder: Path, raw_df=None):
+    def __init__(self, full_name: str, tool_folder: Path, raw_df=None, encoders: dict = None,
+                 preprocessed_df=None, preprocessing_state: dict = None, source: dict = None):
         """
         the constructor for the class
         :param full_name:
         :param tool_folder:
         :param raw_df:
+        :param encoders: The categorical encoders of the tool, shared by all files of the tool
+        :param preprocessed_df: Merges already preprocessed data sets, if the raw data sets are not kept in memory
+        :param preprocessing_state: The preprocessing state belonging to the given preprocessed data set
+        :param source: The source of the file, if it was already read by read_source
         """
+        # Handle and block of the preprocessed data set, while it is published to shared memory
+        self.shared_matrix = None
+        self.shared_block = None
+        # Errors occurred while evaluating the file, collected for the error report
+        self.errors = []
+        # Handle of the preprocessed data set, while it is spilled to disk in memory saving mode
+        self.spilled_matrix = None
+        # Variance, range, null count, cardinality, zero fraction and finiteness of each preprocessed column
+        self.column_profile = None
+        # Cross validation fold of each preprocessed row, shared by all evaluations of the file
+        self.folds = None
+
         # Provides information whether the entity is a merged too file or a "real" file
-        if raw_df is not None:
+        if raw_df is not None or preprocessed_df is not None:
             self.merged_file = True
         else:
             self.merged_file = False
@@ -49,23 +64,36 @@ class File:
         # If a label is missing the data set it will not be present in here, and therefore not evaluated
         self.detected_labels = []
         self.verified = True
+        # Why the file is not eligible to be evaluated, written to the excluded files report
+        self.exclusion_reason = None
+        # Fill values and encoders used to preprocess the raw data set. Required to preprocess new data the same way.
+        self.preprocessing_state = preprocessing_state if preprocessing_state is not None else dict()
+        # Row and column count of the raw data set, if the raw data set is not kept in memory
+        self.raw_row_count = 0
+        self.raw_column_count = 0
+        # Categories are encoded using the encoders of the tool, so all files share the same codes
+        self.encoders = encoders
 
         # Check if its a merged file or not
         if self.merged_file:
             self.raw_df = raw_df
+            if preprocessed_df is not None:
+                self.preprocessed_df = preprocessed_df
+                self.raw_row_count = len(preprocessed_df.index)
+                self.raw_column_count = len(preprocessed_df.columns)
+            elif not Config.MEMORY_SAVING_MODE:
+                self.preprocessed_df = PreProcessing.pre_process_data_set(self.raw_df, self.preprocessing_state,
+                                                                          self.encoders)
         else:
             # Load data set depending on memory saving modes
             if not Config.MEMORY_SAVING_MODE:
-                self.raw_df = File_Management.read_file(self.full_name)
-                if self.raw_df is None:
-                    self.verified = False
+                if not self.__load_preprocess_raw_data(source):
+                    self.__exclude("The file could not be read.")
                     return
             else:
                 self.raw_df = pd.DataFrame()
 
-        # Pre process the raw data set
         if not Config.MEMORY_SAVING_MODE:
-            self.preprocessed_df = PreProcessing.pre_process_data_set(self.raw_df)
             self.detect_labels()
         else:
             self.preprocessed_df = pd.DataFrame()
@@ -76,15 +104,20 @@ class File:
         self.split_evaluation_results = dict()
         # Contains y and y_hat values
         self.predicted_results = dict()
+        # Contains the model trained on the whole data set and the features it was trained with for each label
+        self.models = dict()
+        self.model_features = dict()
         # Contains the features importances for each file
         self.feature_importances = dict()
         # Contains the pca components with supporting functions for all labels
         self.pca_components = dict()
         # Contains all pca components as df for each label
         self.pca_components_data_frames = dict()
-        # Contains all simple dfs
-        self.simple_dfs = dict()
+        # Contains the columns of all simple dfs. The simple dfs are sliced from the preprocessed data set on demand.
+        self.simple_df_columns = dict()
         self.simple_dfs_evaluation = dict()
+        # Contains the learning curve for each label, if the percentage removal is enabled
+        self.learning_curves = dict()
 
         # Prepare the internal data structure
         self.prepare_internal_data_structure()
@@ -102,10 +135,13 @@ class File:
         if self.folder is not None:
             self.verified = True
         else:
-            self.verified = False
+            self.__exclude("The folder of the file could not be created.")
 
         self.simple_df_folder = Folder_Management.create_folder(Path.joinpath(self.folder, "Simple"))
         self.split_folder = Folder_Management.create_folder(Path.joinpath(self.folder, "Splits"))
+        self.learning_curve_folder = None
+        if Config.PERCENTAGE_REMOVAL:
+            self.learning_curve_folder = Folder_Management.create_folder(Path.joinpath(self.folder, "LearningCurve"))
         # Determines if a file is already evaluated or not
         self.evaluated = False
 
@@ -114,6 +150,9 @@ class File:
         Loads all the data and prepares data sets, which was skipped due to memory saving mode
         """
         self.__load_preprocess_raw_data()
+        self.__spill_preprocessed_df()
+        self.column_profile = None
+        self.folds = None
         self.detect_labels()
         self.prepare_internal_data_structure()
 
@@ -123,40 +162,231 @@ class File:
         """
         for label in self.detected_labels:
             self.evaluation_results[label] = pd.DataFrame(
-                columns=['File Name', 'Train Score', 'Test Score', 'Potential Over Fitting', 'Initial Row Count',
-                         'Initial Feature Count', 'Processed Row Count', 'Processed Feature Count'])
+                columns=['File Name', 'Engine', 'Train Score', 'Test Score', 'Potential Over Fitting',
+                         'Initial Row Count', 'Initial Feature Count', 'Processed Row Count', 'Processed Feature Count'])
             self.predicted_results[label] = pd.DataFrame(columns=['y', 'y_hat'])
+            self.models[label] = None
+            self.model_features[label] = []
 
             self.feature_importances[label] = pd.DataFrame()
             self.pca_components[label] = None
             self.pca_components_data_frames[label] = pd.DataFrame()
             self.split_evaluation_results[label] = pd.DataFrame()
             self.simple_dfs_evaluation[label] = pd.DataFrame(
-                columns=['File Name', 'Train Score', 'Test Score', 'Potential Over Fitting', 'Initial Row Count',
-                         'Initial Feature Count', 'Processed Row Count', 'Processed Feature Count', 'Features'])
-            self.simple_dfs[label] = pd.DataFrame()
+                columns=['File Name', 'Engine', 'Train Score', 'Test Score', 'Potential Over Fitting',
+                         'Initial Row Count', 'Initial Feature Count', 'Processed Row Count', 'Processed Feature Count',
+                         'Features'])
+            self.simple_df_columns[label] = []
+            self.learning_curves[label] = pd.DataFrame()
 
     # Loading and preprocessing
-    def __load_preprocess_raw_data(self):
+    @staticmethod
+    def read_source(full_name: str) -> dict:
         """
-        Loads the data set and preprocesses it
-        Only used if memory saving mode is active
+        Reads the cached data set or the raw data set of a file, without preprocessing it.
+        Sources of several files can be read in parallel, while the files are still created one after another.
+        :param full_name:
         :return:
         """
-        if not self.merged_file:
-            self.raw_df = File_Management.read_file(self.full_name)
-            self.preprocessed_df = PreProcessing.pre_process_data_set(self.raw_df)
-            return
+        source = dict()
+        if Config.MEMORY_SAVING_MODE:
+            return source
+
+        if Config.DATASET_CACHE:
+            source['cached_data_set'] = Dataset_Cache.load(Path(Config.DATA_RAW_DIRECTORY, full_name))
+
+        # Streamed files are read while they are preprocessed
+        if source.get('cached_data_set') is None and not Config.STREAMING_MODE:
+            source['raw_df'] = File_Management.read_file(full_name)
+
+        return source
+
+    def __load_preprocess_raw_data(self, source: dict = None) -> bool:
+        """
+        Loads the data set and preprocesses it.
+        If the data set cache contains the preprocessed data set, the raw data set is not loaded at all.
+        Returns False, if the data set could not be loaded
+        :param source: The already read source of the file
+        :return:
+        """
+        if self.merged_file:
+            return True
+
+        if source is None:
+            source = dict()
+
+        if self.__load_cached_data_set(source.get('cached_data_set')):
+            return True
+
+        if Config.STREAMING_MODE:
+            # Only the preprocessed data set is kept in memory
+            self.raw_df = None
+            self.preprocessed_df = self.__stream_preprocess_raw_data()
+            if self.preprocessed_df is None:
+                return False
         else:
-            return
+            if source.get('raw_df') is not None:
+                self.raw_df = source['raw_df']
+            else:
+                self.raw_df = File_Management.read_file(self.full_name)
+
+            if self.raw_df is None:
+                return False
+
+            self.preprocessed_df = PreProcessing.pre_process_data_set(self.raw_df, self.preprocessing_state,
+                                                                      self.encoders)
+
+            if Config.MEMORY_SAVING_MODE:
+                # Like streamed data sets, only the preprocessed data set is kept in memory. Merged files are created
+                # from the preprocessed data sets instead.
+                self.raw_column_count, self.raw_row_count = len(self.raw_df.columns), len(self.raw_df.index)
+                self.raw_df = None
+
+        if Config.DATASET_CACHE:
+            columns, rows, features = self.get_raw_df_statistics()
+            Dataset_Cache.store(self.path, {'preprocessed_df': self.preprocessed_df,
+                                            'preprocessing_state': self.preprocessing_state,
+                                            'raw_row_count': rows, 'raw_column_count': columns})
+        return True
+
+    def __load_cached_data_set(self, entry: dict = None) -> bool:
+        """
+        Loads the preprocessed data set from the data set cache.
+        Returns False, if there is no valid entry for the file
+        :param entry: The already loaded entry of the file
+        :return:
+        """
+        if not Config.DATASET_CACHE:
+            return False
+
+        if entry is None:
+            entry = Dataset_Cache.load(self.path)
+
+        if entry is None:
+            return False
+
+        # The cached data set is only usable, if it was encoded with the same codes the tool uses
+        if self.encoders is not None and not Category_Encoding.merge_categories(
+                self.encoders, entry['preprocessing_state'].get('encoders', dict())):
+            return False
+
+        self.raw_df = None
+        self.preprocessed_df = entry['preprocessed_df']
+        self.preprocessing_state = entry['preprocessing_state']
+        self.raw_row_count = entry['raw_row_count']
+        self.raw_column_count = entry['raw_column_count']
+        return True
+
+    def __stream_preprocess_raw_data(self):
+        """
+        Reads the data set in chunks and preprocesses each chunk, so the raw data set is never completely in memory.
+        The preprocessed chunks are appended to a spill file, which is memory mapped once all chunks are written.
+        Returns None, if the file could not be read
+        :return:
+        """
+        chunks = File_Management.read_file_chunks(self.full_name, Config.CHUNK_SIZE)
+        if chunks is None:
+            return None
+
+        # Chunks have to share the same codes, even if the file does not belong to a tool
+        encoders = self.encoders if self.encoders is not None else dict()
+
+        # The file is read once, with the types inferred for each chunk. If a column is categorical in some chunks only,
+        # the file is read again with the column categorical in every chunk, like it is, if the whole file is read.
+        # The categories of the first read are only kept, if the file is not read again.
+        categories = {column: list(column_categories) for column, column_categories in encoders.items()}
+        types = dict()
+        preprocessed_df = self.__spill_preprocessed_chunks(chunks, categories, types)
+
+        if types.get('mixed', False):
+            if Config.VERBOSE:
+                logging.info(f"Reading file {self.name} again, because its columns differ in type between chunks.")
+
+            chunks = File_Management.read_file_chunks(self.full_name, Config.CHUNK_SIZE, types['categorical'])
+            if chunks is None:
+                return None
+            preprocessed_df = self.__spill_preprocessed_chunks(chunks, encoders)
+        else:
+            Category_Encoding.merge_categories(encoders, categories)
+
+        if not Config.MEMORY_SAVING_MODE:
+            # Only the memory saving mode frees the data sets. The memory mapped view stays valid without the file.
+            Memory_Map.remove(self.spilled_matrix)
+            self.spilled_matrix = None
+
+        return preprocessed_df
+
+    def __spill_preprocessed_chunks(self, chunks, encoders: dict, types: dict = None):
+        """
+        Preprocesses each chunk and appends it to a spill file. Returns the memory mapped data set.
+        If types are given, the categorical columns of the chunks are collected in there. Once a column is categorical
+        in some chunks only, the remaining chunks are only checked for categorical columns and None is returned.
+        :param chunks:
+        :param encoders:
+        :param types:
+        :return:
+        """
+        self.preprocessing_state.clear()
+        self.raw_row_count = 0
+
+        writer = Memory_Map.create_writer()
+        try:
+            for chunk in chunks:
+                if types is not None and self.__has_mixed_types(chunk, types):
+                    continue
+
+                self.raw_row_count += len(chunk.index)
+                Memory_Map.write_chunk(writer, PreProcessing.pre_process_chunk(chunk, self.preprocessing_state,
+                                                                               encoders))
+                # Like the raw data set, the chunk does not contain the removed bad columns anymore
+                self.raw_column_count = len(chunk.columns)
+        except BaseException:
+            Memory_Map.discard_writer(writer)
+            raise
+
+        if types is not None and types.get('mixed', False):
+            Memory_Map.discard_writer(writer)
+            return None
+
+        Memory_Map.remove(self.spilled_matrix)
+        self.spilled_matrix = Memory_Map.close_writer(writer)
+        if self.spilled_matrix is None:
+            return pd.DataFrame()
+
+        return Memory_Map.load(self.spilled_matrix)
+
+    @staticmethod
+    def __has_mixed_types(chunk, types: dict) -> bool:
+        """
+        Collects the categorical columns of the chunk. Returns True, once a column is categorical in some chunks,
+        but numerical in the first one or the other way round. The first chunk determines the type of each column.
+        Columns without any value in a chunk are read as numerical, but are filled like categorical columns,
+        so they only count for the first chunk.
+        :param chunk:
+        :param types:
+        :return:
+        """
+        columns = set(chunk.select_dtypes(exclude=['int', 'float']).columns)
+        empty_columns = set(chunk.columns[chunk.isna().all().to_numpy()])
+
+        first_columns = types.setdefault('first', columns)
+        if columns != first_columns - empty_columns:
+            types['mixed'] = True
+        types.setdefault('categorical', set()).update(columns)
+
+        return types.get('mixed', False)
 
     def get_raw_df_statistics(self):
         """
         Returns column, row and feature count of the raw data set
         :return:
         """
-        columns: int = len(self.raw_df.columns)
-        rows: int = len(self.raw_df.index)
+        if self.raw_df is None:
+            columns: int = self.raw_column_count
+            rows: int = self.raw_row_count
+        else:
+            columns: int = len(self.raw_df.columns)
+            rows: int = len(self.raw_df.index)
         features: int = columns - 1
         return columns, rows, features
 
@@ -180,6 +410,27 @@ class File:
         features: int = columns - 1
         return columns, rows, features
 
+    def get_column_profile(self):
+        """
+        Returns the profile of the preprocessed data set. The profile is created once, when it is requested first.
+        :return:
+        """
+        if self.column_profile is None:
+            self.column_profile = Column_Profile.create_profile(self.preprocessed_df)
+
+        return self.column_profile
+
+    def get_folds(self):
+        """
+        Returns the cross validation fold of each row of the preprocessed data set, for each repetition.
+        The folds are created once, so every evaluation of a part of the data set uses the same fold for the same row.
+        :return:
+        """
+        if self.folds is None:
+            self.folds = Cross_Validation.create_folds(len(self.preprocessed_df))
+
+        return self.folds
+
     def verify(self):
         """
         Check if the file passes all requirements to be able to be evaluated
@@ -190,33 +441,42 @@ class File:
             if Config.VERBOSE:
                 logging.warning(f"{self.name} has insufficient rows ({rows}).")
                 logging.warning("The file will not be evaluated.")
-                sleep(1)
-            self.verified = False
+                Console.pause(1)
+            self.__exclude(f"Insufficient rows ({rows}).")
 
         if columns < Config.MINIMUM_COLUMN_COUNT:
             if Config.VERBOSE:
                 logging.warning(f"{self.name} has insufficient columns ({columns}).")
                 logging.warning("The file will not be evaluated.")
-                sleep(1)
-            self.verified = False
+                Console.pause(1)
+            self.__exclude(f"Insufficient columns ({columns}).")
+
+        profile = self.get_column_profile()
 
         # check for infinity values
-        for column in self.preprocessed_df:
-            if self.preprocessed_df[column].any() > np.iinfo('i').max:
-                if Config.VERBOSE:
-                    logging.warning(f"Detected infinity values in preprocessed data set!")
-                    logging.warning(f"File will not be evaluated.")
-                self.verified = False
+        if not profile['Finite'].all():
+            if Config.VERBOSE:
+                logging.warning(f"Detected infinity values in preprocessed data set!")
+                logging.warning(f"File will not be evaluated.")
+            self.__exclude("Infinity values detected.")
 
         # Check if columns will pass variance selection
         for label in self.detected_labels:
-            if label in self.preprocessed_df:
-                check_df = self.preprocessed_df.copy()
-                del check_df[label]
-                check_df = PreProcessing.variance_selection(check_df)
+            if label not in profile.index:
+                continue
 
-                if 'numpy' not in str(type(check_df)):
-                    self.verified = False
+            if len(Column_Profile.get_varying_columns(profile, profile.index.drop(label))) == 0:
+                self.__exclude(f"No feature varies for label {label}.")
+
+    def __exclude(self, reason: str):
+        """
+        Flags the file as not eligible to be evaluated. Only the first reason is reported.
+        :param reason:
+        :return:
+        """
+        self.verified = False
+        if self.exclusion_reason is None:
+            self.exclusion_reason = reason
 
     # Prediction
     def predict(self, label: str):
@@ -224,24 +484,58 @@ class File:
         Predicts the runtime for a complete data set.
         :return:
         """
-        try:
+        Task_Executor.evaluate_task(self, label, Task_Executor.PREDICTION)
 
+    def calculate_prediction(self, label: str):
+        """
+        Trains and evaluates a model using the complete data set.
+        The file is not modified, so the calculation can run as an independent task.
+        Raises the exception, if the prediction failed.
+        """
+        try:
             model, train_score, test_score, over_fitting, X, y_test, y_test_hat \
-                = Predictions.predict(label, self.preprocessed_df.copy())
+                = Predictions.predict(label, self.preprocessed_df, self.get_column_profile())
+
+            # The model is trained with the pruned and variance selected features only
+            feature_importance = self.__calculate_feature_importance(model, X.columns)
+
+            folds = self.get_folds() if Config.CROSS_VALIDATION else None
+            cross_validation = self.__cross_validate(label, self.preprocessed_df, self.get_column_profile(), folds)
+
+            return {'model': model, 'features': list(X.columns),
+                    'train_score': train_score, 'test_score': test_score, 'over_fitting': over_fitting,
+                    'processed_row_count': len(X), 'processed_feature_count': X.shape[1],
+                    'y_test': y_test, 'y_test_hat': y_test_hat, 'feature_importance': feature_importance,
+                    'cross_validation': cross_validation}
+        except BaseException as ex:
+            logging.exception(ex)
+            raise
+
+    def store_prediction(self, label: str, result: dict):
+        """
+        Stores the result of calculate_prediction
+        """
+        if result is None:
+            return
 
-            # Calculate feature importances
-            temp_df = self.preprocessed_df.copy()
-            del temp_df[label]
-            self.__calculate_feature_importance(label, model, temp_df)
+        try:
+            columns, rows, features = self.get_raw_df_statistics()
+            self.models[label] = result['model']
+            self.model_features[label] = result['features']
+            self.feature_importances[label] = result['feature_importance']
 
             self.evaluation_results[label] = self.evaluation_results[label].append(
-                {'File Name': self.name, "Test Score": test_score,
-                 "Train Score": train_score, "Potential Over Fitting": over_fitting,
-                 "Initial Row Count": len(self.raw_df.index),
-                 "Initial Feature Count": len(self.raw_df.columns) - 1, "Processed Row Count": len(X),
-                 "Processed Feature Count": X.shape[1]}, ignore_index=True)
+                {'File Name': self.name, "Engine": Model_Engines.get_engine(result['model']),
+                 "Test Score": result['test_score'],
+                 "Train Score": result['train_score'], "Potential Over Fitting": result['over_fitting'],
+                 "Initial Row Count": rows, "Initial Feature Count": features,
+                 "Processed Row Count": result['processed_row_count'],
+                 "Processed Feature Count": result['processed_feature_count'], **result['cross_validation']},
+                ignore_index=True)
+            # Shared data sets use one common dtype, so the label dtype has to be restored
+            y_test = pd.Series(result['y_test']).astype(self.preprocessed_df[label].dtype)
             self.predicted_results[label] = pd.concat(
-                [pd.Series(y_test).reset_index()[label], pd.Series(y_test_hat)],
+                [y_test.reset_index()[label], pd.Series(result['y_test_hat'])],
                 axis=1)
 
             self.predicted_results[label].rename(
@@ -255,159 +549,294 @@ class File:
         """
         Split the data into parts, and predicts results using only one part after another.
         """
-        try:
-            df = self.preprocessed_df.copy()
+        Task_Executor.evaluate_task(self, label, Task_Executor.PARTIAL_PREDICTION)
 
-            # How many parts minimum. 3 is default.
-            parts: int = 3
-            if len(df) > 10000:
-                while len(df) / parts > 3333:
-                    parts += 1
-
-            # how many rows should one part contain
+    def calculate_partial_prediction(self, label: str):
+        """
+        Trains and evaluates a model for each part of the data set.
+        The parts are views of the preprocessed data set and are evaluated by the split workers in parallel.
+        The file is not modified, so the calculation can run as an independent task.
+        Raises the exception, if the prediction failed.
+        """
+        try:
+            df = self.preprocessed_df
+            profile = self.get_column_profile()
             total_rows = int(len(df))
-            parts_row_count: int = int(len(df) / parts)
-
-            data_frames = []
-            for part in range(parts):
-                if part == 0:
-                    data_frames.append(pd.DataFrame(df[:parts_row_count]))
-                elif 0 < part < parts - 1:
-                    data_frames.append(pd.DataFrame(df[(parts_row_count * part): (parts_row_count * (part + 1))]))
-                else:
-                    data_frames.append(pd.DataFrame(df[parts_row_count * part:]))
+            parts = self.__get_split_parts(total_rows)
 
-            for data_frame in data_frames:
-                model, train_score, test_score, over_fitting, X, y_test, y_test_hat \
-                    = Predictions.predict(label, data_frame.copy())
+            split_results = []
+            feature_importance = None
 
-                if model is None:
-                    logging.warning("Could not create predictions because of insufficient data!")
-                    continue
+            # Forests release the GIL while fitting, so threads can share the data set without copying it
+            folds = self.get_folds() if Config.CROSS_VALIDATION else None
+            results = Core_Budget.run_parallel(
+                lambda part: self.__calculate_split_prediction(df, profile, folds, label, *part), parts,
+                Config.SPLIT_WORKERS)
 
-                # Calculate feature importances
-                temp_df = data_frame.copy()
-                del temp_df[label]
-                self.__calculate_feature_importance(label, model, temp_df)
+            # Results are collected in the order of the parts, regardless of the order the fits finished
+            for split_result, split_feature_importance in results:
+                if split_result is None:
+                    continue
 
-                self.split_evaluation_results[label] = self.split_evaluation_results[label].append(
-                    {'File Name': self.name, "Test Score": test_score,
-                     "Train Score": train_score, "Potential Over Fitting": over_fitting,
-                     "Initial Row Count": len(data_frame),
-                     "Initial Feature Count": len(data_frame.columns), "Processed Row Count": len(X),
-                     "Processed Feature Count": X.shape[1], "Total rows": total_rows}, ignore_index=True)
+                split_result["Total rows"] = total_rows
+                split_results.append(split_result)
+                feature_importance = split_feature_importance
 
-            self.split_evaluation_results[label].sort_values(by='Test Score', ascending=False, inplace=True)
+            return {'split_results': split_results, 'feature_importance': feature_importance}
 
         except BaseException as ex:
             logging.exception(ex)
-            input()
+            Console.prompt()
+            raise
+
+    def __calculate_split_prediction(self, df, profile, folds, label: str, start: int, end: int):
+        """
+        Trains and evaluates a model using the rows from start to end.
+        Returns the split result and the feature importance or None, None if there is insufficient data.
+        """
+        data_frame = df.iloc[start:end]
+        model, train_score, test_score, over_fitting, X, y_test, y_test_hat = Predictions.predict(label, data_frame,
+                                                                                                  profile)
+
+        if model is None:
+            logging.warning("Could not create predictions because of insufficient data!")
+            return None, None
+
+        # The model is trained with the pruned and variance selected features only
+        feature_importance = self.__calculate_feature_importance(model, X.columns)
+
+        return {'File Name': self.name, "Engine": Model_Engines.get_engine(model), "Test Score": test_score,
+                "Train Score": train_score, "Potential Over Fitting": over_fitting,
+                "Initial Row Count": len(data_frame),
+                "Initial Feature Count": len(data_frame.columns), "Processed Row Count": len(X),
+                "Processed Feature Count": X.shape[1],
+                **self.__cross_validate(label, data_frame, profile,
+                                        None if folds is None else folds[:, start:end])}, feature_importance
+
+    def __cross_validate(self, label: str, df, profile, folds) -> dict:
+        """
+        Cross validates a model using the given data frame, if cross validation is enabled.
+        The folds are the folds of the rows of the data frame, selected from the folds of the file.
+        Returns the mean and variance of the scores or an empty dictionary, if there are none.
+        """
+        if not Config.CROSS_VALIDATION:
+            return dict()
+
+        scores = Cross_Validation.cross_validate(label, df, profile, folds)
+        if scores is None:
+            if Config.VERBOSE:
+                logging.warning(f"Could not cross validate label {label} of file {self.name}")
+            return dict()
+
+        return scores
+
+    def __get_split_parts(self, row_count: int) -> list:
+        """
+        Returns the first and last row of each part. A part contains at least 3333 rows and there are 3 parts minimum.
+        If there are more parts than configured, only evenly distributed parts across the data set are evaluated.
+        """
+        # How many parts minimum. 3 is default.
+        parts: int = 3
+        if row_count > 10000:
+            parts = max(parts, int(np.ceil(row_count / 3333)))
+
+        # how many rows should one part contain
+        parts_row_count: int = int(row_count / parts)
+
+        bounds = [(parts_row_count * part, parts_row_count * (part + 1)) for part in range(parts)]
+        # The last part contains the remaining rows
+        bounds[-1] = (parts_row_count * (parts - 1), row_count)
+
+        if 0 < Config.MAXIMUM_SPLIT_PARTS < parts:
+            selected_parts = np.unique(np.linspace(0, parts - 1, Config.MAXIMUM_SPLIT_PARTS).round().astype(int))
+            bounds = [bounds[part] for part in selected_parts]
+            if Config.VERBOSE:
+                logging.info(f"Evaluating {len(bounds)} of {parts} parts of file {self.name}")
+
+        return bounds
+
+    def store_partial_prediction(self, label: str, result: dict):
+        """
+        Stores the result of calculate_partial_prediction
+        """
+        if result is None:
+            return
+
+        if result['feature_importance'] is not None:
+            self.feature_importances[label] = result['feature_importance']
+
+        if len(result['split_results']) == 0:
+            return
+
+        for split_result in result['split_results']:
+            self.split_evaluation_results[label] = self.split_evaluation_results[label].append(split_result,
+                                                                                               ignore_index=True)
+
+        self.split_evaluation_results[label].sort_values(by='Test Score', ascending=False, inplace=True)
 
     def pca_analysis(self, label: str):
         """
         Generates a pca analysis
         """
+        Task_Executor.evaluate_task(self, label, Task_Executor.PCA_ANALYSIS)
+
+    def calculate_pca_analysis(self, label: str):
+        """
+        Calculates the pca components for the given label.
+        The file is not modified, so the calculation can run as an independent task.
+        Raises the exception, if the analysis failed.
+        """
 
         try:
-            df = self.preprocessed_df.copy()
+            df = self.preprocessed_df
+            profile = self.get_column_profile()
 
             y = df[label]
-            del df[label]
-            X = df
+            # Normalized columns without variance would be removed by the variance selection afterwards
+            X = df[Column_Profile.get_varying_columns(profile, df.columns.drop(label))]
             X = PreProcessing.normalize_X(X)
-            X = PreProcessing.variance_selection(X)
 
-            self.pca_components[label] = PCA()
-            X = self.pca_components[label].fit_transform(X)
-            self.pca_components_data_frames[label] = pd.DataFrame(X)
-            self.pca_components_data_frames[label][label] = pd.Series(y.values)
+            pca = PCA()
+            X = pca.fit_transform(X)
+            pca_components_data_frame = pd.DataFrame(X)
+            pca_components_data_frame[label] = pd.Series(y.values)
+
+            return {'pca': pca, 'data_frame': pca_components_data_frame}
 
         except BaseException as ex:
             logging.exception(ex)
+            raise
 
-    def create_simple_data_set(self, label: str, test_score_threshold):
+    def store_pca_analysis(self, label: str, result: dict):
         """
-        Creates simple data sets based on the feature importances
+        Stores the result of calculate_pca_analysis
         """
+        if result is None:
+            return
 
-        # All simple dataframes will be stored in here
-        simple_dfs = []
-
-        try:
-            df = self.preprocessed_df.copy()
-            feature_importances = self.feature_importances[label].copy()
-
-            if feature_importances.empty:
-                return
-
-            # Transpose and remove the label from feature importances
-            feature_importances = feature_importances.T
+        self.pca_components[label] = result['pca']
+        self.pca_components_data_frames[label] = result['data_frame']
 
-            if label in feature_importances:
-                del feature_importances[label]
+    def learning_curve(self, label: str):
+        """
+        Evaluates the learning curve
+        """
+        Task_Executor.evaluate_task(self, label, Task_Executor.LEARNING_CURVE)
 
-            feature_importances = feature_importances.T
+    def calculate_learning_curve(self, label: str):
+        """
+        Calculates the learning curve for the given label, using more and more rows of the data set.
+        The file is not modified, so the calculation can run as an independent task.
+        Raises the exception, if the calculation failed.
+        """
+        try:
+            curve = Learning_Curve.calculate_learning_curve(label, self.preprocessed_df, self.get_column_profile())
 
-            previous_feature_count = 0
-            # Todo: Add config
-            threshold: float = 0.5
+            if curve is None:
+                logging.warning("Could not create learning curve because of insufficient data!")
+                return None
 
-            while threshold > 0.00:
-                indices = feature_importances[feature_importances['Gini-importance'].gt(threshold)].index
-                features = feature_importances.T[indices]
+            curve.insert(0, 'File Name', self.name)
+            return curve
 
-                feature_count = len(features.columns)
-                # Check if the number of features changed.
-                # If not continue
-                if previous_feature_count == feature_count:
-                    if Config.VERBOSE:
-                        logging.info("Skipping because of same feature count")
-                    threshold = self.__lower_threshold(threshold)
-                    continue
+        except BaseException as ex:
+            logging.exception(ex)
+            raise
 
-                if feature_count == 0:
-                    if Config.VERBOSE:
-                        logging.info("Skipping because no features found")
-                    continue
+    def store_learning_curve(self, label: str, result):
+        """
+        Stores the result of calculate_learning_curve
+        """
+        if result is None:
+            return
 
-                # Create new dataframe
-                simple_df = pd.DataFrame()
-                simple_df[label] = df[label]
-                for feature in features:
-                    simple_df[feature] = df[feature]
+        self.learning_curves[label] = result
 
-                # Check if there is more than just one column
-                if len(simple_df.columns) <= 1:
-                    if Config.VERBOSE:
-                        logging.info("Skipping because df has only one column")
-                    threshold = self.__lower_threshold(threshold)
-                    continue
+    def create_simple_data_set(self, label: str, test_score_threshold):
+        """
+        Creates simple data sets based on the feature importances.
+        Each simple data set contains the most important features, whose importance exceeds one of the thresholds.
+        Every distinct set of features is evaluated once, from the fewest to the most features.
+        The sweep stops early, if the test score does not improve anymore.
+        """
+        try:
+            df = self.preprocessed_df
+            profile = self.get_column_profile()
+            folds = self.get_folds() if Config.CROSS_VALIDATION else None
+            feature_importances = self.feature_importances[label]
+            raw_columns, raw_rows, raw_features = self.get_raw_df_statistics()
 
-                # Train model
-                model, train_score, test_score, over_fitting, X, y_test, y_test_hat = Predictions.predict(label,
-                                                                                                          simple_df)
+            if feature_importances.empty:
+                return
 
-                if model is None:
-                    threshold = self.__lower_threshold(threshold)
-                    continue
+            # The features ordered by their importance, without the label
+            importances = feature_importances['Gini-importance'].drop(label, errors='ignore')
+            importances = importances.sort_values(ascending=False, kind='mergesort')
 
-                # Store the simple df evaluation in a dataframe and in a list
-                self.simple_dfs_evaluation[label] = self.simple_dfs_evaluation[label].append(
-                    {'File Name': self.name, "Test Score": test_score,
-                     "Train Score": train_score, "Potential Over Fitting": over_fitting,
-                     "Initial Row Count": len(self.raw_df.index),
-                     "Initial Feature Count": len(self.raw_df.columns) - 1, "Processed Row Count": len(X),
-                     "Processed Feature Count": X.shape[1], "Features": [feature for feature in features]},
-                    ignore_index=True)
+            # Features exceeding a threshold are always the first features of the ranking
+            feature_counts = sorted({int(importances.gt(threshold).sum()) for threshold in self.__get_thresholds()})
+            feature_counts = [feature_count for feature_count in feature_counts if feature_count > 0]
 
-                # Store the simple df in a list
-                simple_df[label] = df[label]
-                simple_dfs.append(simple_df)
+            if len(feature_counts) == 0:
+                if Config.VERBOSE:
+                    logging.info("Skipping because no features found")
+                return
 
-                threshold = self.__lower_threshold(threshold)
-                previous_feature_count = feature_count
+            label_position = df.columns.get_loc(label)
+            feature_positions = [df.columns.get_loc(feature) for feature in importances.index]
+
+            def evaluate_features(feature_count: int):
+                # One slice of the preprocessed data set, instead of adding column by column
+                simple_df = df.iloc[:, feature_positions[:feature_count] + [label_position]]
+                prediction = Predictions.predict(label, simple_df, profile)
+                if prediction[0] is None:
+                    return prediction, dict()
+
+                return prediction, self.__cross_validate(label, simple_df, profile, folds)
+
+            best_test_score = None
+            not_improved_count = 0
+            workers = min(Config.FEATURE_WORKERS, len(feature_counts))
+
+            # The feature sets are evaluated in batches, so the sweep can stop after each batch.
+            # The results are processed in order, so the outcome does not depend on the amount of workers.
+            for batch_start in range(0, len(feature_counts), workers):
+                batch = feature_counts[batch_start:batch_start + workers]
+
+                results = Core_Budget.run_parallel(evaluate_features, batch, workers)
+                for feature_count, (prediction, cross_validation) in zip(batch, results):
+                    model, train_score, test_score, over_fitting, X, y_test, y_test_hat = prediction
+
+                    if model is None:
+                        continue
+
+                    features = list(importances.index[:feature_count])
+                    # Store the simple df evaluation in a dataframe and the columns of the simple df in a list
+                    self.simple_dfs_evaluation[label] = self.simple_dfs_evaluation[label].append(
+                        {'File Name': self.name, "Engine": Model_Engines.get_engine(model),
+                         "Test Score": test_score, "Train Score": train_score, "Potential Over Fitting": over_fitting,
+                         "Initial Row Count": raw_rows, "Initial Feature Count": raw_features,
+                         "Processed Row Count": len(X),
+                         "Processed Feature Count": X.shape[1], "Features": features, **cross_validation},
+                        ignore_index=True)
+                    # The label is the last column
+                    self.simple_df_columns[label].append(features + [label])
+
+                    if best_test_score is None or test_score - best_test_score >= Config.SIMPLE_DF_MIN_IMPROVEMENT:
+                        best_test_score = test_score
+                        not_improved_count = 0
+                    else:
+                        not_improved_count += 1
+
+                    if 0 < Config.SIMPLE_DF_PATIENCE <= not_improved_count:
+                        break
+
+                if 0 < Config.SIMPLE_DF_PATIENCE <= not_improved_count:
+                    if Config.VERBOSE:
+                        logging.info(f"Test score of the simple data sets of file {self.name} does not improve. "
+                                     f"Stopping with {len(self.simple_df_columns[label])} simple data sets.")
+                    break
 
-            self.simple_dfs[label] = simple_dfs
             self.simple_dfs_evaluation[label].sort_values(by='Test Score', ascending=False, inplace=True)
 
         except BaseException as ex:
@@ -427,6 +856,10 @@ class File:
 
             data.to_csv(Path.joinpath(self.folder, f"{label}_evaluation_report.csv"), index=False)
 
+        # Report for the profile of the preprocessed columns
+        if self.column_profile is not None:
+            self.column_profile.to_csv(Path.joinpath(self.folder, "column_profile.csv"), index_label='Column')
+
         # Report for y and y_hat
         for label, data in self.predicted_results.items():
             if data.empty:
@@ -448,20 +881,13 @@ class File:
             data.to_csv(Path.joinpath(self.folder, f"{label}_combined_evaluation_report.csv"), index=False)
 
         # Report the dataframes for simple df
-        for label, data in self.simple_dfs.items():
-            if data is None:
-                continue
-
+        for label, data in self.simple_df_columns.items():
             if self.simple_df_folder is None:
                 continue
 
-            counter = 0
-            for simple_df in data:
-                if simple_df.empty:
-                    continue
-
-                simple_df.to_csv(Path.joinpath(self.simple_df_folder, f"{label}_simple_df_{counter}.csv"))
-                counter += 1
+            for counter, columns in enumerate(data):
+                self.preprocessed_df[columns].to_csv(
+                    Path.joinpath(self.simple_df_folder, f"{label}_simple_df_{counter}.csv"))
 
         # Report the evaluations for simple df
         for label, data in self.simple_dfs_evaluation.items():
@@ -473,6 +899,13 @@ class File:
 
             data.to_csv(Path.joinpath(self.simple_df_folder, f"{label}_simple_df_evaluation.csv"))
 
+        # Report the learning curves
+        for label, data in self.learning_curves.items():
+            if data.empty or self.learning_curve_folder is None:
+                continue
+
+            data.to_csv(Path.joinpath(self.learning_curve_folder, f"{label}_learning_curve.csv"), index=False)
+
     def __create_combined_evaluation_data_set(self) -> dict:
         """
         Creates a data set containing the full evaluation and the splits
@@ -520,7 +953,7 @@ class File:
     # Plots
     def generate_plots(self):
         """
-        Helper to call all plotting functions
+        Helper to call all plotting functions. The plots are written as specs and rendered after the evaluation.
         :return:
         """
         self.__plot_predicted_values(True)
@@ -530,6 +963,7 @@ class File:
         self.__plot_pca_analysis()
         self.__plot_pca_analysis_scatter()
         self.__plot_simple_df_test_scores()
+        self.__plot_learning_curve()
 
     def __plot_simple_df_test_scores(self):
         """
@@ -539,20 +973,34 @@ class File:
         try:
             for label, data in self.simple_dfs_evaluation.items():
 
-                if data.empty:
+                if data.empty or self.simple_df_folder is None:
                     continue
-                data = data.copy()
-                data = data.append(
-                    {'Test Score': self.evaluation_results[label]['Test Score'].values[0], 'Features': "",
+                data = data[['Processed Feature Count', 'Test Score']].append(
+                    {'Test Score': self.evaluation_results[label]['Test Score'].values[0],
                      'Processed Feature Count': self.evaluation_results[label]['Processed Feature Count'].values[0]},
                     ignore_index=True)
-                ax = sns.barplot(x="Processed Feature Count", y="Test Score", data=data)
-                ax.set(xlabel='Features', ylabel='Test Score')
-                ax.set_xticklabels(ax.get_xticklabels(), rotation=45, horizontalalignment='right')
-                fig = ax.get_figure()
-                fig.savefig(os.path.join(self.simple_df_folder, f"{label}_test_scores.png"), bbox_inches='tight')
-                fig.clf()
-                plt.close('all')
+                data['Processed Feature Count'] = data['Processed Feature Count'].astype(int)
+                Plot_Specs.save_spec(Path(self.simple_df_folder, f"{label}_test_scores.png"), Plot_Specs.BAR_PLOT, data,
+                                     x="Processed Feature Count", y="Test Score", xlabel='Features',
+                                     ylabel='Test Score', rotation=45, horizontal_alignment='right',
+                                     bbox_inches='tight')
+
+        except BaseException as ex:
+            logging.exception(ex)
+
+    def __plot_learning_curve(self):
+        """
+        Plots the train and test score for each step of the learning curve
+        """
+        try:
+            for label, data in self.learning_curves.items():
+                if data.empty or self.learning_curve_folder is None:
+                    continue
+
+                Plot_Specs.save_spec(Path(self.learning_curve_folder, f"{label}_learning_curve.png"),
+                                     Plot_Specs.LINE_PLOT, data[['Training Rows', 'Train Score', 'Test Score']],
+                                     x='Training Rows', lines=['Train Score', 'Test Score'], xlabel='Training Rows',
+                                     ylabel='Score', bbox_inches='tight')
 
         except BaseException as ex:
             logging.exception(ex)
@@ -567,23 +1015,20 @@ class File:
                 if data.empty:
                     continue
 
-                ax = sns.scatterplot(x='y', y='y_hat', label=label, data=data)
-
                 if log_scale:
-                    ax.set(xscale="log", yscale="log")
+                    output = Path(self.folder, f"{label}_predicated_log_values.png")
+                else:
+                    output = Path(self.folder, f"{label}_predicated_values.png")
 
-                if ax is None:
-                    logging.warning("Could not plot predicted values, because axis where None")
-                    return
+                if 0 < Config.PLOT_POINT_LIMIT < len(data):
+                    # Too many points to draw each of them, so the points in each cell of a grid are counted instead
+                    Plot_Specs.save_spec(output, Plot_Specs.HISTOGRAM_2D,
+                                         Plot_Data.get_histogram_2d(data['y'], data['y_hat'], log_scale), label=label,
+                                         xlabel='y', ylabel='y_hat')
+                    continue
 
-                ax.legend()
-                fig = ax.get_figure()
-                if log_scale:
-                    fig.savefig(os.path.join(self.folder, f"{label}_predicated_log_values.png"))
-                else:
-                    fig.savefig(os.path.join(self.folder, f"{label}_predicated_values.png"))
-                fig.clf()
-                plt.close('all')
+                Plot_Specs.save_spec(output, Plot_Specs.SCATTER_PLOT, data[['y', 'y_hat']], x='y', y='y_hat',
+                                     label=label, log_scale=log_scale)
         except BaseException as ex:
             logging.exception(ex)
 
@@ -602,14 +1047,9 @@ class File:
             if feature_importance.empty:
                 continue
 
-            ax = sns.barplot(data=feature_importance)
-            ax.set(xlabel='Feature', ylabel='Gini Index')
-            ax.set_xticklabels(ax.get_xticklabels(), rotation=45, horizontalalignment='right')
-            ax.legend()
-            fig = ax.get_figure()
-            fig.savefig(os.path.join(self.folder, f"{label}_feature_importance.png"), bbox_inches='tight')
-            fig.clf()
-            plt.close('all')
+            Plot_Specs.save_spec(Path(self.folder, f"{label}_feature_importance.png"), Plot_Specs.BAR_PLOT,
+                                 feature_importance, xlabel='Feature', ylabel='Gini Index', rotation=45,
+                                 horizontal_alignment='right', legend=True, bbox_inches='tight')
 
     def __plot_feature_to_label_correlation(self):
         """
@@ -629,18 +1069,12 @@ class File:
 
             important_features.append(label)
 
+            # Only the correlation matrix is stored in the spec, instead of the data set
             data = self.preprocessed_df[important_features]
             corr = data.corr()
 
-            mask = np.triu(np.ones_like(corr, dtype=np.bool))
-            f, ax = plt.subplots(figsize=(11, 9))
-            cmap = sns.diverging_palette(220, 10, as_cmap=True)
-            sns.heatmap(corr, mask=mask, cmap=cmap, vmax=.3, center=0,
-                        square=True, linewidths=.5, cbar_kws={"shrink": .5})
-
-            fig = ax.get_figure()
-            fig.savefig(os.path.join(self.folder, f"{label}_correlation_matrix.png"), bbox_inches='tight')
-            fig.clf()
+            Plot_Specs.save_spec(Path(self.folder, f"{label}_correlation_matrix.png"), Plot_Specs.HEATMAP, corr,
+                                 bbox_inches='tight')
 
     def __plot_pca_analysis(self):
         """
@@ -651,16 +1085,9 @@ class File:
                 if data is None:
                     continue
 
-                features = range(data.n_components_)
-                plt.bar(features, data.explained_variance_ratio_, color='black')
-                plt.xlabel('PCA features')
-                plt.ylabel('variance %')
-                plt.xticks(features)
-                plt.xticks(rotation=90, fontsize=8)
-                plt.tight_layout()
-                plt.savefig(Path.joinpath(self.folder, f"{label}_pca_features.png"), bbox_inches='tight')
-                plt.clf()
-                plt.close('all')
+                Plot_Specs.save_spec(Path(self.folder, f"{label}_pca_features.png"), Plot_Specs.VARIANCE_PLOT,
+                                     data.explained_variance_ratio_, xlabel='PCA features', ylabel='variance %',
+                                     bbox_inches='tight')
 
         except BaseException as ex:
             logging.exception(ex)
@@ -676,33 +1103,87 @@ class File:
                 if data.empty:
                     continue
 
-                temp_data = data.copy()
-                temp_data[label] = np.log(temp_data[label])
-
-                ax = sns.scatterplot(x=data[0], y=data[1],
-                                     hue=label,
-                                     data=temp_data)
-                ax.set(xlabel='Component 1', ylabel='Component 2')
-                ax.legend()
-                fig = ax.get_figure()
-                fig.savefig(Path(self.folder, f"{label}_pca_cluster.png"), bbox_inches='tight')
-                fig.clf()
-                plt.close('all')
+                # Only the first two components are plotted
+                temp_data = pd.DataFrame({'Component 1': data[0], 'Component 2': data[1],
+                                          label: np.log(data[label])})
+
+                # The colors of the sampled points are distributed like the colors of all points
+                if Config.PLOT_POINT_LIMIT > 0:
+                    temp_data = Plot_Data.sample_stratified(temp_data, label, Config.PLOT_POINT_LIMIT)
+
+                Plot_Specs.save_spec(Path(self.folder, f"{label}_pca_cluster.png"), Plot_Specs.SCATTER_PLOT,
+                                     temp_data, x='Component 1', y='Component 2', hue=label, bbox_inches='tight')
         except BaseException as ex:
             logging.exception(ex)
 
-    def __calculate_feature_importance(self, label: str, model, df):
+    @staticmethod
+    def __calculate_feature_importance(model, columns):
         """
         Calculates the feature importance for the given model
         """
         feats = {}  # a dict to hold feature_name: feature_importance
-        for feature, importance in zip(df.columns, model.feature_importances_):
+        for feature, importance in zip(columns, Model_Engines.get_feature_importances(model)):
             feats[feature] = importance  # add the name/value pair
 
         importance = pd.DataFrame.from_dict(feats, orient='index').rename(columns={0: 'Gini-importance'})
         importance.sort_values(by='Gini-importance', inplace=True, ascending=False)
 
-        self.feature_importances[label] = importance
+        return importance
+
+    def __spill_preprocessed_df(self):
+        """
+        Writes the preprocessed data set once to disk and replaces it with a memory mapped view.
+        The OS keeps only the accessed parts in memory, instead of the whole data set.
+        """
+        # Streamed data sets are already spilled, while they are preprocessed
+        if self.spilled_matrix is not None:
+            return
+
+        self.spilled_matrix = Memory_Map.spill(self.preprocessed_df)
+        if self.spilled_matrix is not None:
+            self.preprocessed_df = Memory_Map.load(self.spilled_matrix)
+
+    # Parallel processing
+    def share_preprocessed_df(self):
+        """
+        Publishes the preprocessed data set to shared memory.
+        While published, worker processes attach to the shared values instead of receiving a pickled copy.
+        """
+        # Worker processes receive the profile and folds, instead of creating them again
+        self.get_column_profile()
+        if Config.CROSS_VALIDATION:
+            self.get_folds()
+        self.shared_block, self.shared_matrix = Shared_Memory.publish(self.preprocessed_df)
+
+    def release_shared_preprocessed_df(self):
+        """
+        Removes the preprocessed data set from shared memory
+        """
+        Shared_Memory.release(self.shared_block)
+        self.shared_block = None
+        self.shared_matrix = None
+
+    def __getstate__(self):
+        """
+        If the preprocessed data set is shared, only the values required by the calculate_* methods are pickled
+        """
+        if self.shared_matrix is None:
+            return self.__dict__
+
+        return {'name': self.name, 'full_name': self.full_name, 'merged_file': self.merged_file,
+                'detected_labels': self.detected_labels, 'verified': self.verified,
+                'column_profile': self.column_profile, 'folds': self.folds, 'shared_matrix': self.shared_matrix,
+                'shared_block': None}
+
+    def __setstate__(self, state):
+        """
+        Attaches to the shared preprocessed data set, if the file was pickled while it was shared
+        """
+        self.__dict__.update(state)
+
+        if self.shared_matrix is not None:
+            self.raw_df = None
+            self.preprocessed_df = Shared_Memory.attach(self.shared_matrix)
 
     # Cleanup
     def free_memory(self):
@@ -715,6 +1196,23 @@ class File:
 
         self.raw_df = None
         self.preprocessed_df = None
+        Memory_Map.remove(self.spilled_matrix)
+        self.spilled_matrix = None
+        self.models.clear()
+        self.model_features.clear()
+
+    @staticmethod
+    def __get_thresholds() -> list:
+        """
+        Returns the importance thresholds of the simple data sets, from 0.5 to 0.01
+        """
+        thresholds = []
+        threshold: float = 0.5
+        while threshold > 0.00:
+            thresholds.append(threshold)
+            threshold = File.__lower_threshold(threshold)
+
+        return thresholds
 
     @staticmethod
     def __lower_threshold(threshold: float) -> float:
@@ -1,15 +1,19 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from Entities.File import File
 from RuntimeContants import Runtime_Folders
 from Services.FileSystem import Folder_Management
+from Services.Parallel import Task_Executor
+from Services.Plotting import Plot_Specs
+from Services.Predictions import Learning_Curve, Model_Export
+from Services.Processing import Category_Encoding
+from Services.Statistics import Results_Store
 from Services.Configuration.Config import Config
 from pathlib import Path
 import logging
-from time import sleep
+from Services.Logging import Console
 import os
-import seaborn as sns
 import shutil
-import matplotlib.pyplot as plt
 
 
 class Tool:
@@ -20,11 +24,18 @@ class Tool:
         self.evaluation_dir = Runtime_Folders.EVALUATION_DIRECTORY
         # the tool folder
         self.folder = Folder_Management.create_tool_folder(self.name)
+        # Paths of all files of the tool. The files are loaded once the tool is evaluated.
+        self.file_paths = []
         self.all_files = []
         # All files not eligible to be checked
         self.excluded_files = []
         # All files eligible to be evaluated
         self.verified_files = []
+        # Categorical encoders shared by all files of the tool. Persisted, so codes are stable across runs.
+        self.encoders = Category_Encoding.load_encoders(self.name)
+
+        # Errors occurred while evaluating the tool, collected for the error report
+        self.errors = []
 
         # Evaluation results overview for all evaluated labels
         self.files_label_overview = dict()
@@ -46,12 +57,26 @@ class Tool:
 
     def add_file(self, file_path: str):
         """
-        Adds a new file entity to the tool
+        Adds a new file to the tool. The file entity is created, once the files of the tool are loaded.
         :param file_path:
         :return:
         """
-        file: File = File(file_path, self.folder)
-        self.all_files.append(file)
+        self.file_paths.append(file_path)
+
+    def load_files(self):
+        """
+        Creates the file entities of all files of the tool and verifies the tool
+        :return:
+        """
+        logging.info(f"Loading files of tool {self.name}...")
+        # Sources are read in parallel. Files are created in order, so categories are always encoded the same way.
+        with ThreadPoolExecutor(max_workers=Config.LOAD_WORKERS) as executor:
+            sources = executor.map(File.read_source, self.file_paths)
+            for file_path, source in zip(self.file_paths, sources):
+                file: File = File(file_path, self.folder, encoders=self.encoders, source=source)
+                self.all_files.append(file)
+
+        self.verify()
 
     def verify(self):
         """
@@ -95,7 +120,7 @@ class Tool:
         for file in self.verified_files:
             file.free_memory()
 
-        sleep(1)
+        Console.pause(1)
 
     def evaluate(self):
         """
@@ -112,21 +137,19 @@ class Tool:
         # Evaluate the files
         for file in self.verified_files:
             logging.info(f"Evaluating file {file.name}...")
-            # Iterate through all label that are present in the df
 
             if len(file.detected_labels) == 0:
                 logging.warn(f"No labels detected for file {file.name}")
 
-            for label in file.detected_labels:
-                file.predict(label)
-                file.predict_partial(label)
-                file.pca_analysis(label)
+        # Each label of each file is evaluated as independent task
+        Task_Executor.evaluate_files(self.verified_files)
 
+        for file in self.verified_files:
             # Copy the source file to the results folder
             # If its a merged file use the virtual one.
             if not file.merged_file:
                 shutil.copy(file.path, file.folder)
-            else:
+            elif file.raw_df is not None:
                 file.raw_df.to_csv(Path.joinpath(file.folder, "raw_df.csv"), index=False)
 
             file.evaluated = True
@@ -146,16 +169,15 @@ class Tool:
         """
         Evaluate all data sets and files which are create after the first evaluation
         """
-        for file in self.verified_files:
-            if file.evaluated:
-                continue
+        files = [file for file in self.verified_files if not file.evaluated]
 
+        for file in files:
             logging.info(f"Evaluating file {file.name}...")
-            for label in file.detected_labels:
-                # Predict values for single files
-                file.predict(label)
-                file.predict_partial(label)
-                file.pca_analysis(label)
+
+        Task_Executor.evaluate_files(files)
+
+        for file in files:
+            if len(file.detected_labels) != 0:
                 file.evaluated = True
 
     def create_simple_data_frames(self):
@@ -176,20 +198,19 @@ class Tool:
         """
 
         for label in self.files_label_overview:
-            best_versions_df = []
+            best_version_files = []
 
             best_performing = self.files_label_overview[label][self.files_label_overview[label]['Test Score'] > 0.6][
                 'File Name'].tolist()
 
             for file in self.verified_files:
                 if file.name in best_performing and not file.merged_file:
-                    best_versions_df.append(file.raw_df)
+                    best_version_files.append(file)
 
-            if len(best_versions_df) <= 1:
+            if len(best_version_files) <= 1:
                 return
 
-            best_version_files_raw_df = pd.concat(best_versions_df, join='inner')
-            best_version_merged_file = File(f"{label}_best_version_merged_file", self.folder, best_version_files_raw_df)
+            best_version_merged_file = self.__merge_files(f"{label}_best_version_merged_file", best_version_files)
             self.verified_files.append(best_version_merged_file)
 
     def __prepare_most_important_feature_data_set(self):
@@ -208,24 +229,80 @@ class Tool:
         """
         logging.info("Generating report files...")
 
+        # The records of all files are stored in the results database. The csv reports are optional exports.
+        Results_Store.store_tool(self)
+
         # Generate file specific reports
-        for file in self.verified_files:
-            file.generate_reports()
+        if Config.CSV_REPORTS:
+            for file in self.verified_files:
+                file.generate_reports()
 
         for label in self.files_label_overview:
             if self.files_label_overview[label].empty:
                 continue
 
             self.files_label_overview[label].sort_values(by='Test Score', ascending=False, inplace=True)
-            self.files_label_overview[label].to_csv(os.path.join(self.folder, f"{label}_overview_files_report.csv"),
-                                                    index=False)
+            if Config.CSV_REPORTS:
+                self.files_label_overview[label].to_csv(
+                    os.path.join(self.folder, f"{label}_overview_files_report.csv"), index=False)
+
+        if Config.CSV_REPORTS:
+            self.__generate_learning_curve_overview()
 
         logging.info("All reports generated.")
-        sleep(1)
+        Console.pause(1)
+
+    def __generate_learning_curve_overview(self):
+        """
+        Reports the rows each file needed, until its learning curve stopped improving
+        :return:
+        """
+        overview = dict()
+        for file in self.verified_files:
+            for label, curve in file.learning_curves.items():
+                if curve.empty:
+                    continue
+
+                overview.setdefault(label, []).append(
+                    {'File Name': file.name, **Learning_Curve.get_required_rows(curve)})
+
+        for label, rows in overview.items():
+            pd.DataFrame(rows).to_csv(os.path.join(self.folder, f"{label}_learning_curve_overview.csv"), index=False)
+
+    def export_models(self):
+        """
+        Exports the model of the best performing version for each label
+        :return:
+        """
+        folder = Folder_Management.create_folder(Path(self.evaluation_dir, "Models"))
+        if folder is None:
+            return
+
+        for label in self.files_label_overview:
+            best_version = self.get_best_performing_version(label)
+
+            if best_version is None:
+                continue
+
+            for file in self.verified_files:
+                if file.name != best_version['File Name'] or file.models.get(label) is None:
+                    continue
+
+                if Model_Export.export_model(folder, self.name, file, label, best_version) is not None \
+                        and Config.VERBOSE:
+                    logging.info(f"Exported model of file {file.name} for label {label}")
+                break
+
+    def save_encoders(self):
+        """
+        Persists the categorical encoders of the tool and stores a copy in the tool folder
+        :return:
+        """
+        Category_Encoding.save_encoders(self.name, self.encoders, self.folder)
 
     def generate_plots(self):
         """
-        Generates all plots
+        Generates all plots. The plots are written as specs and rendered after the evaluation.
         :return:
         """
 
@@ -257,14 +334,30 @@ class Tool:
         Assuming that all single files are valid this merged on should be valid too.
         :return:
         """
-        raw_df = []
-        for file in self.verified_files:
-            raw_df.append(file.raw_df)
-
-        merged_files_raw_df = pd.concat(raw_df, join='inner')
-        merged_file = File("merged_tool", self.folder, merged_files_raw_df)
+        merged_file = self.__merge_files("merged_tool", self.verified_files)
         self.verified_files.append(merged_file)
 
+    def __merge_files(self, name: str, files: list):
+        """
+        Creates a file containing the data sets of all given files.
+        If the raw data sets are not kept in memory, the preprocessed data sets are merged instead.
+        :param name:
+        :param files:
+        :return:
+        """
+        if any(file.raw_df is None for file in files):
+            preprocessing_state = dict()
+            for file in files:
+                for key, values in file.preprocessing_state.items():
+                    preprocessing_state.setdefault(key, dict()).update(values)
+
+            preprocessed_df = pd.concat([file.preprocessed_df for file in files], join='inner')
+            return File(name, self.folder, encoders=self.encoders, preprocessed_df=preprocessed_df,
+                        preprocessing_state=preprocessing_state)
+
+        raw_df = pd.concat([file.raw_df for file in files], join='inner')
+        return File(name, self.folder, raw_df, self.encoders)
+
     # TODO: Return the file instead of the data row
     def get_best_performing_version(self, label: str):
         """
@@ -314,13 +407,6 @@ class Tool:
             if data.empty:
                 continue
 
-            
-
-            ax = sns.barplot(x="File Name", y="Test Score", data=data,
-                             palette="Set3")
-            ax.set_xticklabels(ax.get_xticklabels(), rotation=90)
-            fig = ax.get_figure()
-
-            fig.savefig(Path.joinpath(self.folder, f"{label}_prediction_overview.jpg"), bbox_inches="tight")
-            fig.clf()
-            plt.close('all')
+            Plot_Specs.save_spec(Path.joinpath(self.folder, f"{label}_prediction_overview.jpg"), Plot_Specs.BAR_PLOT,
+                                 data[['File Name', 'Test Score']], x="File Name", y="Test Score", palette="Set3",
+                                 rotation=90, bbox_inches="tight")
@@ -0,0 +1,33 @@
+import argparse
+import logging
+import sys
+import time
+from Services.Plotting import Plot_Renderer
+from Services.Statistics import Runtime_Statistics
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+
+
+def handle_args():
+    """
+    Parse the given arguments
+    :return:
+    """
+    parser = argparse.ArgumentParser(description='Renders the plot specs written by the evaluation.',
+                                     epilog='Accepts a run, its PlotSpecs folder, a sub folder or a single spec')
+    parser.add_argument('-s', '--specs', dest='specs', nargs='+', required=True,
+                        help="One or more runs, folders or specs. E.g. Data/Results/<run>")
+    parser.add_argument('-w', '--workers', dest='workers', type=int, default=1, required=False,
+                        help="The amount of processes rendering the plots in parallel.")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = handle_args()
+    start_time = time.time()
+
+    rendered = 0
+    for path in args.specs:
+        rendered += Plot_Renderer.render_plots(path, args.workers)
+
+    logging.info(f"Rendered {rendered} plots in {Runtime_Statistics.get_duration(start_time)} seconds")
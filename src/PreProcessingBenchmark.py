@@ -0,0 +1,162 @@
+import argparse
+import logging
+import sys
+import time
+import numpy as np
+import pandas as pd
+from sklearn import preprocessing
+from Services.Processing import PreProcessing
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+
+
+# Compares pre_process_data_set with the implementation it replaced. The replaced implementation converted booleans
+# cell by cell, filled and encoded each column separately and transposed the data set to remove rows only containing 0.
+# Both have to return the same data set, record the same state and change the given data set the same way.
+
+def handle_args():
+    """
+    Parse the given arguments
+    :return:
+    """
+    parser = argparse.ArgumentParser(description='Benchmarks the preprocessing against the replaced implementation.',
+                                     epilog='Exits with 1, if the implementations return different results')
+    parser.add_argument('-f', '--files', dest='files', nargs='+', required=True,
+                        help="One or more csv files. E.g. ExampleData/bwa_mem_0.7.15.1_example.csv")
+    parser.add_argument('-r', '--rows', dest='rows', type=int, default=0, required=False,
+                        help="Repeats the rows of each file until it contains this amount of rows. "
+                             "Defaults to 0, which keeps the files as they are.")
+    parser.add_argument('-re', '--repetitions', dest='repetitions', type=int, default=3, required=False,
+                        help="The amount of times each implementation is timed. The fastest time is reported.")
+    return parser.parse_args()
+
+
+def replaced_pre_process_data_set(df, state: dict = None):
+    """
+    The implementation of pre_process_data_set replaced by the vectorized one
+    :param df:
+    :param state:
+    :return:
+    """
+    df.replace([np.inf, -np.inf], np.nan)
+    df[df == np.inf] = np.nan
+    df = PreProcessing.remove_bad_columns(df)
+    df = __replaced_fill_na(df, state)
+    df = __replaced_convert_factorial_to_numerical(df, state)
+
+    # Remove columns only containing 0
+    df = df[(df.T != 0).any()]
+    return df
+
+
+def __replaced_convert_factorial_to_numerical(df, state: dict = None):
+    columns = df.select_dtypes(exclude=['int', 'float']).columns
+    le = preprocessing.LabelEncoder()
+    for column in columns:
+        le.fit(df[column])
+        df[column] = le.transform(df[column])
+
+        if state is not None:
+            state.setdefault('encoders', dict())[column] = list(le.classes_)
+
+    return df
+
+
+def __replaced_fill_na(df, state: dict = None):
+    numeric_columns = df.select_dtypes(exclude=['object']).columns
+    categorical_columns = df.select_dtypes(exclude=['int', 'float']).columns
+
+    mask = df.applymap(type) != bool
+    d = {True: 'True', False: 'False'}
+    df = df.where(mask, df.replace(d))
+
+    fill_values = dict()
+    for column in numeric_columns:
+        df[column].fillna(0, inplace=True)
+        fill_values[column] = 0
+
+    for column in categorical_columns:
+        if True in df[column]:
+            fill_values[column] = 'True'
+
+        elif False in df[column]:
+            fill_values[column] = 'False'
+
+        else:
+            fill_values[column] = '0'
+
+        df[column].fillna(fill_values[column], inplace=True)
+
+    if state is not None:
+        state['fill_values'] = fill_values
+
+    return df
+
+
+def benchmark(function, raw_df, repetitions: int):
+    """
+    Runs the function on copies of the raw data set.
+    Returns the fastest time, the result, the recorded state and the raw data set, as changed by the function.
+    :param function:
+    :param raw_df:
+    :param repetitions:
+    :return:
+    """
+    fastest = None
+    for _ in range(max(repetitions, 1)):
+        df = raw_df.copy()
+        state = dict()
+        start_time = time.perf_counter()
+        result = function(df, state)
+        duration = time.perf_counter() - start_time
+        fastest = duration if fastest is None else min(fastest, duration)
+
+    return fastest, result, state, df
+
+
+def get_differences(replaced: tuple, current: tuple) -> list:
+    """
+    Returns the differences between the results of both implementations
+    :param replaced:
+    :param current:
+    :return:
+    """
+    differences = []
+    for name, expected, actual in [('data set', replaced[1], current[1]), ('raw data set', replaced[3], current[3])]:
+        try:
+            pd.testing.assert_frame_equal(expected, actual)
+        except AssertionError as ex:
+            differences.append(f"{name}: {ex}")
+
+    if replaced[2] != current[2]:
+        differences.append("The recorded state differs")
+
+    return differences
+
+
+if __name__ == '__main__':
+    args = handle_args()
+
+    equal = True
+    for path in args.files:
+        raw_df = pd.read_csv(path)
+        if args.rows > 0:
+            raw_df = raw_df.iloc[np.arange(args.rows) % len(raw_df)].reset_index(drop=True)
+
+        replaced = benchmark(replaced_pre_process_data_set, raw_df, args.repetitions)
+        current = benchmark(PreProcessing.pre_process_data_set, raw_df, args.repetitions)
+
+        logging.info(f"{path}: {len(raw_df)} rows, {len(raw_df.columns)} columns. "
+                     f"Replaced: {replaced[0]:.3f} seconds, current: {current[0]:.3f} seconds, "
+                     f"speedup: {replaced[0] / current[0]:.1f}x")
+
+        differences = get_differences(replaced, current)
+        for difference in differences:
+            logging.error(f"{path}: {difference}")
+        equal = equal and len(differences) == 0
+
+    if not equal:
+        logging.error("The implementations return different results")
+        sys.exit(1)
+
+    logging.info("Both implementations return the same results")
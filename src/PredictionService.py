@@ -0,0 +1,44 @@
+import argparse
+import asyncio
+import logging
+import sys
+from Services.Inference.Prediction_Server import PredictionServer
+from Services.Predictions import Model_Export
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+
+
+def handle_args():
+    """
+    Parse the given arguments
+    :return:
+    """
+    parser = argparse.ArgumentParser(description='Serves runtime and memory predictions of exported tool models.')
+    parser.add_argument('-mo', '--models', dest='models', required=True,
+                        help="The folder containing the exported models. E.g. Data/Results/<run>/Models")
+    parser.add_argument('--host', dest='host', default='127.0.0.1', required=False,
+                        help="The address the service listens on.")
+    parser.add_argument('-p', '--port', dest='port', type=int, default=8080, required=False,
+                        help="The port the service listens on.")
+    parser.add_argument('-bs', '--batch-size', dest='batch_size', type=int, default=512, required=False,
+                        help="The maximum amount of jobs predicted together.")
+    parser.add_argument('-bd', '--batch-delay', dest='batch_delay', type=float, default=1, required=False,
+                        help="The maximum time in milliseconds a request waits for other requests to join its batch.")
+    parser.add_argument('-cm', '--compiled', dest='compiled', action='store_true', required=False,
+                        help="Uses the compiled forests, which only require numpy, instead of the scikit-learn models.")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = handle_args()
+
+    models = Model_Export.load_models(args.models, args.compiled)
+    if len(models) == 0:
+        logging.error(f"No models found in {args.models}")
+        sys.exit(1)
+
+    server = PredictionServer(models, max(args.batch_size, 1), max(args.batch_delay, 0) / 1000)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        logging.info("Bye")
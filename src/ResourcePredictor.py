@@ -3,8 +3,11 @@ import sys
 from Services.Configuration import Config, Argument_Parser
 from Services.FileSystem import Folder_Management
 from Services.ToolLoader import Tool_Loader
+from Services.Parallel import Tool_Executor, Core_Budget
 from RuntimeContants import Runtime_Datasets
-from Services.Statistics import Runtime_Statistics, Tool_Statistics
+from Services.Statistics import Results_Store, Runtime_Statistics, Tool_Statistics
+from Services.Logging import Error_Report
+from Services.Plotting import Plot_Specs
 import logging
 import time
 import os
@@ -37,6 +40,7 @@ if __name__ == '__main__':
     Runtime_Statistics.application_start_time = time.time()
     Config.read_conf()
     Argument_Parser.handle_args()
+    Core_Budget.limit_native_threads()
 
     if Folder_Management.create_required_folders():
         logging.info("All required folders generated.")
@@ -46,33 +50,28 @@ if __name__ == '__main__':
         logging.info("All folder checks passed.")
         logging.info("Creating evaluation folder.")
         Folder_Management.create_evaluation_folder()
+        Results_Store.register_run()
 
     Tool_Loader.load_tools()
 
     logging.info("Starting tool evaluation...")
     print()
     # Tool evaluation workflow
-    for tool in Runtime_Datasets.VERIFIED_TOOLS:
-        tool_start_time = time.time()
-        tool.evaluate()
-        tool.generate_overview_data_sets()
-        tool.prepare_additional_files()
-        tool.evaluate_additional_files()
-        tool.create_simple_data_frames()
-        tool.generate_overview_data_sets()
-        tool.generate_reports()
-        tool.generate_plots()
-        tool.free_memory()
-
-        time_passed = Runtime_Statistics.get_duration(tool_start_time)
-        print()
-        if time_passed > 60:
-            logging.info(f"Tool {tool.name} evaluated in {time_passed / 60} minutes")
-        else:
-            logging.info(f"Tool {tool.name} evaluated in {time_passed} seconds")
-        print()
+    Runtime_Datasets.VERIFIED_TOOLS = Tool_Executor.evaluate_tools(Runtime_Datasets.VERIFIED_TOOLS)
+    # Tools are excluded, if none of their files passes the verification once loaded
+    Runtime_Datasets.EXCLUDED_TOOLS.extend([tool for tool in Runtime_Datasets.VERIFIED_TOOLS if not tool.verified])
+    Runtime_Datasets.VERIFIED_TOOLS = [tool for tool in Runtime_Datasets.VERIFIED_TOOLS if tool.verified]
+    Tool_Loader.update_excluded_files_report(Runtime_Datasets.VERIFIED_TOOLS + Runtime_Datasets.EXCLUDED_TOOLS)
 
+    Error_Report.write_report(Runtime_Datasets.VERIFIED_TOOLS + Runtime_Datasets.EXCLUDED_TOOLS)
     Tool_Statistics.generate_tool_statistics()
+
+    if Config.Config.PLOTS and Config.Config.RENDER_PLOTS:
+        # Only imported if plots are rendered, so runs without plots do not import matplotlib
+        from Services.Plotting import Plot_Renderer
+        Plot_Renderer.render_plots(Plot_Specs.get_spec_directory(), Config.Config.PLOT_WORKERS)
+
+    Results_Store.finish_run(Runtime_Datasets.VERIFIED_TOOLS, Runtime_Datasets.EXCLUDED_TOOLS)
     Runtime_Statistics.get_application_stats()
 
     logging.info("Done")
@@ -7,3 +7,5 @@ DETECTED_TOOLS = []
 EXCLUDED_TOOLS = []
 # All verified tools
 VERIFIED_TOOLS = []
+# All files excluded while detecting the tools
+EXCLUDED_FILES = []
@@ -1,7 +1,7 @@
 from RuntimeContants import Runtime_Datasets
 import argparse
 from Services.Configuration.Config import Config
-from time import sleep
+from Services.Logging import Console
 
 
 def handle_args():
@@ -18,13 +18,59 @@ def handle_args():
     parser.add_argument('-mg', '--merge', dest='merge', required=False, action='store_true',
                         help="Merges all available versions of a tool together.")
     parser.add_argument('-r', '--remove', dest='remove', action='store_true', required=False,
-                        help="Activates the removal of data for further evaluation of data sets")
+                        help="Evaluates a learning curve for each data set. "
+                             "Each step trains with 10% more of the rows.")
     parser.add_argument('-m', '--memory', dest='memory', action='store_true', required=False,
                         help="If set, the application will run in memory saving mode."
                              "Should only be used where memory is limited.")
+    parser.add_argument('-s', '--stream', dest='stream', action='store_true', required=False,
+                        help="If set, data sets are read and preprocessed in chunks. "
+                             "Only the preprocessed data sets are kept in memory.")
+    parser.add_argument('-b', '--batch', dest='batch', action='store_true', required=False,
+                        help="If set, the application runs unattended. There are no pauses and no prompts. "
+                             "Errors are collected in an error report instead.")
+    parser.add_argument('-cv', '--cross-validation', dest='cross_validation', action='store_true', required=False,
+                        help="If set, each data set is additionally evaluated using k fold cross validation. "
+                             "The mean and variance of the scores are reported.")
+    parser.add_argument('-e', '--engine', dest='engine',
+                        choices=['random_forest', 'hist_gradient_boosting', 'extra_trees', 'linear'], required=False,
+                        help="The engine of the trained models.")
     parser.add_argument('-d', '--debug', dest='debug', action='store_true', required=False,
                         help="If set, the tool will run in debug mode. You will get developer output. The performance"
                              "is most likely be not as fast as possible!")
+    parser.add_argument('-w', '--workers', dest='workers', type=int, required=False,
+                        help="The amount of worker processes used to evaluate tools in parallel.")
+    parser.add_argument('-tw', '--task-workers', dest='task_workers', type=int, required=False,
+                        help="The amount of workers used to evaluate the files and labels of a tool in parallel.")
+    parser.add_argument('-te', '--task-executor', dest='task_executor', choices=['thread', 'process'],
+                        required=False, help="Whether the task workers are threads or processes.")
+    parser.add_argument('-lw', '--load-workers', dest='load_workers', type=int, required=False,
+                        help="The amount of threads reading files in parallel.")
+    parser.add_argument('-sw', '--split-workers', dest='split_workers', type=int, required=False,
+                        help="The amount of threads training the parts of the split evaluation in parallel.")
+    parser.add_argument('-sp', '--split-parts', dest='split_parts', type=int, required=False,
+                        help="The maximum amount of parts evaluated by the split evaluation. "
+                             "Evenly distributed parts are selected, if a file has more parts. 0 evaluates all parts.")
+    parser.add_argument('-fw', '--feature-workers', dest='feature_workers', type=int, required=False,
+                        help="The amount of threads training the feature subsets of the simple data sets in parallel.")
+    parser.add_argument('-cvw', '--cross-validation-workers', dest='cross_validation_workers', type=int,
+                        required=False,
+                        help="The amount of threads training the folds of the cross validation in parallel.")
+    parser.add_argument('-lcw', '--learning-curve-workers', dest='learning_curve_workers', type=int, required=False,
+                        help="The amount of threads training the steps of the learning curve in parallel.")
+    parser.add_argument('-pw', '--plot-workers', dest='plot_workers', type=int, required=False,
+                        help="The amount of processes rendering the plots in parallel.")
+    parser.add_argument('-ncr', '--no-csv-reports', dest='no_csv_reports', action='store_true', required=False,
+                        help="Only stores the records in the results database instead of writing csv reports.")
+    parser.add_argument('-np', '--no-plots', dest='no_plots', action='store_true', required=False,
+                        help="Disables all plots.")
+    parser.add_argument('-dp', '--defer-plots', dest='defer_plots', action='store_true', required=False,
+                        help="Only writes the plot specs. They can be rendered later using PlotRenderer.py.")
+    parser.add_argument('-c', '--cores', dest='cores', type=int, required=False,
+                        help="The maximum amount of cores shared by all workers. 0 uses all available cores.")
+    parser.add_argument('-nc', '--no-cache', dest='no_cache', action='store_true', required=False,
+                        help="Disables the fit and data set cache. All data sets will be preprocessed "
+                             "and all models will be trained again.")
     args = parser.parse_args()
 
     if args.remove:
@@ -39,8 +85,66 @@ def handle_args():
     if args.memory:
         Config.MEMORY_SAVING_MODE = True
 
+    if args.batch:
+        Config.BATCH_MODE = True
+
+    if args.cross_validation:
+        Config.CROSS_VALIDATION = True
+
+    if args.engine is not None:
+        Config.MODEL_ENGINE = args.engine
+
+    if args.stream:
+        Config.STREAMING_MODE = True
+
+    if args.no_cache:
+        Config.FIT_CACHE = False
+        Config.DATASET_CACHE = False
+
+    if args.workers is not None:
+        Config.WORKERS = max(args.workers, 1)
+
+    if args.task_workers is not None:
+        Config.TASK_WORKERS = max(args.task_workers, 1)
+
+    if args.load_workers is not None:
+        Config.LOAD_WORKERS = max(args.load_workers, 1)
+
+    if args.split_workers is not None:
+        Config.SPLIT_WORKERS = max(args.split_workers, 1)
+
+    if args.split_parts is not None:
+        Config.MAXIMUM_SPLIT_PARTS = max(args.split_parts, 0)
+
+    if args.feature_workers is not None:
+        Config.FEATURE_WORKERS = max(args.feature_workers, 1)
+
+    if args.cross_validation_workers is not None:
+        Config.CROSS_VALIDATION_WORKERS = max(args.cross_validation_workers, 1)
+
+    if args.learning_curve_workers is not None:
+        Config.LEARNING_CURVE_WORKERS = max(args.learning_curve_workers, 1)
+
+    if args.plot_workers is not None:
+        Config.PLOT_WORKERS = max(args.plot_workers, 1)
+
+    if args.no_csv_reports:
+        Config.CSV_REPORTS = False
+
+    if args.no_plots:
+        Config.PLOTS = False
+
+    if args.defer_plots:
+        Config.RENDER_PLOTS = False
+
+    if args.cores is not None:
+        Config.CORES = max(args.cores, 0)
+
+    if args.task_executor is not None:
+        Config.TASK_EXECUTOR = args.task_executor
+
     if args.debug:
         Config.VERBOSE = True
         Config.DEBUG_MODE = True
 
-    sleep(1)
+    Console.pause(1)
@@ -11,12 +11,30 @@ class Config:
     PERCENTAGE_REMOVAL = False
     MERGED_TOOL_EVALUATION = False
     MEMORY_SAVING_MODE = False
+    STREAMING_MODE = False
+    # No pauses and prompts, for unattended runs
+    BATCH_MODE = False
+    # Stores the records of each run in a database and lists the run in the catalog of the results folder
+    RESULTS_DATABASE = True
+    # Writes the csv reports of each file
+    CSV_REPORTS = True
+    # Writes the specs of all plots
+    PLOTS = True
+    # Renders the plot specs after the evaluation. Otherwise they are rendered on demand using PlotRenderer.py.
+    RENDER_PLOTS = True
+    # Scatter plots with more points are drawn as 2d histogram or sampled. 0 draws all points.
+    PLOT_POINT_LIMIT = 10000
+    # The maximum amount of points of each swarm. 0 draws all points.
+    PLOT_SWARM_LIMIT = 200
     DEBUG_MODE = False
 
     # Data
     DATA_ROOT_DIRECTORY = Path()
     DATA_RAW_DIRECTORY = Path()
     DATA_RESULTS_DIRECTORY = Path()
+    DATA_CACHE_DIRECTORY = Path()
+    # Amount of rows read at once in streaming mode
+    CHUNK_SIZE = 100000
 
     # File Names
     FILE_RUNTIME_MEAN_SUMMARY = ''
@@ -24,16 +42,56 @@ class Config:
     FILE_MEMORY_MEAN_SUMMARY = ''
     FILE_MEMORY_VAR_SUMMARY = ''
     FILE_EXCLUDED_FILES = ''
+    FILE_ERRORS = 'Errors'
 
     # ML
+    # Additionally evaluate each data set using k fold cross validation, repeated the configured amount of times
+    CROSS_VALIDATION = False
     K_FOLDS = 0
     REPETITIONS = 0
     FOREST_ESTIMATORS = 100
     FOREST_MAX_DEPTH = 12
+    # The engine of the trained models. One of random_forest, hist_gradient_boosting, extra_trees or linear.
+    MODEL_ENGINE = 'random_forest'
     MINIMUM_ROW_COUNT = 50
     MINIMUM_COLUMN_COUNT = 2
+    # Maximum amount of parts evaluated by the split evaluation. 0 evaluates all parts.
+    MAXIMUM_SPLIT_PARTS = 0
+    # The simple data sets stop, once the test score did not improve by the minimum improvement this many times.
+    # 0 evaluates all simple data sets.
+    SIMPLE_DF_PATIENCE = 2
+    SIMPLE_DF_MIN_IMPROVEMENT = 0.001
+    # The learning curve stops, once the test score did not improve by the minimum improvement this many times.
+    # 0 evaluates all steps.
+    LEARNING_CURVE_PATIENCE = 2
+    LEARNING_CURVE_MIN_IMPROVEMENT = 0.001
     LABELS = []
 
+    # Cache
+    FIT_CACHE = False
+    # Maximum size of the fit cache in MB
+    FIT_CACHE_SIZE = 2048
+    DATASET_CACHE = False
+
+    # Parallel
+    WORKERS = 1
+    TASK_WORKERS = 1
+    TASK_EXECUTOR = 'thread'
+    # Threads reading files in parallel
+    LOAD_WORKERS = 4
+    # Threads training the parts of the split evaluation in parallel
+    SPLIT_WORKERS = 1
+    # Threads training the feature subsets of the simple data sets in parallel
+    FEATURE_WORKERS = 1
+    # Threads training the folds of the cross validation in parallel
+    CROSS_VALIDATION_WORKERS = 1
+    # Threads training the steps of the learning curve in parallel
+    LEARNING_CURVE_WORKERS = 1
+    # Processes rendering the plots in parallel
+    PLOT_WORKERS = 1
+    # The maximum amount of cores shared by all workers. 0 uses all cores available to the application.
+    CORES = 0
+
 
 def read_conf():
     """
@@ -50,11 +108,22 @@ def read_conf():
         Config.PERCENTAGE_REMOVAL = bool(int(config['GENERAL']['percentage_removal']))
         Config.MERGED_TOOL_EVALUATION = bool(int(config['GENERAL']['merged_tool_evaluation']))
         Config.MEMORY_SAVING_MODE = bool(int(config['GENERAL']['memory_saving_mode']))
+        Config.STREAMING_MODE = bool(int(config.get('GENERAL', 'streaming_mode', fallback=Config.STREAMING_MODE)))
+        Config.BATCH_MODE = bool(int(config.get('GENERAL', 'batch_mode', fallback=Config.BATCH_MODE)))
+        Config.RESULTS_DATABASE = bool(int(config.get('GENERAL', 'results_database', fallback=Config.RESULTS_DATABASE)))
+        Config.CSV_REPORTS = bool(int(config.get('GENERAL', 'csv_reports', fallback=Config.CSV_REPORTS)))
+        Config.PLOTS = bool(int(config.get('GENERAL', 'plots', fallback=Config.PLOTS)))
+        Config.RENDER_PLOTS = bool(int(config.get('GENERAL', 'render_plots', fallback=Config.RENDER_PLOTS)))
+        Config.PLOT_POINT_LIMIT = int(config.get('GENERAL', 'plot_point_limit', fallback=Config.PLOT_POINT_LIMIT))
+        Config.PLOT_SWARM_LIMIT = int(config.get('GENERAL', 'plot_swarm_limit', fallback=Config.PLOT_SWARM_LIMIT))
 
         # Data
         Config.DATA_ROOT_DIRECTORY = Path(config['DATA']['root_directory'])
         Config.DATA_RAW_DIRECTORY = Path(Config.DATA_ROOT_DIRECTORY, config['DATA']['raw_directory'])
         Config.DATA_RESULTS_DIRECTORY = Path(Config.DATA_ROOT_DIRECTORY, config['DATA']['results_directory'])
+        Config.DATA_CACHE_DIRECTORY = Path(Config.DATA_ROOT_DIRECTORY,
+                                           config.get('DATA', 'cache_directory', fallback='Cache'))
+        Config.CHUNK_SIZE = int(config.get('DATA', 'chunk_size', fallback=Config.CHUNK_SIZE))
 
         # File Names
         Config.FILE_RUNTIME_MEAN_SUMMARY = config['FILE_NAMES']['runtime_mean_summary_name']
@@ -62,12 +131,23 @@ def read_conf():
         Config.FILE_MEMORY_MEAN_SUMMARY = config['FILE_NAMES']['memory_mean_summary_name']
         Config.FILE_MEMORY_VAR_SUMMARY = config['FILE_NAMES']['memory_var_summary_name']
         Config.FILE_EXCLUDED_FILES = config['FILE_NAMES']['excluded_files']
+        Config.FILE_ERRORS = config.get('FILE_NAMES', 'errors', fallback=Config.FILE_ERRORS)
 
         # ML
+        Config.CROSS_VALIDATION = bool(int(config.get('ML', 'cross_validation', fallback=Config.CROSS_VALIDATION)))
         Config.K_FOLDS = int(config['ML']['k_folds'])
         Config.REPETITIONS = int(config['ML']['repetitions'])
         Config.FOREST_ESTIMATORS = int(config['ML']['forest_estimators'])
         Config.FOREST_MAX_DEPTH = int(config['ML']['max_depth'])
+        Config.MODEL_ENGINE = config.get('ML', 'model_engine', fallback=Config.MODEL_ENGINE).strip()
+        Config.MAXIMUM_SPLIT_PARTS = int(config.get('ML', 'max_split_parts', fallback=Config.MAXIMUM_SPLIT_PARTS))
+        Config.SIMPLE_DF_PATIENCE = int(config.get('ML', 'simple_df_patience', fallback=Config.SIMPLE_DF_PATIENCE))
+        Config.SIMPLE_DF_MIN_IMPROVEMENT = float(
+            config.get('ML', 'simple_df_min_improvement', fallback=Config.SIMPLE_DF_MIN_IMPROVEMENT))
+        Config.LEARNING_CURVE_PATIENCE = int(
+            config.get('ML', 'learning_curve_patience', fallback=Config.LEARNING_CURVE_PATIENCE))
+        Config.LEARNING_CURVE_MIN_IMPROVEMENT = float(
+            config.get('ML', 'learning_curve_min_improvement', fallback=Config.LEARNING_CURVE_MIN_IMPROVEMENT))
 
         # File Settings
         Config.MINIMUM_ROW_COUNT = int(config['FILE_SETTINGS']['min_row_count_per_file'])
@@ -76,6 +156,25 @@ def read_conf():
         Config.LABELS = str(config.get('FILE_SETTINGS', 'labels')).split(',')
         Config.LABELS = [label.strip() for label in Config.LABELS]
 
+        # Cache
+        Config.FIT_CACHE = bool(int(config.get('CACHE', 'fit_cache', fallback=Config.FIT_CACHE)))
+        Config.FIT_CACHE_SIZE = int(config.get('CACHE', 'fit_cache_size', fallback=Config.FIT_CACHE_SIZE))
+        Config.DATASET_CACHE = bool(int(config.get('CACHE', 'dataset_cache', fallback=Config.DATASET_CACHE)))
+
+        # Parallel
+        Config.WORKERS = int(config.get('PARALLEL', 'workers', fallback=Config.WORKERS))
+        Config.TASK_WORKERS = int(config.get('PARALLEL', 'task_workers', fallback=Config.TASK_WORKERS))
+        Config.TASK_EXECUTOR = config.get('PARALLEL', 'task_executor', fallback=Config.TASK_EXECUTOR).strip()
+        Config.LOAD_WORKERS = int(config.get('PARALLEL', 'load_workers', fallback=Config.LOAD_WORKERS))
+        Config.SPLIT_WORKERS = int(config.get('PARALLEL', 'split_workers', fallback=Config.SPLIT_WORKERS))
+        Config.FEATURE_WORKERS = int(config.get('PARALLEL', 'feature_workers', fallback=Config.FEATURE_WORKERS))
+        Config.CROSS_VALIDATION_WORKERS = int(
+            config.get('PARALLEL', 'cross_validation_workers', fallback=Config.CROSS_VALIDATION_WORKERS))
+        Config.LEARNING_CURVE_WORKERS = int(
+            config.get('PARALLEL', 'learning_curve_workers', fallback=Config.LEARNING_CURVE_WORKERS))
+        Config.PLOT_WORKERS = int(config.get('PARALLEL', 'plot_workers', fallback=Config.PLOT_WORKERS))
+        Config.CORES = int(config.get('PARALLEL', 'cores', fallback=Config.CORES))
+
         validate_config()
         return True
     except KeyError as ex:
@@ -85,6 +184,24 @@ def read_conf():
         sys.exit()
 
 
+def get_settings() -> dict:
+    """
+    Returns a snapshot of all config values, e.g. to hand them over to a worker process
+    :return:
+    """
+    return {key: value for key, value in vars(Config).items() if not key.startswith('__')}
+
+
+def apply_settings(settings: dict):
+    """
+    Applies a snapshot created by get_settings to the Config class
+    :param settings:
+    :return:
+    """
+    for key, value in settings.items():
+        setattr(Config, key, value)
+
+
 def reset_config():
     """
     Resets the Config File. In fact the Config.ini file will be rewritten in total.
@@ -140,10 +257,82 @@ def validate_config():
         logging.warning(f"A negative or zero value for forest estimators is invalid. Setting to 12...")
         Config.FOREST_ESTIMATORS = 12
 
+    if Config.MODEL_ENGINE not in ['random_forest', 'hist_gradient_boosting', 'extra_trees', 'linear']:
+        logging.warning(f"Unknown model engine {Config.MODEL_ENGINE}. Setting to random_forest...")
+        Config.MODEL_ENGINE = 'random_forest'
+
     if Config.MINIMUM_ROW_COUNT < 0:
         logging.warning(f"A negative value for the minimum row count is invalid. Setting to 50...")
         Config.MINIMUM_ROW_COUNT = 50
 
+    if Config.MAXIMUM_SPLIT_PARTS < 0:
+        logging.warning(f"A negative value for the maximum split parts is invalid. Setting to 0...")
+        Config.MAXIMUM_SPLIT_PARTS = 0
+
+    if Config.SIMPLE_DF_PATIENCE < 0:
+        logging.warning(f"A negative value for the simple df patience is invalid. Setting to 2...")
+        Config.SIMPLE_DF_PATIENCE = 2
+
+    if Config.LEARNING_CURVE_PATIENCE < 0:
+        logging.warning(f"A negative value for the learning curve patience is invalid. Setting to 2...")
+        Config.LEARNING_CURVE_PATIENCE = 2
+
+    if Config.PLOT_POINT_LIMIT < 0:
+        logging.warning(f"A negative value for the plot point limit is invalid. Setting to 10000...")
+        Config.PLOT_POINT_LIMIT = 10000
+
+    if Config.PLOT_SWARM_LIMIT < 0:
+        logging.warning(f"A negative value for the plot swarm limit is invalid. Setting to 200...")
+        Config.PLOT_SWARM_LIMIT = 200
+
+    if Config.CHUNK_SIZE <= 0:
+        logging.warning(f"A negative or zero value for the chunk size is invalid. Setting to 100000...")
+        Config.CHUNK_SIZE = 100000
+
+    if Config.FIT_CACHE_SIZE < 0:
+        logging.warning(f"A negative value for the fit cache size is invalid. Setting to 2048...")
+        Config.FIT_CACHE_SIZE = 2048
+
+    if Config.WORKERS <= 0:
+        logging.warning(f"A negative or zero value for workers is invalid. Setting to 1...")
+        Config.WORKERS = 1
+
+    if Config.TASK_WORKERS <= 0:
+        logging.warning(f"A negative or zero value for task workers is invalid. Setting to 1...")
+        Config.TASK_WORKERS = 1
+
+    if Config.LOAD_WORKERS <= 0:
+        logging.warning(f"A negative or zero value for load workers is invalid. Setting to 4...")
+        Config.LOAD_WORKERS = 4
+
+    if Config.SPLIT_WORKERS <= 0:
+        logging.warning(f"A negative or zero value for split workers is invalid. Setting to 1...")
+        Config.SPLIT_WORKERS = 1
+
+    if Config.FEATURE_WORKERS <= 0:
+        logging.warning(f"A negative or zero value for feature workers is invalid. Setting to 1...")
+        Config.FEATURE_WORKERS = 1
+
+    if Config.CROSS_VALIDATION_WORKERS <= 0:
+        logging.warning(f"A negative or zero value for cross validation workers is invalid. Setting to 1...")
+        Config.CROSS_VALIDATION_WORKERS = 1
+
+    if Config.LEARNING_CURVE_WORKERS <= 0:
+        logging.warning(f"A negative or zero value for learning curve workers is invalid. Setting to 1...")
+        Config.LEARNING_CURVE_WORKERS = 1
+
+    if Config.PLOT_WORKERS <= 0:
+        logging.warning(f"A negative or zero value for plot workers is invalid. Setting to 1...")
+        Config.PLOT_WORKERS = 1
+
+    if Config.CORES < 0:
+        logging.warning(f"A negative value for cores is invalid. Setting to 0...")
+        Config.CORES = 0
+
+    if Config.TASK_EXECUTOR not in ['thread', 'process']:
+        logging.warning(f"Unknown task executor {Config.TASK_EXECUTOR}. Setting to thread...")
+        Config.TASK_EXECUTOR = 'thread'
+
     if len(Config.LABELS) == 0:
         logging.error("Please specify at least one label to be evaluated!")
         sys.exit()
@@ -18,6 +18,21 @@ def get_file_name(path):
     return tail or ntpath.basename(head)
 
 
+def get_tool_name(path):
+    """
+    Returns the name of the tool, the file belongs to
+    :param path:
+    :return:
+    """
+    file_name: str = get_file_name(path)
+    # Remove the files version number if present, then remove the file extension to get a clean name
+
+    if any(char.isdigit() for char in file_name):
+        return os.path.splitext(str(file_name.rsplit('_', 1)[0]))[0]
+    else:
+        return Path(path).stem
+
+
 def read_file(path: str):
     """
     Reads the file located at the given path
@@ -32,6 +47,63 @@ def read_file(path: str):
         return None
 
 
+def read_file_header(path: str):
+    """
+    Reads only the header of the file located at the given path.
+    Returns the column names or None, if the file could not be read
+    :param path:
+    :return:
+    """
+    try:
+        return list(pd.read_csv(f"{Config.DATA_RAW_DIRECTORY}/{path}", nrows=0).columns)
+    except (OSError, pd.errors.EmptyDataError) as ex:
+        if Config.VERBOSE:
+            print(ex)
+        return None
+
+
+def count_rows(path: str) -> int:
+    """
+    Counts the lines of the file located at the given path, without parsing it.
+    The header is not counted. Blank lines and values spanning multiple lines are counted too,
+    so the result is an upper bound of the rows of the data set.
+    :param path:
+    :return:
+    """
+    lines = 0
+    last_block = b''
+    with open(f"{Config.DATA_RAW_DIRECTORY}/{path}", 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            lines += block.count(b'\n')
+            last_block = block
+
+    # The last line does not necessarily end with a line break
+    if last_block and not last_block.endswith(b'\n'):
+        lines += 1
+
+    return max(lines - 1, 0)
+
+
+def read_file_chunks(path: str, chunk_size: int, categorical_columns=None):
+    """
+    Reads the file located at the given path in chunks of the given amount of rows.
+    The types of each chunk are inferred from the chunk, unless the column is one of the given categorical columns.
+    Categorical columns are read as such in every chunk, even if a chunk only contains missing or numerical values.
+    :param path:
+    :param chunk_size:
+    :param categorical_columns:
+    :return:
+    """
+    path = f"{Config.DATA_RAW_DIRECTORY}/{path}"
+    dtype = {column: object for column in categorical_columns} if categorical_columns is not None else None
+    try:
+        return pd.read_csv(path, chunksize=chunk_size, dtype=dtype)
+    except OSError as ex:
+        if Config.VERBOSE:
+            print(ex)
+        return None
+
+
 def create_csv_file(df, folder, name):
     """
     Writes a df to a given folder with the given name
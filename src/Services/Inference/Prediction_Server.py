@@ -0,0 +1,200 @@
+from Services.Predictions import Model_Export
+import pandas as pd
+import asyncio
+import json
+import logging
+
+
+class Batcher:
+    def __init__(self, tool_name: str, artifacts: dict, max_batch_size: int, max_delay: float):
+        """
+        Collects the jobs of concurrent requests for one tool and predicts all labels for them in one pass
+        :param tool_name:
+        :param artifacts: The exported model of each label
+        :param max_batch_size: The maximum amount of jobs predicted together
+        :param max_delay: The maximum time in seconds a request waits for other requests to join the batch
+        """
+        self.tool_name = tool_name
+        self.artifacts = artifacts
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.queue = asyncio.Queue()
+
+    async def predict(self, jobs: list) -> list:
+        """
+        Queues the jobs and returns the predictions for each of them, once their batch is evaluated
+        :param jobs:
+        :return:
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((jobs, future))
+        return await future
+
+    async def run(self):
+        """
+        Evaluates the queued requests batch by batch
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            requests = [await self.queue.get()]
+            job_count = len(requests[0][0])
+            deadline = loop.time() + self.max_delay
+
+            # Requests queued while the previous batch was evaluated join without waiting
+            while job_count < self.max_batch_size:
+                if self.queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+
+                    try:
+                        request = await asyncio.wait_for(self.queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    request = self.queue.get_nowait()
+
+                requests.append(request)
+                job_count += len(request[0])
+
+            jobs = [job for request_jobs, _ in requests for job in request_jobs]
+            try:
+                predictions = await loop.run_in_executor(None, self.__predict_batch, jobs)
+            except BaseException as ex:
+                logging.exception(ex)
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(ex)
+                continue
+
+            offset = 0
+            for request_jobs, future in requests:
+                if not future.done():
+                    future.set_result(predictions[offset: offset + len(request_jobs)])
+                offset += len(request_jobs)
+
+    def __predict_batch(self, jobs: list) -> list:
+        """
+        Predicts all labels for all jobs using one vectorized call per label
+        :param jobs:
+        :return:
+        """
+        predictions = Model_Export.predict_labels(self.artifacts, pd.DataFrame.from_records(jobs))
+        return predictions.astype(float).to_dict('records')
+
+
+class PredictionServer:
+    def __init__(self, models: dict, max_batch_size: int = 512, max_delay: float = 0.001):
+        """
+        A small HTTP server, answering predictions for the exported models
+        :param models: The artifacts of each label for each tool, as returned by Model_Export.load_models
+        :param max_batch_size:
+        :param max_delay:
+        """
+        self.models = models
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.batchers = dict()
+
+    async def serve(self, host: str, port: int):
+        """
+        Starts the batchers and serves requests until the process is stopped
+        :param host:
+        :param port:
+        :return:
+        """
+        for tool_name, artifacts in self.models.items():
+            self.batchers[tool_name] = Batcher(tool_name, artifacts, self.max_batch_size, self.max_delay)
+            asyncio.ensure_future(self.batchers[tool_name].run())
+
+        server = await asyncio.start_server(self.__handle_connection, host, port)
+        logging.info(f"Serving predictions for {len(self.models)} tools on {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    async def handle_request(self, method: str, path: str, body: bytes):
+        """
+        Returns the status and the response for a request
+        :param method:
+        :param path:
+        :param body:
+        :return:
+        """
+        if method == 'GET' and path == '/health':
+            return '200 OK', {'status': 'ok'}
+
+        if method == 'GET' and path == '/models':
+            return '200 OK', {tool_name: {label: {'file': artifact['file'], 'test_score': artifact['test_score']}
+                                          for label, artifact in artifacts.items()}
+                              for tool_name, artifacts in self.models.items()}
+
+        if path != '/predict':
+            return '404 Not Found', {'error': f"Unknown path {path}"}
+
+        if method != 'POST':
+            return '405 Method Not Allowed', {'error': "Use POST to request predictions"}
+
+        try:
+            request = json.loads(body)
+            tool_name = request['tool']
+            jobs = request['jobs'] if 'jobs' in request else [request['job']]
+        except (ValueError, KeyError, TypeError):
+            return '400 Bad Request', {'error': "Expected a json object containing a tool and a job or jobs"}
+
+        if tool_name not in self.batchers:
+            return '404 Not Found', {'error': f"No model available for tool {tool_name}"}
+
+        if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+            return '400 Bad Request', {'error': "Jobs have to be objects mapping parameters to values"}
+
+        if len(jobs) == 0:
+            return '200 OK', {'tool': tool_name, 'predictions': []}
+
+        try:
+            predictions = await self.batchers[tool_name].predict(jobs)
+        except BaseException as ex:
+            return '500 Internal Server Error', {'error': str(ex)}
+
+        return '200 OK', {'tool': tool_name, 'predictions': predictions}
+
+    async def __handle_connection(self, reader, writer):
+        """
+        Handles all requests of a connection. Connections are kept alive, unless the client asks to close them.
+        :param reader:
+        :param writer:
+        :return:
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+
+                headers = dict()
+                while True:
+                    line = await reader.readline()
+                    if line in [b'\r\n', b'\n', b'']:
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                status, response = await self.handle_request(method, path.split('?', 1)[0], body)
+
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                payload = json.dumps(response).encode()
+                writer.write(f"HTTP/1.1 {status}\r\n"
+                             f"Content-Type: application/json\r\n"
+                             f"Content-Length: {len(payload)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + payload)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
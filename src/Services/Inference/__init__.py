@@ -0,0 +1 @@
+__all__ = ['Prediction_Server']
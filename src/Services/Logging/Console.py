@@ -0,0 +1,26 @@
+from Services.Configuration.Config import Config
+from time import sleep
+
+
+def pause(seconds: float):
+    """
+    Pauses the application, so the user is able to read the console output.
+    Does not pause in batch mode.
+    :param seconds:
+    :return:
+    """
+    if Config.BATCH_MODE:
+        return
+
+    sleep(seconds)
+
+
+def prompt():
+    """
+    Waits for the user to press enter. Does not wait in batch mode.
+    :return:
+    """
+    if Config.BATCH_MODE:
+        return
+
+    input()
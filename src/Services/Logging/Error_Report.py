@@ -0,0 +1,46 @@
+from RuntimeContants import Runtime_Folders
+from Services.Configuration.Config import Config
+from pathlib import Path
+import pandas as pd
+import traceback
+import logging
+
+COLUMNS = ['Tool', 'File Name', 'Label', 'Stage', 'Error', 'Message', 'Traceback']
+
+
+def create_error(stage: str, ex: BaseException, file_name: str = None, label: str = None) -> dict:
+    """
+    Creates an entry of the error report for the given exception
+    :param stage:
+    :param ex:
+    :param file_name:
+    :param label:
+    :return:
+    """
+    return {'File Name': file_name, 'Label': label, 'Stage': stage, 'Error': type(ex).__name__, 'Message': str(ex),
+            'Traceback': ''.join(traceback.format_exception(type(ex), ex, ex.__traceback__))}
+
+
+def write_report(tools: list):
+    """
+    Writes all errors of the given tools and their files into one report
+    :param tools:
+    :return:
+    """
+    errors = []
+    for tool in tools:
+        for error in tool.errors:
+            errors.append({**error, 'Tool': tool.name})
+
+        for file in tool.all_files:
+            for error in file.errors:
+                errors.append({**error, 'Tool': tool.name})
+
+    if len(errors) > 0:
+        logging.warning(f"{len(errors)} errors occurred. See {Config.FILE_ERRORS}.csv for details.")
+
+    try:
+        pd.DataFrame(errors, columns=COLUMNS).to_csv(
+            Path(Runtime_Folders.EVALUATION_DIRECTORY, f"{Config.FILE_ERRORS}.csv"), index=False)
+    except BaseException as ex:
+        logging.exception(ex)
@@ -1 +1 @@
-__all__ = ['Logger']
+__all__ = ['Console', 'Error_Report', 'Logger']
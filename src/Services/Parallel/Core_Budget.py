@@ -0,0 +1,190 @@
+from concurrent.futures import ThreadPoolExecutor
+from Services.Configuration.Config import Config
+from pathlib import Path
+import multiprocessing
+import threading
+import logging
+import math
+import os
+
+# Splits the cores between the nested workers of the evaluation (tools, tasks, splits, feature sets and folds).
+# Each level divides the cores of its parent between its unfinished jobs, up to its amount of workers.
+# The cores are calculated whenever a model is created, so once jobs finish the remaining jobs get their cores.
+
+# The pool of the jobs each thread currently runs
+__local = threading.local()
+# The budget of the process pool this process is a worker of. None in the main process.
+__process_budget = None
+# The cores available to the application, determined once
+__available_cores = None
+
+
+def get_available_cores() -> int:
+    """
+    Returns the amount of cores the application may use.
+    Takes the cpu affinity, the cgroup cpu quota of containers and the configured limit into account.
+    :return:
+    """
+    global __available_cores
+    if __available_cores is not None:
+        return __available_cores
+
+    if hasattr(os, 'sched_getaffinity'):
+        cores = len(os.sched_getaffinity(0))
+    else:
+        cores = os.cpu_count() or 1
+
+    quota = __read_cgroup_quota()
+    if quota is not None:
+        cores = min(cores, quota)
+
+    if Config.CORES > 0:
+        cores = min(cores, Config.CORES)
+
+    __available_cores = max(cores, 1)
+    return __available_cores
+
+
+def get_cores() -> int:
+    """
+    Returns the amount of cores the calling thread may use right now
+    :return:
+    """
+    return __get_pool_cores(getattr(__local, 'pool', None))
+
+
+def run_parallel(function, items: list, workers: int) -> list:
+    """
+    Calls the function for each item on up to the given amount of threads and returns the results in order.
+    The cores of the calling thread are split between the running items.
+    :param function:
+    :param items:
+    :param workers:
+    :return:
+    """
+    pool = {'parent': getattr(__local, 'pool', None), 'workers': max(workers, 1), 'unfinished': len(items),
+            'lock': threading.Lock()}
+
+    def run(item):
+        parent = getattr(__local, 'pool', None)
+        __local.pool = pool
+        try:
+            return function(item)
+        finally:
+            __local.pool = parent
+            with pool['lock']:
+                pool['unfinished'] -= 1
+
+    if pool['workers'] <= 1 or len(items) <= 1:
+        return [run(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(pool['workers'], len(items))) as executor:
+        return list(executor.map(run, items))
+
+
+def create_process_budget(workers: int, jobs: int) -> dict:
+    """
+    Creates the budget handed to the workers of a process pool.
+    The cores of the calling thread are split between the unfinished jobs of the pool.
+    :param workers:
+    :param jobs:
+    :return:
+    """
+    return {'cores': get_cores(), 'workers': max(workers, 1), 'unfinished': multiprocessing.Value('i', jobs)}
+
+
+def finish_process_job(budget: dict):
+    """
+    Marks one job of a process pool as finished, so the workers running the remaining jobs get its cores
+    :param budget:
+    :return:
+    """
+    with budget['unfinished'].get_lock():
+        budget['unfinished'].value -= 1
+
+
+def init_process(budget: dict):
+    """
+    Applies the budget of the process pool, the current process is a worker of
+    :param budget:
+    :return:
+    """
+    global __process_budget
+    __process_budget = budget
+    limit_native_threads()
+
+
+def limit_native_threads():
+    """
+    Limits the threads of native libraries (BLAS and OpenMP) used by each model to the share of each thread worker.
+    Unlike forests, these libraries use one limit for the whole process, so the limit is not rebalanced.
+    :return:
+    """
+    thread_workers = max(Config.SPLIT_WORKERS, Config.FEATURE_WORKERS, Config.CROSS_VALIDATION_WORKERS,
+                         Config.LEARNING_CURVE_WORKERS)
+    if Config.TASK_EXECUTOR == 'thread':
+        thread_workers *= Config.TASK_WORKERS
+
+    threads = max(get_cores() // thread_workers, 1)
+
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=threads)
+    except ImportError:
+        if Config.DEBUG_MODE:
+            logging.info("threadpoolctl is not installed. Threads of native libraries are not limited.")
+        return
+
+    if Config.DEBUG_MODE:
+        logging.info(f"Using {get_cores()} cores. Limited threads of native libraries to {threads}.")
+
+
+def __get_pool_cores(pool) -> int:
+    """
+    Returns the cores of each unfinished job of the given pool. Returns the cores of the process, if there is no pool.
+    :param pool:
+    :return:
+    """
+    if pool is None:
+        return __get_process_cores()
+
+    jobs = min(pool['workers'], max(pool['unfinished'], 1))
+    return max(__get_pool_cores(pool['parent']) // jobs, 1)
+
+
+def __get_process_cores() -> int:
+    """
+    Returns the cores of the current process
+    :return:
+    """
+    if __process_budget is None:
+        return get_available_cores()
+
+    jobs = min(__process_budget['workers'], max(__process_budget['unfinished'].value, 1))
+    return max(__process_budget['cores'] // jobs, 1)
+
+
+def __read_cgroup_quota():
+    """
+    Returns the cpu quota of the cgroup (v2 or v1) in cores, rounded up. Returns None, if there is no quota.
+    :return:
+    """
+    try:
+        cpu_max = Path("/sys/fs/cgroup/cpu.max")
+        if cpu_max.is_file():
+            quota, period = cpu_max.read_text().split()[:2]
+            if quota == 'max':
+                return None
+            return max(math.ceil(int(quota) / int(period)), 1)
+
+        quota_path = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+        period_path = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        if quota_path.is_file() and period_path.is_file():
+            quota = int(quota_path.read_text())
+            if quota <= 0:
+                return None
+            return max(math.ceil(quota / int(period_path.read_text())), 1)
+    except (OSError, ValueError):
+        return None
+
+    return None
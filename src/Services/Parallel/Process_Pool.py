@@ -0,0 +1,28 @@
+from concurrent.futures import ProcessPoolExecutor
+from Services.Configuration import Config as Configuration
+from Services.Parallel import Core_Budget
+from RuntimeContants import Runtime_Folders
+
+
+def create_process_pool(workers: int, budget: dict) -> ProcessPoolExecutor:
+    """
+    Creates a process pool, whose workers share the config and the evaluation folder of the main process
+    :param workers:
+    :param budget: The core budget of the pool, as created by Core_Budget.create_process_budget
+    :return:
+    """
+    return ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                               initargs=(Configuration.get_settings(), Runtime_Folders.EVALUATION_DIRECTORY, budget))
+
+
+def init_worker(settings: dict, evaluation_directory, budget: dict):
+    """
+    Prepares a worker process. Config values and the evaluation folder are not shared with spawned processes.
+    :param settings:
+    :param evaluation_directory:
+    :param budget:
+    :return:
+    """
+    Configuration.apply_settings(settings)
+    Runtime_Folders.EVALUATION_DIRECTORY = evaluation_directory
+    Core_Budget.init_process(budget)
@@ -0,0 +1,61 @@
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+# Blocks attached by this process. They stay open until the process ends, because data frames reference them.
+__attached_blocks = dict()
+
+
+def publish(df):
+    """
+    Copies the values of a numeric data frame once into a shared memory block.
+    Returns the block and a handle. The handle is small and can be sent to other processes to attach to the block.
+    Returns None, None if the data frame can not be shared.
+    :param df:
+    :return:
+    """
+    if df is None or df.empty:
+        return None, None
+
+    dtype = np.result_type(*df.dtypes)
+    if dtype == object:
+        return None, None
+
+    shape = df.shape
+    block = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * dtype.itemsize)
+    # Column major, like pandas stores its values, so every column is copied as one contiguous chunk
+    matrix = np.ndarray(shape, dtype=dtype, buffer=block.buf, order='F')
+    for position in range(shape[1]):
+        matrix[:, position] = df.iloc[:, position].to_numpy()
+
+    handle = {'name': block.name, 'shape': shape, 'dtype': dtype.str, 'columns': df.columns, 'index': df.index}
+    return block, handle
+
+
+def attach(handle: dict):
+    """
+    Attaches to a published block and returns a read only data frame, which is a view of the shared values
+    :param handle:
+    :return:
+    """
+    block = __attached_blocks.get(handle['name'])
+    if block is None:
+        block = shared_memory.SharedMemory(name=handle['name'])
+        __attached_blocks[handle['name']] = block
+
+    matrix = np.ndarray(handle['shape'], dtype=np.dtype(handle['dtype']), buffer=block.buf, order='F')
+    matrix.flags.writeable = False
+    return pd.DataFrame(matrix, index=handle['index'], columns=handle['columns'], copy=False)
+
+
+def release(block):
+    """
+    Closes and removes a block created by publish
+    :param block:
+    :return:
+    """
+    if block is None:
+        return
+
+    block.close()
+    block.unlink()
@@ -0,0 +1,173 @@
+from Services.Configuration.Config import Config
+from Services.Parallel import Core_Budget, Process_Pool
+from Services.Logging import Error_Report
+import logging
+
+# The stages evaluated for each file and label. The order is also the order the results are stored in.
+PREDICTION = 'prediction'
+PARTIAL_PREDICTION = 'partial_prediction'
+PCA_ANALYSIS = 'pca_analysis'
+STAGES = [PREDICTION, PARTIAL_PREDICTION, PCA_ANALYSIS]
+# Only evaluated, if the percentage removal is enabled
+LEARNING_CURVE = 'learning_curve'
+
+THREAD_EXECUTOR = 'thread'
+PROCESS_EXECUTOR = 'process'
+EXECUTORS = [THREAD_EXECUTOR, PROCESS_EXECUTOR]
+
+
+def evaluate_files(files: list):
+    """
+    Evaluates each (file, label, stage) combination of the given files as an independent task.
+    The results are merged back into the files in a deterministic order, regardless of the order the tasks finished.
+    :param files:
+    :return:
+    """
+    tasks = [(file, label, stage) for file in files for label in file.detected_labels for stage in get_stages()]
+
+    if Config.TASK_WORKERS <= 1 or len(tasks) <= 1:
+        for file, label, stage in tasks:
+            evaluate_task(file, label, stage)
+        return
+
+    workers = min(Config.TASK_WORKERS, len(tasks))
+    if Config.VERBOSE:
+        logging.info(f"Evaluating {len(tasks)} tasks using {workers} {Config.TASK_EXECUTOR} workers...")
+
+    if Config.TASK_EXECUTOR == PROCESS_EXECUTOR:
+        results = __run_tasks_in_processes(files, tasks, workers)
+    else:
+        results = Core_Budget.run_parallel(lambda task: __run_task_safely(*task), tasks, workers)
+
+    for (file, label, stage), (result, error) in zip(tasks, results):
+        __store_task_result_or_error(file, label, stage, result, error)
+
+
+def get_stages() -> list:
+    """
+    Returns the stages evaluated for each file and label
+    :return:
+    """
+    if Config.PERCENTAGE_REMOVAL:
+        return STAGES + [LEARNING_CURVE]
+
+    return STAGES
+
+
+def evaluate_task(file, label: str, stage: str):
+    """
+    Calculates and stores the result of a single stage in the current thread.
+    A failing stage is recorded as error of the file, instead of stopping the evaluation.
+    :param file:
+    :param label:
+    :param stage:
+    :return:
+    """
+    result, error = __run_task_safely(file, label, stage)
+    __store_task_result_or_error(file, label, stage, result, error)
+
+
+def run_task(file, label: str, stage: str):
+    """
+    Calculates the result of a single stage. Does not modify the file.
+    :param file:
+    :param label:
+    :param stage:
+    :return:
+    """
+    if stage == PREDICTION:
+        return file.calculate_prediction(label)
+    elif stage == PARTIAL_PREDICTION:
+        return file.calculate_partial_prediction(label)
+    elif stage == PCA_ANALYSIS:
+        return file.calculate_pca_analysis(label)
+    elif stage == LEARNING_CURVE:
+        return file.calculate_learning_curve(label)
+
+    raise ValueError(f"Unknown stage {stage}")
+
+
+def __run_task_safely(file, label: str, stage: str):
+    """
+    Runs a single stage and returns its result and None or None and the error, if the stage failed
+    :param file:
+    :param label:
+    :param stage:
+    :return:
+    """
+    try:
+        return run_task(file, label, stage), None
+    except BaseException as ex:
+        return None, Error_Report.create_error(stage, ex, file.name, label)
+
+
+def __store_task_result_or_error(file, label: str, stage: str, result, error: dict):
+    """
+    Stores the result of a stage in the file or records the error, if the stage failed
+    :param file:
+    :param label:
+    :param stage:
+    :param result:
+    :param error:
+    :return:
+    """
+    if error is not None:
+        logging.warning(f"Stage {stage} failed for label {label} of file {file.name}.")
+        file.errors.append(error)
+        return
+
+    store_task_result(file, label, stage, result)
+
+
+def store_task_result(file, label: str, stage: str, result):
+    """
+    Stores the result of a single stage in the file
+    :param file:
+    :param label:
+    :param stage:
+    :param result:
+    :return:
+    """
+    if stage == PREDICTION:
+        file.store_prediction(label, result)
+    elif stage == PARTIAL_PREDICTION:
+        file.store_partial_prediction(label, result)
+    elif stage == PCA_ANALYSIS:
+        file.store_pca_analysis(label, result)
+    elif stage == LEARNING_CURVE:
+        file.store_learning_curve(label, result)
+    else:
+        raise ValueError(f"Unknown stage {stage}")
+
+
+def __run_tasks_in_processes(files: list, tasks: list, workers: int) -> list:
+    """
+    Runs the tasks in a process pool and returns the result and error of each task in order
+    :param files:
+    :param tasks:
+    :param workers:
+    :return:
+    """
+    # Worker processes attach to the shared data sets instead of receiving a copy with each task
+    results = []
+    try:
+        for file in files:
+            file.share_preprocessed_df()
+
+        budget = Core_Budget.create_process_budget(workers, len(tasks))
+        with Process_Pool.create_process_pool(workers, budget) as executor:
+            futures = [executor.submit(__run_task_safely, file, label, stage) for file, label, stage in tasks]
+            for future in futures:
+                future.add_done_callback(lambda done_future: Core_Budget.finish_process_job(budget))
+
+            for (file, label, stage), future in zip(tasks, futures):
+                try:
+                    results.append(future.result())
+                except BaseException as ex:
+                    logging.exception(ex)
+                    results.append((None, Error_Report.create_error(stage, ex, file.name, label)))
+    finally:
+        for file in files:
+            file.release_shared_preprocessed_df()
+
+    return results
@@ -0,0 +1,92 @@
+from concurrent.futures import as_completed
+from Services.Configuration.Config import Config
+from Services.Parallel import Core_Budget, Process_Pool
+from Services.Logging import Error_Report
+from Services.Statistics import Runtime_Statistics
+import logging
+import time
+
+TOOL_EVALUATION = 'tool_evaluation'
+
+
+def evaluate_tools(tools: list) -> list:
+    """
+    Evaluates all given tools. If more than one worker is configured, the tools are handed to a process pool.
+    Returns the evaluated tools in the same order they were provided.
+    :param tools:
+    :return:
+    """
+    if Config.WORKERS <= 1 or len(tools) <= 1:
+        return [__evaluate_tool_safely(tool) for tool in tools]
+
+    workers = min(Config.WORKERS, len(tools))
+    logging.info(f"Evaluating {len(tools)} tools using {workers} worker processes...")
+
+    evaluated_tools = list(tools)
+    # Once tools are finished, the workers evaluating the remaining tools get their cores
+    budget = Core_Budget.create_process_budget(workers, len(tools))
+    with Process_Pool.create_process_pool(workers, budget) as executor:
+        futures = {executor.submit(evaluate_tool, tool): index for index, tool in enumerate(tools)}
+        for future in futures:
+            future.add_done_callback(lambda done_future: Core_Budget.finish_process_job(budget))
+
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                evaluated_tools[index] = future.result()
+            except BaseException as ex:
+                logging.warning(f"Evaluation of tool {tools[index].name} failed.")
+                logging.exception(ex)
+                tools[index].errors.append(Error_Report.create_error(TOOL_EVALUATION, ex))
+
+    return evaluated_tools
+
+
+def __evaluate_tool_safely(tool):
+    """
+    Evaluates a single tool. A failing tool is recorded as error of the tool, instead of stopping the application.
+    :param tool:
+    :return:
+    """
+    try:
+        return evaluate_tool(tool)
+    except BaseException as ex:
+        logging.warning(f"Evaluation of tool {tool.name} failed.")
+        logging.exception(ex)
+        tool.errors.append(Error_Report.create_error(TOOL_EVALUATION, ex))
+        return tool
+
+
+def evaluate_tool(tool):
+    """
+    Runs the complete evaluation workflow for a single tool
+    :param tool:
+    :return:
+    """
+    tool_start_time = time.time()
+    tool.load_files()
+    if not tool.verified:
+        return tool
+
+    tool.evaluate()
+    tool.generate_overview_data_sets()
+    tool.prepare_additional_files()
+    tool.evaluate_additional_files()
+    tool.create_simple_data_frames()
+    tool.generate_overview_data_sets()
+    tool.generate_reports()
+    tool.export_models()
+    tool.save_encoders()
+    if Config.PLOTS:
+        tool.generate_plots()
+    tool.free_memory()
+
+    time_passed = Runtime_Statistics.get_duration(tool_start_time)
+    print()
+    if time_passed > 60:
+        logging.info(f"Tool {tool.name} evaluated in {time_passed / 60} minutes")
+    else:
+        logging.info(f"Tool {tool.name} evaluated in {time_passed} seconds")
+    print()
+
+    return tool
@@ -0,0 +1 @@
+__all__ = ['Core_Budget', 'Process_Pool', 'Shared_Memory', 'Task_Executor', 'Tool_Executor']
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+
+# Prepares the data of plots with too many points to draw each of them. Only requires numpy and pandas.
+
+# The amount of bins of each axis of a 2d histogram
+HISTOGRAM_BINS = 100
+# The amount of strata, points are sampled from
+STRATA = 10
+
+
+def get_histogram_2d(x, y, log_scale: bool = False, bins: int = HISTOGRAM_BINS) -> dict:
+    """
+    Counts the points in each cell of a grid. The cells of log scaled histograms grow exponentially.
+    Points which are not finite or not positive on a log scale are skipped, like they are not shown by scatter plots.
+    :param x:
+    :param y:
+    :param log_scale:
+    :param bins:
+    :return:
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    valid = np.isfinite(x) & np.isfinite(y)
+    if log_scale:
+        valid &= (x > 0) & (y > 0)
+    x = x[valid]
+    y = y[valid]
+
+    if len(x) == 0:
+        return {'counts': np.zeros((0, 0)), 'x_edges': np.zeros(0), 'y_edges': np.zeros(0), 'log_scale': log_scale}
+
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=[__get_edges(x, log_scale, bins),
+                                                          __get_edges(y, log_scale, bins)])
+    return {'counts': counts, 'x_edges': x_edges, 'y_edges': y_edges, 'log_scale': log_scale}
+
+
+def sample_stratified(data, column, limit: int, strata: int = STRATA):
+    """
+    Samples up to limit rows. The rows are divided into strata by the quantiles of the column and the same fraction
+    of rows is sampled from each stratum, so the distribution of the column is kept. The order of the rows is kept.
+    :param data:
+    :param column:
+    :param limit:
+    :param strata:
+    :return:
+    """
+    if len(data) <= limit:
+        return data
+
+    ranks = data[column].rank(method='first', na_option='bottom').to_numpy() - 1
+    stratum = np.floor(ranks * strata / len(data)).astype(int)
+    random_state = np.random.RandomState(1)
+
+    # Each stratum gets its share rounded down. The remaining rows go to the strata with the largest remainders,
+    # so exactly limit rows are sampled.
+    sizes = np.bincount(stratum, minlength=strata)
+    shares = sizes * limit / len(data)
+    counts = np.floor(shares).astype(int)
+    counts[np.argsort(counts - shares, kind='stable')[:limit - counts.sum()]] += 1
+
+    rows = []
+    for value in range(strata):
+        indices = np.flatnonzero(stratum == value)
+        rows.append(random_state.choice(indices, counts[value], replace=False))
+
+    return data.iloc[np.sort(np.concatenate(rows))]
+
+
+def sample_groups(data, group, column, limit: int):
+    """
+    Keeps up to limit rows of each group. The kept rows are spread evenly across the sorted values of the column,
+    so the rows still show the distribution of each group. The groups keep the order of their first row.
+    :param data:
+    :param group:
+    :param column:
+    :param limit:
+    :return:
+    """
+    if len(data) == 0 or data.groupby(group).size().max() <= limit:
+        return data
+
+    samples = []
+    for _, rows in data.groupby(group, sort=False):
+        if len(rows) > limit:
+            rows = rows.sort_values(column, kind='mergesort')
+            rows = rows.iloc[np.unique(np.linspace(0, len(rows) - 1, limit).round().astype(int))]
+        samples.append(rows)
+
+    return pd.concat(samples)
+
+
+def __get_edges(values, log_scale: bool, bins: int):
+    """
+    Returns the edges of the bins, covering all values
+    :param values:
+    :param log_scale:
+    :param bins:
+    :return:
+    """
+    minimum = values.min()
+    maximum = values.max()
+    if minimum == maximum:
+        # A single value is placed in the middle of one bin
+        minimum, maximum = (minimum / 2, minimum * 2) if log_scale else (minimum - 0.5, maximum + 0.5)
+
+    if log_scale:
+        return np.geomspace(minimum, maximum, bins + 1)
+
+    return np.linspace(minimum, maximum, bins + 1)
@@ -0,0 +1,162 @@
+import matplotlib
+
+# Plots are only written to files, so no display is required
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
+import seaborn as sns
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from Services.Plotting import Plot_Data, Plot_Specs
+import logging
+
+sns.set(style="whitegrid")
+
+
+def render_plots(path, workers: int = 1) -> int:
+    """
+    Renders all specs of the given path, using a pool of processes. Returns the amount of rendered plots.
+    :param path: A spec, a folder containing specs or a run
+    :param workers:
+    :return:
+    """
+    specs = Plot_Specs.get_specs(path)
+    if len(specs) == 0:
+        return 0
+
+    workers = min(max(workers, 1), len(specs))
+    logging.info(f"Rendering {len(specs)} plots using {workers} processes...")
+
+    if workers <= 1:
+        rendered = [render_plot(spec) for spec in specs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rendered = list(executor.map(render_plot, specs, chunksize=max(len(specs) // (workers * 4), 1)))
+
+    if sum(rendered) < len(specs):
+        logging.warning(f"{len(specs) - sum(rendered)} plots could not be rendered.")
+
+    return sum(rendered)
+
+
+def render_plot(path) -> bool:
+    """
+    Renders a single spec. Returns False, if the plot could not be rendered.
+    :param path:
+    :return:
+    """
+    try:
+        spec = Plot_Specs.load_spec(path)
+        spec['output'].parent.mkdir(parents=True, exist_ok=True)
+        RENDERERS[spec['type']](spec['data'], spec['output'], **spec['options'])
+        return True
+    except BaseException as ex:
+        logging.warning(f"Could not render plot {path}.")
+        logging.exception(ex)
+        return False
+    finally:
+        plt.close('all')
+
+
+def __render_scatter_plot(data, output, x: str, y: str, hue: str = None, label: str = None, log_scale: bool = False,
+                          bbox_inches: str = None):
+    ax = sns.scatterplot(x=x, y=y, hue=hue, label=label, data=data)
+
+    if log_scale:
+        ax.set(xscale="log", yscale="log")
+
+    ax.legend()
+    ax.get_figure().savefig(output, bbox_inches=bbox_inches)
+
+
+def __render_histogram_2d(data, output, label: str = None, xlabel: str = None, ylabel: str = None,
+                          bbox_inches: str = None):
+    fig, ax = plt.subplots()
+
+    if data['counts'].size > 0 and data['counts'].max() > 0:
+        # Empty cells are not drawn, like the background of a scatter plot
+        counts = np.ma.masked_equal(data['counts'].T, 0)
+        mesh = ax.pcolormesh(data['x_edges'], data['y_edges'], counts, norm=LogNorm(), cmap='viridis')
+        fig.colorbar(mesh, ax=ax, label='Points')
+
+    if data['log_scale']:
+        ax.set(xscale="log", yscale="log")
+
+    ax.set(xlabel=xlabel, ylabel=ylabel, title=label)
+    fig.savefig(output, bbox_inches=bbox_inches)
+
+
+def __render_bar_plot(data, output, x: str = None, y: str = None, palette: str = None, xlabel: str = None,
+                      ylabel: str = None, rotation: int = None, horizontal_alignment: str = 'center',
+                      legend: bool = False, bbox_inches: str = None):
+    ax = sns.barplot(x=x, y=y, data=data, palette=palette)
+
+    if xlabel is not None or ylabel is not None:
+        ax.set(xlabel=xlabel, ylabel=ylabel)
+
+    if rotation is not None:
+        ax.set_xticklabels(ax.get_xticklabels(), rotation=rotation, horizontalalignment=horizontal_alignment)
+
+    if legend:
+        ax.legend()
+
+    ax.get_figure().savefig(output, bbox_inches=bbox_inches)
+
+
+def __render_variance_plot(data, output, xlabel: str = None, ylabel: str = None, bbox_inches: str = None):
+    features = range(len(data))
+    plt.bar(features, data, color='black')
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.xticks(features)
+    plt.xticks(rotation=90, fontsize=8)
+    plt.tight_layout()
+    plt.savefig(output, bbox_inches=bbox_inches)
+
+
+def __render_line_plot(data, output, x: str, lines: list, xlabel: str = None, ylabel: str = None,
+                       bbox_inches: str = None):
+    for line in lines:
+        plt.plot(data[x], data[line], marker='o', label=line)
+
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.legend()
+    plt.savefig(output, bbox_inches=bbox_inches)
+
+
+def __render_heatmap(data, output, bbox_inches: str = None):
+    # Only the lower triangle of the correlation matrix is shown
+    mask = np.triu(np.ones_like(data, dtype=bool))
+    f, ax = plt.subplots(figsize=(11, 9))
+    cmap = sns.diverging_palette(220, 10, as_cmap=True)
+    sns.heatmap(data, mask=mask, cmap=cmap, vmax=.3, center=0, square=True, linewidths=.5, cbar_kws={"shrink": .5})
+    ax.get_figure().savefig(output, bbox_inches=bbox_inches)
+
+
+def __render_box_plot(data, output, x: str, y: str, palette: str = None, rotation: int = None,
+                      swarm_limit: int = 0, bbox_inches: str = None):
+    ax = sns.boxplot(x=x, y=y, data=data, palette=palette)
+
+    # The layout of the swarm grows quadratically with its points, so only a part of each box is overlaid
+    swarm_data = data
+    if swarm_limit > 0:
+        swarm_data = Plot_Data.sample_groups(data, x, y, swarm_limit)
+    ax = sns.swarmplot(x=x, y=y, data=swarm_data, color=".25")
+
+    if rotation is not None:
+        ax.set_xticklabels(ax.get_xticklabels(), rotation=rotation)
+
+    ax.get_figure().savefig(output, bbox_inches=bbox_inches)
+
+
+RENDERERS = {
+    Plot_Specs.SCATTER_PLOT: __render_scatter_plot,
+    Plot_Specs.HISTOGRAM_2D: __render_histogram_2d,
+    Plot_Specs.BAR_PLOT: __render_bar_plot,
+    Plot_Specs.VARIANCE_PLOT: __render_variance_plot,
+    Plot_Specs.LINE_PLOT: __render_line_plot,
+    Plot_Specs.HEATMAP: __render_heatmap,
+    Plot_Specs.BOX_PLOT: __render_box_plot,
+}
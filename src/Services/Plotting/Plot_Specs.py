@@ -0,0 +1,108 @@
+from pathlib import Path
+from RuntimeContants import Runtime_Folders
+from Services.Configuration.Config import Config
+import joblib
+import logging
+import os
+import uuid
+
+# Plots are not drawn during the evaluation. Instead each plot is written as spec, containing the data and the type
+# of the plot, to the PlotSpecs folder of the run. The specs are rendered by the Plot_Renderer afterwards.
+# Writing a spec does not import matplotlib.
+
+SCATTER_PLOT = 'scatter_plot'
+HISTOGRAM_2D = 'histogram_2d'
+BAR_PLOT = 'bar_plot'
+VARIANCE_PLOT = 'variance_plot'
+LINE_PLOT = 'line_plot'
+HEATMAP = 'heatmap'
+BOX_PLOT = 'box_plot'
+PLOT_TYPES = [SCATTER_PLOT, HISTOGRAM_2D, BAR_PLOT, VARIANCE_PLOT, LINE_PLOT, HEATMAP, BOX_PLOT]
+
+SPEC_FOLDER = 'PlotSpecs'
+SPEC_SUFFIX = '.joblib'
+
+
+def save_spec(output, plot_type: str, data, **options):
+    """
+    Writes the spec of a plot, if plots are enabled. Returns the path of the spec or None, if no spec was written.
+    :param output: The path of the rendered plot
+    :param plot_type: One of the PLOT_TYPES
+    :param data: The data plotted. Only the data required by the plot should be passed, to keep the spec small.
+    :param options: Passed to the renderer of the plot type
+    :return:
+    """
+    if not Config.PLOTS:
+        return None
+
+    if plot_type not in PLOT_TYPES:
+        raise ValueError(f"Unknown plot type {plot_type}")
+
+    # The output is stored relative to the run, so runs can be moved before they are rendered
+    output = Path(output)
+    try:
+        output = output.relative_to(Runtime_Folders.EVALUATION_DIRECTORY)
+    except ValueError:
+        output = output.absolute()
+
+    path = Path(get_spec_directory(), f"{output}{SPEC_SUFFIX}")
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file first, so the renderer never reads an incomplete spec
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        joblib.dump({'type': plot_type, 'output': str(output), 'data': data, 'options': options}, temp_path,
+                    compress=3)
+        os.replace(temp_path, path)
+        return path
+    except BaseException as ex:
+        logging.warning(f"Could not write the spec of plot {output}.")
+        if Config.DEBUG_MODE:
+            logging.exception(ex)
+        return None
+
+
+def load_spec(path) -> dict:
+    """
+    Loads a spec. The output of the spec is resolved using the run, the spec belongs to.
+    :param path:
+    :return:
+    """
+    path = Path(path)
+    spec = joblib.load(path)
+
+    spec_directories = [parent for parent in path.parents if parent.name == SPEC_FOLDER]
+    if len(spec_directories) > 0:
+        spec['output'] = Path(spec_directories[0].parent, spec['output'])
+    else:
+        spec['output'] = Path(spec['output'])
+
+    return spec
+
+
+def get_spec_directory(evaluation_directory=None) -> Path:
+    """
+    Returns the folder containing the specs of the given run. Uses the current run, if none is given.
+    :param evaluation_directory:
+    :return:
+    """
+    if evaluation_directory is None:
+        evaluation_directory = Runtime_Folders.EVALUATION_DIRECTORY
+
+    return Path(evaluation_directory, SPEC_FOLDER)
+
+
+def get_specs(path) -> list:
+    """
+    Returns all specs of the given path. The path is either a spec, a folder containing specs or a run.
+    :param path:
+    :return:
+    """
+    path = Path(path)
+    if path.is_file():
+        return [path]
+
+    if get_spec_directory(path).is_dir():
+        path = get_spec_directory(path)
+
+    return sorted(path.rglob(f"*{SPEC_SUFFIX}"))
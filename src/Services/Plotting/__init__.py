@@ -0,0 +1 @@
+__all__ = ['Plot_Data', 'Plot_Renderer', 'Plot_Specs']
@@ -0,0 +1,122 @@
+import numpy as np
+import json
+
+# Leaves point to themselves, so rows reaching a leaf early stay there until all trees are traversed
+LEAF = -1
+# Rows are evaluated in chunks, to limit the memory used for the node index of each tree and row
+CHUNK_SIZE = 16384
+
+
+def is_supported(model) -> bool:
+    """
+    Checks if the model is a forest of regression trees, like a RandomForestRegressor or ExtraTreesRegressor
+    :param model:
+    :return:
+    """
+    estimators = getattr(model, 'estimators_', None)
+    if estimators is None or len(estimators) == 0:
+        return False
+
+    return all(hasattr(estimator, 'tree_') for estimator in estimators)
+
+
+def compile_model(model) -> dict:
+    """
+    Flattens all trees of the forest into contiguous arrays
+    :param model:
+    :return:
+    """
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        node_count = tree.node_count
+        nodes = np.arange(node_count, dtype=np.int32)
+        leaves = tree.children_left == LEAF
+
+        features.append(np.where(leaves, 0, tree.feature).astype(np.int32))
+        thresholds.append(np.where(leaves, 0, tree.threshold).astype(np.float64))
+        lefts.append(np.where(leaves, nodes, tree.children_left).astype(np.int32) + offset)
+        rights.append(np.where(leaves, nodes, tree.children_right).astype(np.int32) + offset)
+        values.append(tree.value[:, 0, 0].astype(np.float64))
+        roots.append(offset)
+
+        offset += node_count
+        max_depth = max(max_depth, tree.max_depth)
+
+    return {
+        'feature': np.concatenate(features),
+        'threshold': np.concatenate(thresholds),
+        'left': np.concatenate(lefts),
+        'right': np.concatenate(rights),
+        'value': np.concatenate(values),
+        'roots': np.array(roots, dtype=np.int32),
+        'max_depth': np.array(max_depth, dtype=np.int32),
+        'feature_count': np.array(model.n_features_in_ if hasattr(model, 'n_features_in_') else model.n_features_,
+                                  dtype=np.int32),
+    }
+
+
+def predict(compiled: dict, X):
+    """
+    Predicts the values for all rows, by traversing all trees for a chunk of rows at once.
+    Returns the average of all trees, like the forest does.
+    :param compiled:
+    :param X:
+    :return:
+    """
+    # The trees compare 32 bit features to 64 bit thresholds
+    X = np.asarray(X, dtype=np.float32)
+    feature_count = int(compiled['feature_count'])
+    if X.ndim != 2 or X.shape[1] != feature_count:
+        raise ValueError(f"Expected {feature_count} features, got shape {X.shape}")
+
+    feature = compiled['feature']
+    threshold = compiled['threshold']
+    left = compiled['left']
+    right = compiled['right']
+    value = compiled['value']
+    roots = compiled['roots']
+
+    y_hat = np.empty(len(X), dtype=np.float64)
+    for start in range(0, len(X), CHUNK_SIZE):
+        rows = np.ascontiguousarray(X[start:start + CHUNK_SIZE]).ravel()
+        row_count = len(rows) // feature_count
+        # Position of the first feature of each row in the flattened chunk
+        row_offsets = np.arange(row_count, dtype=np.int64) * feature_count
+
+        nodes = np.repeat(roots[:, np.newaxis], row_count, axis=1)
+        for _ in range(int(compiled['max_depth'])):
+            go_left = rows[row_offsets + feature[nodes]] <= threshold[nodes]
+            nodes = np.where(go_left, left[nodes], right[nodes])
+
+        y_hat[start:start + row_count] = value[nodes].mean(axis=0)
+
+    return y_hat
+
+
+def save(path, compiled: dict, metadata: dict):
+    """
+    Stores the compiled model and json serializable metadata in one npz file
+    :param path:
+    :param compiled:
+    :param metadata:
+    :return:
+    """
+    with open(path, 'wb') as file:
+        np.savez(file, metadata=np.array(json.dumps(metadata)), **compiled)
+
+
+def load(path):
+    """
+    Loads a compiled model and its metadata. Does not require scikit-learn.
+    :param path:
+    :return:
+    """
+    with np.load(path, allow_pickle=False) as data:
+        compiled = {key: data[key] for key in data.files if key != 'metadata'}
+        metadata = json.loads(str(data['metadata']))
+
+    return compiled, metadata
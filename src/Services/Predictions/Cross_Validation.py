@@ -0,0 +1,78 @@
+from sklearn.metrics import r2_score
+from Services.Configuration.Config import Config
+from Services.Parallel import Core_Budget
+from Services.Predictions import Predictions
+import numpy as np
+
+
+def cross_validate(label: str, dataframe, profile=None, folds=None) -> dict:
+    """
+    Trains and evaluates a model for each fold of each repetition.
+    Returns the mean and variance of the train and test scores or None, if there is insufficient data.
+    :param label:
+    :param dataframe:
+    :param profile: The column profile of the data set, the data frame is part of
+    :param folds: The fold of each row of the data frame, as created by create_folds. Rows removed before training
+    are removed from the folds, so every row stays in the same fold. Created for the data frame, if not given.
+    :return:
+    """
+    X, y, columns, rows = Predictions.select_data_rows(label, dataframe, profile)
+
+    if X is None or len(X) < Config.K_FOLDS:
+        return None
+
+    if folds is None:
+        folds = create_folds(len(dataframe))
+    if rows is not None:
+        folds = folds[:, rows]
+
+    # One matrix in the dtype the forest is trained with, shared by all folds instead of converted for each fit
+    X = X.to_numpy(dtype=np.float32)
+    y = y.to_numpy(dtype=np.float64)
+
+    def evaluate_fold(fold: tuple):
+        repetition, k = fold
+        test_rows = folds[repetition] == k
+        train_rows = ~test_rows
+
+        model = Predictions.create_model()
+        model.fit(X[train_rows], y[train_rows])
+        train_score = r2_score(y[train_rows], model.predict(X[train_rows]))
+        test_score = r2_score(y[test_rows], model.predict(X[test_rows]))
+        return train_score, test_score
+
+    # The rows of a part of the data set are not divided evenly into the folds, so a fold can be too small to be scored
+    fits = [(repetition, k) for repetition in range(Config.REPETITIONS) for k in range(Config.K_FOLDS)
+            if 2 <= np.count_nonzero(folds[repetition] == k) <= len(X) - 2]
+    if len(fits) == 0:
+        return None
+
+    # Forests release the GIL while fitting, so threads can share the matrix without copying it
+    scores = Core_Budget.run_parallel(evaluate_fold, fits, Config.CROSS_VALIDATION_WORKERS)
+
+    train_scores = np.array([train_score for train_score, _ in scores])
+    test_scores = np.array([test_score for _, test_score in scores])
+
+    return {'Cross Validation Test Score Mean': test_scores.mean(),
+            'Cross Validation Test Score Var': test_scores.var(),
+            'Cross Validation Train Score Mean': train_scores.mean(),
+            'Cross Validation Train Score Var': train_scores.var(),
+            'Cross Validation Fits': len(fits)}
+
+
+def create_folds(row_count: int):
+    """
+    Returns the fold of each row for each repetition, as matrix of the shape (repetitions, row count).
+    The rows are shuffled for each repetition. The folds are created once for the preprocessed data set of a file,
+    so all evaluations of the file use the same fold for the same row.
+    :param row_count:
+    :return:
+    """
+    folds = np.empty((Config.REPETITIONS, row_count), dtype=np.int16)
+    for repetition in range(Config.REPETITIONS):
+        # Like KFold, the first folds contain one row more, if the rows can not be divided evenly
+        order = np.random.RandomState(repetition + 1).permutation(row_count)
+        folds[repetition, order] = np.arange(row_count) % Config.K_FOLDS
+
+    folds.flags.writeable = False
+    return folds
@@ -0,0 +1,125 @@
+from Services.Configuration.Config import Config
+from pathlib import Path
+import numpy as np
+import sklearn
+import hashlib
+import joblib
+import logging
+import os
+import uuid
+
+# Increase if the content of an entry changes, to invalidate all stored entries
+CACHE_VERSION = 1
+# Parameters which do not influence the fitted model
+IGNORED_PARAMETERS = ['n_jobs', 'verbose']
+
+
+def get_key(label: str, columns, X, y, parameters: dict) -> str:
+    """
+    Calculates a key, based on the content of the training data, the label and the model parameters
+    :param label:
+    :param columns:
+    :param X:
+    :param y:
+    :param parameters:
+    :return:
+    """
+    parameters = sorted((key, value) for key, value in parameters.items() if key not in IGNORED_PARAMETERS)
+
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(f"{CACHE_VERSION}|{sklearn.__version__}|{label}|{list(columns)}|{parameters}".encode())
+
+    for values in [np.asarray(X), np.asarray(y)]:
+        values = np.ascontiguousarray(values)
+        hasher.update(f"{values.dtype.str}|{values.shape}".encode())
+        hasher.update(values.data)
+
+    return hasher.hexdigest()
+
+
+def load(key: str):
+    """
+    Returns the cached entry for the given key or None if there is none
+    :param key:
+    :return:
+    """
+    path = __get_entry_path(key)
+
+    if not path.is_file():
+        return None
+
+    try:
+        entry = joblib.load(path)
+        # The modification time is used to evict the least recently used entries
+        os.utime(path)
+    except BaseException as ex:
+        logging.warning(f"Could not load cached fit {key}")
+        if Config.DEBUG_MODE:
+            logging.warning(ex)
+        return None
+
+    if Config.DEBUG_MODE:
+        logging.info(f"Using cached fit {key}")
+    return entry
+
+
+def store(key: str, entry: dict):
+    """
+    Stores an entry and evicts the least recently used entries, if the cache exceeds its size
+    :param key:
+    :param entry:
+    :return:
+    """
+    path = __get_entry_path(key)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so other processes never read a partially written entry
+        temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        joblib.dump(entry, temp_path)
+        os.replace(temp_path, path)
+    except BaseException as ex:
+        logging.warning(f"Could not cache fit {key}")
+        if Config.DEBUG_MODE:
+            logging.warning(ex)
+        return
+
+    __evict()
+
+
+def __evict():
+    """
+    Removes the least recently used entries until the cache fits into the configured size
+    :return:
+    """
+    entries = []
+    for path in Path(Config.DATA_CACHE_DIRECTORY, "Fits").glob("*.joblib"):
+        try:
+            stats = path.stat()
+        except OSError:
+            continue
+
+        entries.append((stats.st_mtime, stats.st_size, path))
+
+    cache_size = sum(size for _, size, _ in entries)
+    max_cache_size = Config.FIT_CACHE_SIZE * 1024 * 1024
+
+    for _, size, path in sorted(entries):
+        if cache_size <= max_cache_size:
+            break
+
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+        cache_size -= size
+
+
+def __get_entry_path(key: str) -> Path:
+    """
+    Returns the path of the entry with the given key
+    :param key:
+    :return:
+    """
+    return Path(Config.DATA_CACHE_DIRECTORY, "Fits", f"{key}.joblib")
@@ -0,0 +1,94 @@
+from sklearn.metrics import r2_score
+from Services.Configuration.Config import Config
+from Services.Parallel import Core_Budget
+from Services.Predictions import Predictions
+import numpy as np
+import pandas as pd
+
+# Each step trains with 10% more of the training rows
+STEPS = 10
+# Like the prediction, 20% of the rows are used for testing
+TEST_SIZE = 0.2
+COLUMNS = ['Step', 'Training Rows', 'Training Fraction', 'Train Score', 'Test Score']
+
+
+def calculate_learning_curve(label: str, dataframe, profile=None):
+    """
+    Trains a model with 10%, 20%, ... of the training rows and evaluates each model using the same test rows.
+    The training rows of each step contain the rows of all previous steps. They are the first rows of one
+    permutation of the data set, so each step is a view of the same matrix instead of a copy.
+    The curve stops early, once the test score does not improve anymore.
+    Returns the curve as data frame or None, if there is insufficient data.
+    :param label:
+    :param dataframe:
+    :param profile: The column profile of the data set, the data frame is part of
+    :return:
+    """
+    X, y, columns = Predictions.select_data(label, dataframe, profile)
+
+    if X is None:
+        return None
+
+    order = np.random.RandomState(1).permutation(len(X))
+    test_row_count = int(np.ceil(len(X) * TEST_SIZE))
+    train_row_count = len(X) - test_row_count
+    if test_row_count < 2 or train_row_count < STEPS:
+        return None
+
+    # The matrix is permuted once. The test rows are the last rows of the permutation.
+    X = X.to_numpy(dtype=np.float32)[order]
+    y = y.to_numpy(dtype=np.float64)[order]
+    X_test = X[train_row_count:]
+    y_test = y[train_row_count:]
+
+    def evaluate_step(step: int):
+        rows = int(train_row_count * step / STEPS)
+        model = Predictions.create_model()
+        model.fit(X[:rows], y[:rows])
+        train_score = r2_score(y[:rows], model.predict(X[:rows]))
+        test_score = r2_score(y_test, model.predict(X_test))
+        return [step, rows, step / STEPS, train_score, test_score]
+
+    steps = list(range(1, STEPS + 1))
+    workers = min(Config.LEARNING_CURVE_WORKERS, len(steps))
+    curve = []
+    best_test_score = None
+    not_improved_count = 0
+
+    # The steps are evaluated in batches, so the curve can stop after each batch.
+    # The results are processed in order, so the curve does not depend on the amount of workers.
+    for batch_start in range(0, len(steps), workers):
+        batch = steps[batch_start:batch_start + workers]
+
+        for result in Core_Budget.run_parallel(evaluate_step, batch, workers):
+            curve.append(result)
+            test_score = result[-1]
+
+            if best_test_score is None or test_score - best_test_score >= Config.LEARNING_CURVE_MIN_IMPROVEMENT:
+                best_test_score = test_score
+                not_improved_count = 0
+            else:
+                not_improved_count += 1
+
+            if 0 < Config.LEARNING_CURVE_PATIENCE <= not_improved_count:
+                break
+
+        if 0 < Config.LEARNING_CURVE_PATIENCE <= not_improved_count:
+            break
+
+    return pd.DataFrame(curve, columns=COLUMNS)
+
+
+def get_required_rows(curve) -> dict:
+    """
+    Returns the step of the curve, whose test score was not improved by the following steps
+    :param curve:
+    :return:
+    """
+    best_step = None
+    for _, step in curve.iterrows():
+        if best_step is None or step['Test Score'] - best_step['Test Score'] >= Config.LEARNING_CURVE_MIN_IMPROVEMENT:
+            best_step = step
+
+    return {'Required Rows': int(best_step['Training Rows']), 'Training Fraction': best_step['Training Fraction'],
+            'Test Score': best_step['Test Score'], 'Evaluated Steps': len(curve)}
@@ -0,0 +1,131 @@
+from sklearn.ensemble import RandomForestRegressor, ExtraTreesRegressor
+from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import StandardScaler
+from Services.Configuration.Config import Config
+from contextlib import contextmanager
+import numpy as np
+
+try:
+    from sklearn.ensemble import HistGradientBoostingRegressor
+except ImportError:
+    # Before scikit-learn 1.0 the histogram based gradient boosting has to be enabled explicitly
+    from sklearn.experimental import enable_hist_gradient_boosting
+    from sklearn.ensemble import HistGradientBoostingRegressor
+
+RANDOM_FOREST = 'random_forest'
+HIST_GRADIENT_BOOSTING = 'hist_gradient_boosting'
+EXTRA_TREES = 'extra_trees'
+LINEAR = 'linear'
+
+
+def __create_random_forest(n_jobs: int):
+    return RandomForestRegressor(n_estimators=Config.FOREST_ESTIMATORS, max_depth=Config.FOREST_MAX_DEPTH,
+                                 random_state=1, n_jobs=n_jobs)
+
+
+def __create_hist_gradient_boosting(n_jobs: int):
+    # Each iteration adds one tree, like each estimator of the forest.
+    # Its OpenMP threads are limited for the whole process by Core_Budget.limit_native_threads.
+    return HistGradientBoostingRegressor(max_iter=Config.FOREST_ESTIMATORS, max_depth=Config.FOREST_MAX_DEPTH,
+                                         random_state=1)
+
+
+def __create_extra_trees(n_jobs: int):
+    return ExtraTreesRegressor(n_estimators=Config.FOREST_ESTIMATORS, max_depth=Config.FOREST_MAX_DEPTH,
+                               random_state=1, n_jobs=n_jobs)
+
+
+def __create_linear(n_jobs: int):
+    # Features are standardized, so the coefficients are comparable to each other
+    return make_pipeline(StandardScaler(), LinearRegression())
+
+
+# The available engines and the class of the models they create
+ENGINES = {
+    RANDOM_FOREST: (__create_random_forest, RandomForestRegressor),
+    HIST_GRADIENT_BOOSTING: (__create_hist_gradient_boosting, HistGradientBoostingRegressor),
+    EXTRA_TREES: (__create_extra_trees, ExtraTreesRegressor),
+    LINEAR: (__create_linear, Pipeline),
+}
+
+
+def create_model(engine: str = None, n_jobs: int = 1):
+    """
+    Creates an untrained model of the given engine. Uses the configured engine, if none is given.
+    :param engine:
+    :param n_jobs: The amount of threads training the trees of forests in parallel
+    :return:
+    """
+    if engine is None:
+        engine = Config.MODEL_ENGINE
+
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown model engine {engine}")
+
+    create, _ = ENGINES[engine]
+    return create(n_jobs)
+
+
+def get_engine(model) -> str:
+    """
+    Returns the name of the engine, which created the model
+    :param model:
+    :return:
+    """
+    for engine, (_, model_class) in ENGINES.items():
+        if type(model) is model_class:
+            return engine
+
+    return type(model).__name__
+
+
+def get_threads(model) -> dict:
+    """
+    Returns the parameters setting the amount of threads of the model and its steps
+    :param model:
+    :return:
+    """
+    return {key: value for key, value in model.get_params().items() if key.endswith('n_jobs')}
+
+
+@contextmanager
+def single_threaded(model):
+    """
+    Uses a single thread for the model while in the context, e.g. while the model is stored.
+    Stored models predict small batches, which are slower on a pool of threads than on a single thread.
+    :param model:
+    :return:
+    """
+    threads = get_threads(model)
+    model.set_params(**{key: 1 for key in threads})
+    try:
+        yield model
+    finally:
+        model.set_params(**threads)
+
+
+def get_feature_importances(model):
+    """
+    Returns the importance of each feature the model was trained with. The importances sum up to 1.
+    Forests use the impurity decrease, gradient boosting the gain of the splits of each feature
+    and the linear baseline the absolute coefficients of the standardized features.
+    :param model:
+    :return:
+    """
+    if isinstance(model, Pipeline):
+        importances = np.abs(np.ravel(model[-1].coef_))
+    elif isinstance(model, HistGradientBoostingRegressor):
+        importances = np.zeros(model.n_features_in_ if hasattr(model, 'n_features_in_') else model.n_features_)
+        for predictors in model._predictors:
+            for predictor in predictors:
+                splits = predictor.nodes[~predictor.nodes['is_leaf'].astype(bool)]
+                np.add.at(importances, splits['feature_idx'], splits['gain'])
+    else:
+        importances = np.asarray(model.feature_importances_, dtype=np.float64)
+
+    total = importances.sum()
+    if total > 0:
+        importances = importances / total
+
+    return importances
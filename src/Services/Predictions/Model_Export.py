@@ -0,0 +1,111 @@
+from Services.Configuration.Config import Config
+from Services.Processing import Transformation
+from Services.Predictions import Compiled_Forest
+from pathlib import Path
+import joblib
+import pandas as pd
+import logging
+
+# Increase if the content of an artifact changes
+ARTIFACT_VERSION = 1
+
+
+def export_model(folder: Path, tool_name: str, file, label: str, evaluation):
+    """
+    Stores the model of the given file and label together with everything required to preprocess new data
+    :param folder:
+    :param tool_name:
+    :param file:
+    :param label:
+    :param evaluation: The evaluation row of the file and label
+    :return:
+    """
+    # Only imported when exporting, so loading and serving models does not import scikit-learn
+    from Services.Predictions import Model_Engines
+
+    metadata = {
+        'version': ARTIFACT_VERSION,
+        'tool': tool_name,
+        'file': file.name,
+        'label': label,
+        'engine': Model_Engines.get_engine(file.models[label]),
+        'test_score': float(evaluation['Test Score']),
+        'train_score': float(evaluation['Train Score']),
+        'features': list(file.model_features[label]),
+        'preprocessing_state': file.preprocessing_state,
+    }
+    model = file.models[label]
+
+    path = Path(folder, f"{tool_name}_{label}.joblib")
+    try:
+        # The service predicts small batches, which are faster on a single thread
+        with Model_Engines.single_threaded(model):
+            joblib.dump({**metadata, 'model': model}, path)
+
+        # Forests are additionally exported as flat arrays, which only require numpy for predictions
+        if Compiled_Forest.is_supported(model):
+            Compiled_Forest.save(Path(folder, f"{tool_name}_{label}.npz"), Compiled_Forest.compile_model(model),
+                                 metadata)
+    except BaseException as ex:
+        logging.warning(f"Could not export model for tool {tool_name} and label {label}")
+        if Config.DEBUG_MODE:
+            logging.warning(ex)
+        return None
+
+    return path
+
+
+def load_models(folder: Path, compiled: bool = False) -> dict:
+    """
+    Loads all exported models of the given folder.
+    Returns a dictionary containing the artifacts of each label for each tool.
+    :param folder:
+    :param compiled: Loads the compiled forests instead of the scikit-learn models
+    :return:
+    """
+    models = dict()
+    for path in sorted(Path(folder).glob("*.npz" if compiled else "*.joblib")):
+        try:
+            if compiled:
+                compiled_model, artifact = Compiled_Forest.load(path)
+                artifact['compiled_model'] = compiled_model
+            else:
+                artifact = joblib.load(path)
+        except BaseException as ex:
+            logging.warning(f"Could not load model {path}")
+            logging.warning(ex)
+            continue
+
+        if not isinstance(artifact, dict) or artifact.get('version') != ARTIFACT_VERSION:
+            logging.warning(f"Skipping model {path}, because it was exported by an incompatible version")
+            continue
+
+        models.setdefault(artifact['tool'], dict())[artifact['label']] = artifact
+
+    return models
+
+
+def predict(artifact: dict, df):
+    """
+    Predicts the label of the artifact for all rows of the given raw data frame
+    :param artifact:
+    :param df:
+    :return:
+    """
+    X = Transformation.apply_pre_processing(df, artifact['preprocessing_state'], artifact['features'])
+
+    if 'compiled_model' in artifact:
+        return Compiled_Forest.predict(artifact['compiled_model'], X.to_numpy())
+
+    return artifact['model'].predict(X)
+
+
+def predict_labels(artifacts: dict, df):
+    """
+    Predicts all labels of a tool for all rows of the given raw data frame.
+    Returns a data frame containing one column per label.
+    :param artifacts: The artifact of each label
+    :param df:
+    :return:
+    """
+    return pd.DataFrame({label: predict(artifact, df) for label, artifact in artifacts.items()}, index=df.index)
@@ -1,54 +1,143 @@
 from sklearn.metrics import r2_score
 from sklearn.model_selection import train_test_split, KFold
-from sklearn.ensemble import RandomForestRegressor
 from Services.Configuration.Config import Config
-from Services.Processing import PreProcessing
+from Services.Processing import PreProcessing, Column_Profile
+from Services.Predictions import Fit_Cache, Model_Engines
+from Services.Parallel import Core_Budget
+from Services.Logging import Console
 import logging
 
 
 
-def predict(label: str, dataframe):
+def predict(label: str, dataframe, profile=None):
     """
+    Trains and evaluates a model for the given label.
+    If the column profile of the data set, the data frame is part of, is provided,
+    columns without variance are skipped before they are copied.
+    """
+    model = create_model()
+    X, y, columns = select_data(label, dataframe, profile)
+
+    # TODO: Improve ugly solution
+    if X is None:
+        return None, None, None, None, None, None, None
+
+    # Skip training, if the exact same data was fitted with the same parameters before.
+    # The amount of threads depends on the cores available right now, but does not change the model.
+    cache_key = None
+    if Config.FIT_CACHE:
+        params = {key: value for key, value in model.get_params().items() if not key.endswith('n_jobs')}
+        cache_key = Fit_Cache.get_key(label, columns, X, y, {**params, 'engine': Model_Engines.get_engine(model)})
+        entry = Fit_Cache.load(cache_key)
+        if entry is not None:
+            # Cached models are stored single threaded, so they use the cores of this thread again
+            entry['model'].set_params(**Model_Engines.get_threads(model))
+            return entry['model'], entry['train_score'], entry['test_score'], entry['over_fitting'], X, \
+                   entry['y_test'], entry['y_test_hat']
+
+    X_train, X_test, y_train, y_test = train_test_split(X, y, train_size=0.8, random_state=1)
+
+    model.fit(X_train, y_train)
+
+    y_test_hat = model.predict(X_test)
+    y_train_hat = model.predict(X_train)
+    train_score = r2_score(y_train, y_train_hat)
+    test_score = r2_score(y_test, y_test_hat)
+
+    over_fitting = False
+    if train_score > test_score * 2:
+        over_fitting = True
 
+    if cache_key is not None:
+        with Model_Engines.single_threaded(model):
+            Fit_Cache.store(cache_key, {'model': model, 'train_score': train_score, 'test_score': test_score,
+                                        'over_fitting': over_fitting, 'y_test': y_test, 'y_test_hat': y_test_hat})
+
+    return model, train_score, test_score, over_fitting, X, y_test, y_test_hat
+
+
+def create_model():
+    """
+    Creates the model of the configured engine, which is trained for each evaluation.
+    Forests use the cores the calling thread may use right now.
+    :return:
+    """
+    return Model_Engines.create_model(Config.MODEL_ENGINE, Core_Budget.get_cores())
+
+
+def select_data(label: str, dataframe, profile=None):
+    """
+    Selects the features and rows of the data frame, a model is trained with.
+    Returns X, y and the columns of the data frame without the label. X and y are None, if no feature is selected.
+    :param label:
+    :param dataframe:
+    :param profile: The column profile of the data set, the data frame is part of
+    :return:
+    """
+    X, y, columns, _ = select_data_rows(label, dataframe, profile)
+    return X, y, columns
+
+
+def select_data_rows(label: str, dataframe, profile=None):
+    """
+    Selects the features and rows of the data frame, like select_data.
+    Additionally returns which rows of the data frame are selected, as boolean array, or None if all rows are selected.
+    :param label:
+    :param dataframe:
+    :param profile: The column profile of the data set, the data frame is part of
+    :return:
     """
     if label not in dataframe:
         logging.warning(f"Label {label} is not present in provided dataframe!")
         logging.warning("Prediction stopped")
-        input()
-
-    model = RandomForestRegressor(n_estimators=Config.FOREST_ESTIMATORS, max_depth=Config.FOREST_MAX_DEPTH,
-                                  random_state=1)
+        Console.prompt()
+        raise ValueError(f"Label {label} is not present in provided dataframe")
 
+    # The given data frame is not modified, so it can be a view of a shared data set
     y = dataframe[label]
-    del dataframe[label]
-    X = dataframe
+    columns = dataframe.columns.drop(label)
+    features, remove_zero_rows = __prune_features(columns, profile)
+    X = dataframe[features]
 
     source_row_count = len(X)
+    rows = None
 
-    X_indices = (X != 0).any(axis=1)
-    X = X.loc[X_indices]
-    y = y.loc[X_indices]
+    if remove_zero_rows:
+        X_indices = (X != 0).any(axis=1)
+        X = X.loc[X_indices]
+        y = y.loc[X_indices]
+        rows = X_indices.to_numpy()
 
     if source_row_count != len(X) and Config.VERBOSE:
         logging.info(f"Removed {source_row_count - len(X)} row(s). Source had {source_row_count}.")
 
-    X = PreProcessing.variance_selection(X)
+    # Keep the data frame, so the names of the selected features are known
+    features = PreProcessing.variance_selected_columns(X)
 
-    # TODO: Improve ugly solution
-    if type(X) is int:
-        return None, None, None, None, None, None, None
+    if features is None:
+        return None, None, columns, rows
 
-    X_train, X_test, y_train, y_test = train_test_split(X, y, train_size=0.8, random_state=1)
+    return X[features], y, columns, rows
 
-    model.fit(X_train, y_train)
 
-    y_test_hat = model.predict(X_test)
-    y_train_hat = model.predict(X_train)
-    train_score = r2_score(y_train, y_train_hat)
-    test_score = r2_score(y_test, y_test_hat)
+def __prune_features(columns, profile):
+    """
+    Returns the columns, which can vary in the data frame and whether rows only containing zeros have to be removed.
+    Removing the other columns does not change which rows only contain zeros.
+    :param columns:
+    :param profile:
+    :return:
+    """
+    if profile is None:
+        return columns, True
 
-    over_fitting = False
-    if train_score > test_score * 2:
-        over_fitting = True
+    # If a column does not contain any zero, there is no row only containing zeros
+    remove_zero_rows = len(Column_Profile.get_columns_without_zeros(profile, columns)) == 0
+    features = Column_Profile.get_varying_columns(profile, columns)
 
-    return model, train_score, test_score, over_fitting, X, y_test, y_test_hat
+    # Rows only containing zeros are decided by all columns, unless the removed columns only contain zeros
+    pruned_columns = columns.difference(features)
+    if remove_zero_rows and len(Column_Profile.get_zero_columns(profile, pruned_columns)) != len(pruned_columns):
+        return columns, True
+
+    return features, remove_zero_rows
@@ -1 +1,2 @@
-__all__ = ['Predictions']
\ No newline at end of file
+__all__ = ['Compiled_Forest', 'Cross_Validation', 'Fit_Cache', 'Learning_Curve', 'Model_Engines', 'Model_Export',
+           'Predictions']
@@ -0,0 +1,120 @@
+from Services.Configuration.Config import Config
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import logging
+import json
+import os
+import uuid
+
+# Maps each categorical column of a tool to its list of categories. The position of a category is its code.
+# Categories are only ever appended, so codes stay stable across versions, merged files and runs.
+
+
+def encode(values, categories: list):
+    """
+    Returns the code of each value. Unseen values are sorted and appended to the categories,
+    so the categories are extended in place.
+    :param values:
+    :param categories:
+    :return:
+    """
+    codes = pd.Categorical(values, categories=categories).codes
+    unknown = codes == -1
+
+    if unknown.any():
+        _, unseen = pd.factorize(values[unknown], sort=True)
+        categories.extend(unseen.tolist())
+        codes = pd.Categorical(values, categories=categories).codes
+
+    return codes.astype(np.int64)
+
+
+def merge_categories(encoders: dict, categories: dict) -> bool:
+    """
+    Extends the encoders with the categories, data was encoded with before.
+    Returns False, if the categories conflict with the encoders, so the encoded data can not be used anymore.
+    :param encoders:
+    :param categories: The categories of each column, as recorded while encoding
+    :return:
+    """
+    for column, column_categories in categories.items():
+        known_categories = encoders.get(column, [])
+        length = min(len(known_categories), len(column_categories))
+        if known_categories[:length] != column_categories[:length]:
+            return False
+
+    for column, column_categories in categories.items():
+        known_categories = encoders.setdefault(column, [])
+        known_categories.extend(column_categories[len(known_categories):])
+
+    return True
+
+
+def load_encoders(tool_name: str) -> dict:
+    """
+    Loads the persisted encoders of the given tool. Returns an empty dictionary if there are none.
+    :param tool_name:
+    :return:
+    """
+    path = __get_encoders_path(tool_name)
+
+    if not path.is_file():
+        return dict()
+
+    try:
+        with open(path) as encoders_file:
+            return json.load(encoders_file)
+    except BaseException as ex:
+        logging.warning(f"Could not load categorical encoders of tool {tool_name}")
+        if Config.DEBUG_MODE:
+            logging.warning(ex)
+        return dict()
+
+
+def save_encoders(tool_name: str, encoders: dict, folder: Path = None):
+    """
+    Persists the encoders of the given tool, so following runs use the same codes.
+    If a folder is given, a copy is stored in there too.
+    :param tool_name:
+    :param encoders:
+    :param folder:
+    :return:
+    """
+    paths = [__get_encoders_path(tool_name)]
+    if folder is not None:
+        paths.append(Path(folder, "encoders.json"))
+
+    for path in paths:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, so other processes never read partially written encoders
+            temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            with open(temp_path, 'w') as encoders_file:
+                json.dump(encoders, encoders_file, default=__to_python)
+            os.replace(temp_path, path)
+        except BaseException as ex:
+            logging.warning(f"Could not save categorical encoders of tool {tool_name}")
+            if Config.DEBUG_MODE:
+                logging.warning(ex)
+
+
+def __to_python(value):
+    """
+    Converts numpy scalars to python values, which can be serialized
+    :param value:
+    :return:
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return str(value)
+
+
+def __get_encoders_path(tool_name: str) -> Path:
+    """
+    Returns the path of the persisted encoders of the given tool
+    :param tool_name:
+    :return:
+    """
+    return Path(Config.DATA_CACHE_DIRECTORY, "Encoders", f"{tool_name}.json")
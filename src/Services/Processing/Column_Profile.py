@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+COLUMNS = ['Variance', 'Min', 'Max', 'Null Count', 'Cardinality', 'Zero Fraction', 'Finite']
+
+
+def create_profile(df):
+    """
+    Describes each column of a numeric data frame in a single pass over its values.
+    Columns are read one after another, so the data frame is never copied as a whole.
+    :param df:
+    :return:
+    """
+    rows = []
+    for column in df.columns:
+        values = df[column].to_numpy(dtype=np.float64)
+        nulls = np.isnan(values)
+        null_count = int(nulls.sum())
+        present = values[~nulls] if null_count > 0 else values
+
+        if len(present) == 0:
+            rows.append([np.nan, np.nan, np.nan, null_count, 0, 0.0, True])
+            continue
+
+        minimum = present.min()
+        maximum = present.max()
+        finite = bool(np.isfinite(minimum) and np.isfinite(maximum))
+        rows.append([__get_variance(present, minimum, maximum) if finite else np.nan, minimum, maximum, null_count,
+                     len(pd.unique(present)), float(np.count_nonzero(present == 0)) / len(values), finite])
+
+    return pd.DataFrame(rows, index=df.columns, columns=COLUMNS)
+
+
+def get_variances(df):
+    """
+    Returns the variance of each column of a numeric data frame, ignoring nan values.
+    Equals the variances calculated by the VarianceThreshold of scikit, without copying the data frame as a whole.
+    :param df:
+    :return:
+    """
+    variances = []
+    for column in df.columns:
+        values = df[column].to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+
+        if len(values) == 0:
+            variances.append(np.nan)
+            continue
+
+        variances.append(__get_variance(values, values.min(), values.max()))
+
+    return pd.Series(variances, index=df.columns, dtype=np.float64)
+
+
+def get_varying_columns(profile, columns=None):
+    """
+    Returns the columns, which have a variance in the profiled data set.
+    A column without variance is constant in every part of the data set too.
+    :param profile:
+    :param columns: Only these columns are considered, if provided
+    :return:
+    """
+    if columns is not None:
+        profile = profile.loc[columns]
+
+    return profile.index[profile['Variance'] > 0]
+
+
+def get_columns_without_zeros(profile, columns=None):
+    """
+    Returns the columns, which do not contain a single zero.
+    If there is one, no row of the profiled data set or a part of it only contains zeros.
+    :param profile:
+    :param columns: Only these columns are considered, if provided
+    :return:
+    """
+    if columns is not None:
+        profile = profile.loc[columns]
+
+    return profile.index[profile['Zero Fraction'] == 0]
+
+
+def get_zero_columns(profile, columns=None):
+    """
+    Returns the columns, which only contain zeros
+    :param profile:
+    :param columns: Only these columns are considered, if provided
+    :return:
+    """
+    if columns is not None:
+        profile = profile.loc[columns]
+
+    return profile.index[profile['Zero Fraction'] == 1]
+
+
+def __get_variance(values, minimum, maximum):
+    """
+    Calculates the variance of values without nan.
+    Constant values have no variance, even if the calculation is not exact because of rounding.
+    :param values:
+    :param minimum:
+    :param maximum:
+    :return:
+    """
+    if minimum == maximum:
+        return 0.0
+
+    return float(np.var(values))
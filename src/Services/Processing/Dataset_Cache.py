@@ -0,0 +1,123 @@
+from Services.Configuration.Config import Config
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import hashlib
+import logging
+import json
+import os
+import shutil
+import uuid
+
+# Increase if the preprocessing changes, to invalidate all stored data sets
+CACHE_VERSION = 1
+
+
+def load(path: Path):
+    """
+    Returns the cached preprocessed data set of the given source file or None if there is no valid one.
+    An entry is only valid, if the source file did not change since it was stored.
+    :param path:
+    :return:
+    """
+    directory = __get_entry_directory(path)
+    manifest_path = Path(directory, "manifest.json")
+
+    if not manifest_path.is_file():
+        return None
+
+    try:
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+
+        if manifest['version'] != CACHE_VERSION or manifest['source'] != __get_source_stats(path):
+            return None
+
+        columns = manifest['columns']
+        index = pd.Index(np.load(Path(directory, "index.npy"), allow_pickle=False))
+        data = {column: np.load(Path(directory, f"column_{position}.npy"), allow_pickle=False)
+                for position, column in enumerate(columns)}
+        preprocessed_df = pd.DataFrame(data, index=index, columns=columns)
+    except BaseException as ex:
+        logging.warning(f"Could not load cached data set of file {path}")
+        if Config.DEBUG_MODE:
+            logging.warning(ex)
+        return None
+
+    if Config.DEBUG_MODE:
+        logging.info(f"Using cached data set of file {path}")
+
+    return {'preprocessed_df': preprocessed_df, 'preprocessing_state': manifest['preprocessing_state'],
+            'raw_row_count': manifest['raw_row_count'], 'raw_column_count': manifest['raw_column_count']}
+
+
+def store(path: Path, entry: dict):
+    """
+    Stores the preprocessed data set of the given source file.
+    Each column is stored as its own numpy file, the column names and preprocessing state are stored in a manifest.
+    :param path:
+    :param entry:
+    :return:
+    """
+    directory = __get_entry_directory(path)
+    preprocessed_df = entry['preprocessed_df']
+
+    try:
+        # Write to a temporary folder first, so other processes never read a partially written entry
+        temp_directory = directory.with_name(f"{directory.name}.{uuid.uuid4().hex}.tmp")
+        temp_directory.mkdir(parents=True)
+
+        for position, column in enumerate(preprocessed_df.columns):
+            np.save(Path(temp_directory, f"column_{position}.npy"), preprocessed_df[column].to_numpy(),
+                    allow_pickle=False)
+        np.save(Path(temp_directory, "index.npy"), preprocessed_df.index.to_numpy(), allow_pickle=False)
+
+        manifest = {'version': CACHE_VERSION, 'source': __get_source_stats(path),
+                    'columns': list(preprocessed_df.columns), 'raw_row_count': entry['raw_row_count'],
+                    'raw_column_count': entry['raw_column_count'],
+                    'preprocessing_state': entry['preprocessing_state']}
+        with open(Path(temp_directory, "manifest.json"), 'w') as manifest_file:
+            json.dump(manifest, manifest_file, default=__to_python)
+
+        # Folders can not be replaced directly, so the previous entry is moved away first
+        previous_directory = directory.with_name(f"{directory.name}.{uuid.uuid4().hex}.old")
+        if directory.exists():
+            os.replace(directory, previous_directory)
+        os.replace(temp_directory, directory)
+        shutil.rmtree(previous_directory, ignore_errors=True)
+    except BaseException as ex:
+        logging.warning(f"Could not cache data set of file {path}")
+        if Config.DEBUG_MODE:
+            logging.warning(ex)
+
+
+def __get_source_stats(path: Path) -> dict:
+    """
+    Returns the values identifying the current content of the source file
+    :param path:
+    :return:
+    """
+    stats = os.stat(path)
+    return {'path': str(Path(path).resolve()), 'size': stats.st_size, 'mtime': stats.st_mtime_ns}
+
+
+def __to_python(value):
+    """
+    Converts numpy scalars to python values, which can be serialized
+    :param value:
+    :return:
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return str(value)
+
+
+def __get_entry_directory(path: Path) -> Path:
+    """
+    Returns the folder of the entry belonging to the given source file
+    :param path:
+    :return:
+    """
+    key = hashlib.blake2b(str(Path(path).resolve()).encode(), digest_size=20).hexdigest()
+    return Path(Config.DATA_CACHE_DIRECTORY, "DataSets", key)
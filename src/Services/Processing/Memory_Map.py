@@ -0,0 +1,176 @@
+from Services.Configuration.Config import Config
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import logging
+import os
+import uuid
+
+# Streamed chunks are written with one type, because the types of a column can differ from chunk to chunk
+CHUNK_DTYPE = np.float64
+
+
+def spill(df):
+    """
+    Writes the values of a numeric data frame once into numpy files, one file for the columns of each type.
+    Returns a handle to open the files memory mapped or None, if the data frame can not be spilled.
+    :param df:
+    :return:
+    """
+    if df is None or df.empty:
+        return None
+
+    # The columns keep their types, so the loaded data set equals the spilled one
+    positions = dict()
+    for position, dtype in enumerate(df.dtypes):
+        if dtype == object or not isinstance(dtype, np.dtype):
+            return None
+        positions.setdefault(dtype, []).append(position)
+
+    handle = {'paths': [], 'positions': [], 'columns': df.columns, 'index': df.index}
+
+    try:
+        for dtype, dtype_positions in positions.items():
+            path = __get_spill_path()
+            handle['paths'].append(path)
+            handle['positions'].append(dtype_positions)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Column major, like pandas stores its values, so every column is written as one contiguous chunk
+            matrix = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(len(df), len(dtype_positions)),
+                                               fortran_order=True)
+            for offset, position in enumerate(dtype_positions):
+                matrix[:, offset] = df.iloc[:, position].to_numpy()
+            matrix.flush()
+            del matrix
+    except BaseException as ex:
+        logging.warning(f"Could not spill data set to {handle['paths'][-1]}")
+        if Config.DEBUG_MODE:
+            logging.warning(ex)
+        remove(handle)
+        return None
+
+    return handle
+
+
+def create_writer() -> dict:
+    """
+    Creates a writer, numeric data frames with the same columns are appended to one after another.
+    Only the appended data frame has to be in memory, while it is written.
+    :return:
+    """
+    path = __get_spill_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # The rows are appended to a temporary file first, because the amount of rows is unknown until the last chunk
+    return {'path': path, 'rows_path': path.with_suffix('.rows'), 'columns': None, 'indices': [], 'row_count': 0}
+
+
+def write_chunk(writer: dict, df):
+    """
+    Appends the rows of a numeric data frame to the writer
+    :param writer:
+    :param df:
+    :return:
+    """
+    if writer['columns'] is None:
+        writer['columns'] = df.columns
+    elif not df.columns.equals(writer['columns']):
+        # Columns are matched by name, like concatenating the data frames
+        if len(df.columns) != len(writer['columns']) or not df.columns.isin(writer['columns']).all():
+            raise ValueError("All chunks written to a spill file have to contain the same columns")
+        df = df[writer['columns']]
+
+    with open(writer['rows_path'], 'ab') as rows_file:
+        rows_file.write(np.ascontiguousarray(df.to_numpy(dtype=CHUNK_DTYPE)).tobytes())
+
+    writer['indices'].append(df.index.to_numpy())
+    writer['row_count'] += len(df.index)
+
+
+def close_writer(writer: dict):
+    """
+    Writes the appended rows column major into a numpy file, like spill, and removes the temporary file.
+    The rows are copied in blocks of chunk_size rows, so only one block is in memory at a time.
+    Returns a handle to open the file memory mapped or None, if no rows were written.
+    :param writer:
+    :return:
+    """
+    shape = (writer['row_count'], 0 if writer['columns'] is None else len(writer['columns']))
+    if shape[0] == 0 or shape[1] == 0:
+        discard_writer(writer)
+        return None
+
+    try:
+        rows = np.memmap(writer['rows_path'], dtype=CHUNK_DTYPE, mode='r', shape=shape)
+        matrix = np.lib.format.open_memmap(writer['path'], mode='w+', dtype=CHUNK_DTYPE, shape=shape,
+                                           fortran_order=True)
+        for start in range(0, shape[0], Config.CHUNK_SIZE):
+            matrix[start:start + Config.CHUNK_SIZE] = rows[start:start + Config.CHUNK_SIZE]
+        matrix.flush()
+        del matrix
+        del rows
+    except BaseException:
+        logging.warning(f"Could not spill data set to {writer['path']}")
+        __remove_file(writer['path'])
+        raise
+    finally:
+        __remove_file(writer['rows_path'])
+
+    return {'paths': [writer['path']], 'positions': [list(range(shape[1]))], 'columns': writer['columns'],
+            'index': pd.Index(np.concatenate(writer['indices']))}
+
+
+def discard_writer(writer: dict):
+    """
+    Removes the files of a writer, which is not closed
+    :param writer:
+    :return:
+    """
+    __remove_file(writer['rows_path'])
+    __remove_file(writer['path'])
+
+
+def load(handle: dict):
+    """
+    Returns a read only data frame, which is a memory mapped view of the spilled files.
+    Only the pages which are accessed are loaded, the OS decides how long they stay in memory.
+    :param handle:
+    :return:
+    """
+    matrices = [np.load(path, mmap_mode='r') for path in handle['paths']]
+    if len(matrices) == 1:
+        return pd.DataFrame(matrices[0], index=handle['index'], columns=handle['columns'], copy=False)
+
+    # Each column is a view of the file of its type. The views are not consolidated, so no column is copied.
+    values = dict()
+    for matrix, positions in zip(matrices, handle['positions']):
+        for offset, position in enumerate(positions):
+            values[position] = matrix[:, offset]
+
+    df = pd.DataFrame({position: values[position] for position in range(len(handle['columns']))},
+                      index=handle['index'], copy=False)
+    df.columns = handle['columns']
+    return df
+
+
+def remove(handle: dict):
+    """
+    Removes the spilled files. Existing views stay valid until they are not used anymore.
+    :param handle:
+    :return:
+    """
+    if handle is None:
+        return
+
+    for path in handle['paths']:
+        __remove_file(path)
+
+
+def __remove_file(path: Path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def __get_spill_path() -> Path:
+    return Path(Config.DATA_CACHE_DIRECTORY, "Spill", f"{uuid.uuid4().hex}.npy")
@@ -1,6 +1,8 @@
 from sklearn import preprocessing
 from sklearn.feature_selection import VarianceThreshold
 import numpy as np
+import pandas as pd
+from Services.Processing import Category_Encoding, Column_Profile
 np.random.seed(10)
 
 
@@ -8,23 +10,43 @@ np.random.seed(10)
 # https://chrisalbon.com/machine_learning/preprocessing_structured_data/convert_pandas_categorical_column_into_integers_for_scikit-learn/
 # https://stackoverflow.com/questions/51741605/standardize-dataset-containing-too-large-values Scaler
 
-def pre_process_data_set(df):
+def pre_process_data_set(df, state: dict = None, encoders: dict = None):
     """
     Prepare the data set, by filling na, remove bad columns and convert factorial to numerical columns
     :param df:
+    :param state: If provided, the fill values and encoders are stored in here, to apply them to new data later on
+    :param encoders: If provided, categories are encoded using these persistent encoders, which are extended in place
     :return:
     """
-    df.replace([np.inf, -np.inf], np.nan)
-    df[df == np.inf] = np.nan
+    replace_infinity(df)
     df = remove_bad_columns(df)
-    df = fill_na(df)
-    df = convert_factorial_to_numerical(df)
+    df = fill_na(df, state)
+    df = convert_factorial_to_numerical(df, state, encoders)
 
-    # Remove columns only containing 0
-    df = df[(df.T != 0).any()]
+    # Remove rows only containing 0
+    df = df[(df != 0).any(axis=1)]
     return df
 
 
+def replace_infinity(df):
+    """
+    Replaces positive infinity with nan in place.
+    Only float columns and object columns not only containing strings can contain infinity.
+    :param df:
+    :return:
+    """
+    for column, dtype in df.dtypes.items():
+        if dtype.kind == 'f':
+            infinity = np.isposinf(df[column].to_numpy())
+        elif dtype == object and pd.api.types.infer_dtype(df[column], skipna=True) not in ['string', 'empty']:
+            infinity = (df[column] == np.inf).to_numpy()
+        else:
+            continue
+
+        if infinity.any():
+            df.loc[infinity, column] = np.nan
+
+
 def variance_selection(X):
     """
     Transforms and selects features that are above a certain threshold
@@ -40,6 +62,21 @@ def variance_selection(X):
         return 0
 
 
+def variance_selected_columns(X):
+    """
+    Returns the columns of the data frame, which pass the variance selection.
+    Returns None, if no column passes
+    :param X:
+    :return:
+    """
+    features = X.columns[Column_Profile.get_variances(X).to_numpy() > 0]
+
+    if len(features) == 0:
+        return None
+
+    return features
+
+
 def normalize_X(X):
     """
     Standard Scaler to normalize the data using z-scores
@@ -74,46 +111,146 @@ def remove_bad_columns(df):
     return df
 
 
-def convert_factorial_to_numerical(df):
+def convert_factorial_to_numerical(df, state: dict = None, encoders: dict = None):
     """
-    Converts categorical data columns to its numerical equivalent using scikits´ LabelEncoder
+    Converts categorical data columns to its numerical equivalent.
+    Without encoders, the same codes as scikits´ LabelEncoder are used.
     :param df:
+    :param state: If provided, the classes of each encoded column are stored in here
+    :param encoders: If provided, the categories of each column are looked up and extended in here
     :return:
     """
     columns = df.select_dtypes(exclude=['int', 'float']).columns
-    le = preprocessing.LabelEncoder()
     for column in columns:
-        le.fit(df[column])
-        # le.fit_transform(df[column].astype(str))
-        df[column] = le.transform(df[column])
+        if encoders is not None:
+            classes = encoders.setdefault(column, [])
+            df[column] = Category_Encoding.encode(df[column], classes)
+        else:
+            # Sorted codes, like scikits´ LabelEncoder, but hash based instead of sorting all values
+            codes, classes = pd.factorize(df[column], sort=True)
+            df[column] = codes
+
+        if state is not None:
+            state.setdefault('encoders', dict())[column] = list(classes)
 
     return df
 
 
-def fill_na(df):
+def fill_na(df, state: dict = None):
     """
     Filling all NAs.
     Changing boolean values to string values to replace them.
+    :param df:
+    :param state: If provided, the value used to fill each column is stored in here
     """
     numeric_columns = df.select_dtypes(exclude=['object']).columns
     categorical_columns = df.select_dtypes(exclude=['int', 'float']).columns
 
-    mask = df.applymap(type) != bool
-    d = {True: 'True', False: 'False'}
-    df = df.where(mask, df.replace(d))
+    df = df.copy(deep=False)
+    for column in categorical_columns:
+        values = __convert_booleans(df[column])
+        if values is not df[column]:
+            df[column] = values
 
+    fill_values = dict()
     for column in numeric_columns:
-        df[column].fillna(0, inplace=True)
+        fill_values[column] = 0
 
     for column in categorical_columns:
         if True in df[column]:
-            df[column].fillna('True', inplace=True)
+            fill_values[column] = 'True'
 
         elif False in df[column]:
-            df[column].fillna('False', inplace=True)
+            fill_values[column] = 'False'
 
         else:
-            df[column].fillna('0', inplace=True)
+            fill_values[column] = '0'
+
+    df = __fill_missing_values(df, fill_values)
+
+    if state is not None:
+        state['fill_values'] = fill_values
+
+    return df
+
+
+def pre_process_chunk(df, state: dict, encoders: dict):
+    """
+    Prepares a single chunk of a data set, which is read in chunks.
+    The first chunk determines the columns and fill values of the data set. Following chunks are aligned to them,
+    so every chunk results in the same columns. Categories are encoded using the given encoders,
+    so codes are the same in every chunk.
+    :param df:
+    :param state: The fill values and encoders recorded while preprocessing the previous chunks
+    :param encoders:
+    :return:
+    """
+    replace_infinity(df)
+    df = remove_bad_columns(df)
+
+    if 'fill_values' not in state:
+        df = fill_na(df, state)
+    else:
+        df = __align_chunk(df, state['fill_values'])
+
+    df = convert_factorial_to_numerical(df, state, encoders)
+
+    # Remove rows only containing 0
+    df = df[(df != 0).any(axis=1)]
+    return df
+
+
+def __align_chunk(df, fill_values: dict):
+    """
+    Aligns the columns and types of a chunk to the first chunk of the data set and fills all NAs
+    Columns filled with strings are categorical, all other columns are numerical.
+    :param df:
+    :param fill_values:
+    :return:
+    """
+    df = df.reindex(columns=list(fill_values))
+
+    for column, fill_value in fill_values.items():
+        if isinstance(fill_value, str):
+            if df[column].dtype.kind in 'iuf':
+                df[column] = df[column].astype(object)
+            df[column] = __convert_booleans(df[column])
+
+        elif df[column].dtype.kind not in 'biuf':
+            df[column] = pd.to_numeric(df[column], errors='coerce')
+
+    return __fill_missing_values(df, fill_values)
+
+
+def __convert_booleans(values):
+    """
+    Converts boolean values to strings.
+    Only bool and object columns can contain booleans, all other columns are kept as they are
+    :param values:
+    :return:
+    """
+    if values.dtype == bool:
+        return values.map({True: 'True', False: 'False'})
+
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) not in ['string', 'empty']:
+        booleans = values.map(type) == bool
+        if booleans.any():
+            return values.where(~booleans, values.astype(str))
+
+    return values
+
+
+def __fill_missing_values(df, fill_values: dict):
+    """
+    Fills the missing values of each column with its fill value
+    Only columns containing missing values are filled, all other columns are kept as they are
+    :param df:
+    :param fill_values:
+    :return:
+    """
+    missing_values = {column: value for column, value in fill_values.items() if df[column].hasnans}
+    if len(missing_values) > 0:
+        df = df.fillna(missing_values)
 
     return df
 
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+# Applies the preprocessing recorded during training to new data.
+# Only depends on numpy and pandas, so it can be used by slim inference processes.
+
+# Up to this amount of rows, categories are encoded with plain python lookups, which avoid the overhead of pandas
+SMALL_BATCH_SIZE = 1000
+
+
+def apply_pre_processing(df, state: dict, columns: list):
+    """
+    Applies the transformations recorded by pre_process_data_set to new data, without fitting anything again.
+    Returns a data frame containing the given columns. Missing values are filled,
+    categories are encoded using the stored encoders. Unknown categories are encoded as -1.
+    :param df:
+    :param state:
+    :param columns:
+    :return:
+    """
+    fill_values = state.get('fill_values', dict())
+    encoders = state.get('encoders', dict())
+
+    X = np.zeros((len(df), len(columns)), dtype=np.float64)
+    for position, column in enumerate(columns):
+        if column in encoders:
+            X[:, position] = __encode(df[column] if column in df else None, len(df),
+                                      fill_values.get(column, '0'), encoders[column])
+
+        elif column in df:
+            values = df[column]
+            if values.dtype.kind not in 'biuf':
+                values = pd.to_numeric(values, errors='coerce')
+
+            # Missing and infinite values are filled with 0, like during training
+            values = values.to_numpy(dtype=np.float64)
+            X[:, position] = np.where(np.isfinite(values), values, 0)
+
+    return pd.DataFrame(X, index=df.index, columns=columns)
+
+
+def __encode(values, row_count: int, fill_value: str, categories: list):
+    """
+    Returns the code of each value. Unknown values are encoded as -1.
+    :param values: The values to encode or None if the column is missing
+    :param row_count:
+    :param fill_value:
+    :param categories:
+    :return:
+    """
+    if values is None:
+        values = pd.Series(fill_value, index=range(row_count))
+
+    if row_count > SMALL_BATCH_SIZE:
+        return pd.Categorical(values.fillna(fill_value).astype(str), categories=categories).codes
+
+    codes = {category: code for code, category in enumerate(categories)}
+    return [codes.get(fill_value if pd.isna(value) else str(value), -1) for value in values.to_numpy(dtype=object)]
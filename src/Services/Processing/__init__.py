@@ -1 +1,2 @@
-__all__ = ['PreProcessing', 'PostProcessing']
+__all__ = ['Category_Encoding', 'Column_Profile', 'Dataset_Cache', 'Memory_Map', 'PreProcessing', 'PostProcessing',
+           'Transformation']
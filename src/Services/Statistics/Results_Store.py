@@ -0,0 +1,259 @@
+from contextlib import closing
+from pathlib import Path
+from RuntimeContants import Runtime_Folders
+from Services.Configuration.Config import Config
+import datetime
+import logging
+import numpy as np
+import pandas as pd
+import sqlite3
+import sys
+
+# The records of each run are stored in one database in the folder of the run.
+# The catalog in the results folder lists every run and the database containing its records.
+DATABASE_NAME = 'results.sqlite'
+CATALOG_NAME = 'catalog.sqlite'
+# Tool workers of the same run write to the same database, so they wait for each other
+TIMEOUT = 60
+
+EVALUATIONS = 'evaluations'
+SPLITS = 'splits'
+SIMPLE_DATA_SETS = 'simple_data_sets'
+FEATURE_IMPORTANCES = 'feature_importances'
+LEARNING_CURVES = 'learning_curves'
+
+SCORE_COLUMNS = ['Engine', 'Train Score', 'Test Score', 'Potential Over Fitting', 'Initial Row Count',
+                 'Initial Feature Count', 'Processed Row Count', 'Processed Feature Count',
+                 'Cross Validation Test Score Mean', 'Cross Validation Test Score Var',
+                 'Cross Validation Train Score Mean', 'Cross Validation Train Score Var', 'Cross Validation Fits']
+# The columns of each table in addition to the tool, file and label of each record
+TABLES = {
+    EVALUATIONS: SCORE_COLUMNS,
+    SPLITS: ['Part'] + SCORE_COLUMNS + ['Total rows'],
+    SIMPLE_DATA_SETS: ['Simple Data Set'] + SCORE_COLUMNS + ['Features'],
+    FEATURE_IMPORTANCES: ['Feature', 'Importance'],
+    LEARNING_CURVES: ['Step', 'Training Rows', 'Training Fraction', 'Train Score', 'Test Score'],
+}
+TEXT_COLUMNS = ['Engine', 'Features', 'Feature']
+KEY_COLUMNS = ['tool', 'file', 'label']
+
+
+def register_run():
+    """
+    Adds the current run to the catalog and creates its database
+    :return:
+    """
+    if not Config.RESULTS_DATABASE:
+        return
+
+    run = Runtime_Folders.EVALUATION_DIRECTORY.name
+    try:
+        with closing(__connect(get_database_path())) as connection, connection:
+            __create_tables(connection)
+
+        with closing(__connect(get_catalog_path())) as connection, connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS runs (run TEXT PRIMARY KEY, started TEXT, finished TEXT, "
+                               "status TEXT, database TEXT, engine TEXT, arguments TEXT, verified_tools INTEGER, "
+                               "excluded_tools INTEGER)")
+            connection.execute("CREATE INDEX IF NOT EXISTS runs_started ON runs (started)")
+            connection.execute("INSERT OR REPLACE INTO runs (run, started, status, database, engine, arguments) "
+                               "VALUES (?, ?, ?, ?, ?, ?)",
+                               (run, datetime.datetime.now().isoformat(timespec='seconds'), 'running',
+                                str(Path(run, DATABASE_NAME)), Config.MODEL_ENGINE, ' '.join(sys.argv[1:])))
+    except BaseException as ex:
+        logging.warning(f"Could not register run {run} in the results catalog.")
+        if Config.DEBUG_MODE:
+            logging.exception(ex)
+
+
+def finish_run(verified_tools: list, excluded_tools: list):
+    """
+    Marks the current run as finished in the catalog
+    :param verified_tools:
+    :param excluded_tools:
+    :return:
+    """
+    if not Config.RESULTS_DATABASE:
+        return
+
+    run = Runtime_Folders.EVALUATION_DIRECTORY.name
+    try:
+        with closing(__connect(get_catalog_path())) as connection, connection:
+            connection.execute("UPDATE runs SET finished = ?, status = ?, verified_tools = ?, excluded_tools = ? "
+                               "WHERE run = ?", (datetime.datetime.now().isoformat(timespec='seconds'), 'finished',
+                                                 len(verified_tools), len(excluded_tools), run))
+    except BaseException as ex:
+        logging.warning(f"Could not mark run {run} as finished in the results catalog.")
+        if Config.DEBUG_MODE:
+            logging.exception(ex)
+
+
+def store_tool(tool):
+    """
+    Stores the records of all files of the tool in the database of the run. All records are inserted at once.
+    :param tool:
+    :return:
+    """
+    if not Config.RESULTS_DATABASE:
+        return
+
+    records = {table: [] for table in TABLES}
+    for file in tool.verified_files:
+        for label, data in file.evaluation_results.items():
+            records[EVALUATIONS].extend(__get_rows(tool.name, file.name, label, data, EVALUATIONS))
+
+        for label, data in file.split_evaluation_results.items():
+            # The index of the splits and simple data sets is their position, before they were sorted by score
+            records[SPLITS].extend(__get_rows(tool.name, file.name, label, data.rename_axis('Part').reset_index(),
+                                              SPLITS))
+
+        for label, data in file.simple_dfs_evaluation.items():
+            records[SIMPLE_DATA_SETS].extend(
+                __get_rows(tool.name, file.name, label, data.rename_axis('Simple Data Set').reset_index(),
+                           SIMPLE_DATA_SETS))
+
+        for label, data in file.feature_importances.items():
+            data = data.rename(columns={'Gini-importance': 'Importance'}).rename_axis('Feature').reset_index()
+            records[FEATURE_IMPORTANCES].extend(__get_rows(tool.name, file.name, label, data, FEATURE_IMPORTANCES))
+
+        for label, data in file.learning_curves.items():
+            records[LEARNING_CURVES].extend(__get_rows(tool.name, file.name, label, data, LEARNING_CURVES))
+
+    try:
+        with closing(__connect(get_database_path())) as connection, connection:
+            for table, rows in records.items():
+                if len(rows) == 0:
+                    continue
+
+                columns = KEY_COLUMNS + [__get_column_name(column) for column in TABLES[table]]
+                connection.executemany(f"INSERT INTO {table} ({', '.join(columns)}) "
+                                       f"VALUES ({', '.join(['?'] * len(columns))})", rows)
+    except BaseException as ex:
+        logging.warning(f"Could not store the results of tool {tool.name}.")
+        if Config.DEBUG_MODE:
+            logging.exception(ex)
+
+
+def load_records(table: str, tool: str = None, label: str = None, runs: int = 10):
+    """
+    Loads the records of the last runs listed in the catalog, e.g. to compare the scores of a tool across runs.
+    The run of each record is stored in the run column.
+    :param table: One of the TABLES
+    :param tool: Only records of this tool are loaded, if provided
+    :param label: Only records of this label are loaded, if provided
+    :param runs: The amount of runs
+    :return:
+    """
+    if table not in TABLES:
+        raise ValueError(f"Unknown table {table}")
+
+    if not get_catalog_path().is_file():
+        return pd.DataFrame()
+
+    with closing(__connect(get_catalog_path())) as connection:
+        catalog = connection.execute("SELECT run, database FROM runs ORDER BY started DESC LIMIT ?", (runs,)).fetchall()
+
+    conditions = []
+    params = []
+    for column, value in [('tool', tool), ('label', label)]:
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+    query = f"SELECT * FROM {table}" + (f" WHERE {' AND '.join(conditions)}" if len(conditions) > 0 else "")
+
+    records = []
+    for run, database in catalog:
+        path = Path(Config.DATA_RESULTS_DIRECTORY, database)
+        if not path.is_file():
+            continue
+
+        with closing(__connect(path)) as connection:
+            data = pd.read_sql_query(query, connection, params=params)
+        data.insert(0, 'run', run)
+        records.append(data)
+
+    if len(records) == 0:
+        return pd.DataFrame()
+
+    return pd.concat(records, ignore_index=True)
+
+
+def get_database_path(evaluation_directory=None) -> Path:
+    """
+    Returns the path of the database of the given run. Uses the current run, if none is given.
+    :param evaluation_directory:
+    :return:
+    """
+    if evaluation_directory is None:
+        evaluation_directory = Runtime_Folders.EVALUATION_DIRECTORY
+
+    return Path(evaluation_directory, DATABASE_NAME)
+
+
+def get_catalog_path() -> Path:
+    """
+    Returns the path of the catalog listing all runs
+    :return:
+    """
+    return Path(Config.DATA_RESULTS_DIRECTORY, CATALOG_NAME)
+
+
+def __connect(path: Path):
+    return sqlite3.connect(str(path), timeout=TIMEOUT)
+
+
+def __create_tables(connection):
+    """
+    Creates all tables and their indexes
+    :param connection:
+    :return:
+    """
+    for table, columns in TABLES.items():
+        definitions = [f"{column} TEXT" for column in KEY_COLUMNS]
+        definitions += [f"{__get_column_name(column)} {'TEXT' if column in TEXT_COLUMNS else 'NUMERIC'}"
+                        for column in columns]
+        connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(definitions)})")
+        connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_tool_file_label ON {table} (tool, file, label)")
+
+
+def __get_rows(tool: str, file: str, label: str, data, table: str) -> list:
+    """
+    Converts the records of a data frame into rows of the given table. Missing columns are stored as NULL.
+    :param tool:
+    :param file:
+    :param label:
+    :param data:
+    :param table:
+    :return:
+    """
+    if data is None or data.empty:
+        return []
+
+    data = data.reindex(columns=TABLES[table])
+    return [(tool, file, label, *[__get_value(value) for value in values])
+            for values in data.itertuples(index=False, name=None)]
+
+
+def __get_value(value):
+    """
+    Converts a value of a data frame into a value sqlite is able to store
+    :param value:
+    :return:
+    """
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(item) for item in value)
+
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+
+    if isinstance(value, (bool, np.bool_)):
+        return int(value)
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+
+def __get_column_name(column: str) -> str:
+    return column.lower().replace(' ', '_')
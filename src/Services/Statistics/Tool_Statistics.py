@@ -4,11 +4,8 @@ import os
 from RuntimeContants import Runtime_Folders
 from pathlib import Path
 import logging
-import matplotlib.pyplot as plt
-import seaborn as sns
 from Services.Configuration.Config import Config
-
-sns.set(style="whitegrid")
+from Services.Plotting import Plot_Specs
 
 
 def generate_tool_statistics():
@@ -50,7 +47,7 @@ def __get_best_performing_tools():
 
         label_performance.sort_values(by=['Test Score'], inplace=True, ascending=False)
         label_performance = label_performance[
-            ['Tool', 'File Name', 'Initial Feature Count', 'Initial Row Count', 'Potential Over Fitting',
+            ['Tool', 'File Name', 'Engine', 'Initial Feature Count', 'Initial Row Count', 'Potential Over Fitting',
              'Processed Feature Count', 'Processed Row Count', 'Test Score', 'Train Score']]
         label_performance.to_csv(
             os.path.join(Runtime_Folders.EVALUATION_DIRECTORY, f"tools_{label}_best_performing_by_version.csv"),
@@ -88,7 +85,7 @@ def __get_worst_performing_tools():
 
         label_performance.sort_values(by=['Test Score'], inplace=True, ascending=False)
         label_performance = label_performance[
-            ['Tool', 'File Name', 'Initial Feature Count', 'Initial Row Count', 'Potential Over Fitting',
+            ['Tool', 'File Name', 'Engine', 'Initial Feature Count', 'Initial Row Count', 'Potential Over Fitting',
              'Processed Feature Count', 'Processed Row Count', 'Test Score', 'Train Score']]
         label_performance.to_csv(
             os.path.join(Runtime_Folders.EVALUATION_DIRECTORY, f"tools_{label}_worst_performing_by_version.csv"),
@@ -189,16 +186,9 @@ def __plot_predictions_result():
         if label not in predictions_per_label:
             continue
         data = predictions_per_label[label]
-        ax = sns.boxplot(x="Tool", y="Test Score", data=data,
-                         palette="Set3")
-        ax = sns.swarmplot(x="Tool", y="Test Score", data=data, color=".25")
-        ax.set_xticklabels(ax.get_xticklabels(), rotation=90)
-        fig = ax.get_figure()
-
-        fig.savefig(Path.joinpath(Runtime_Folders.EVALUATION_DIRECTORY, f"{label}_prediction_overview.jpg"),
-                    bbox_inches="tight")
-        fig.clf()
-        plt.close('all')
+        Plot_Specs.save_spec(Path.joinpath(Runtime_Folders.EVALUATION_DIRECTORY, f"{label}_prediction_overview.jpg"),
+                             Plot_Specs.BOX_PLOT, data[['Tool', 'Test Score']], x="Tool", y="Test Score",
+                             palette="Set3", rotation=90, swarm_limit=Config.PLOT_SWARM_LIMIT, bbox_inches="tight")
 
 
 def __row_helper(performance_df):
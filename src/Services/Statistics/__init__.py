@@ -1 +1 @@
-__all__ = ['Runtime_Statistics', 'Tool_Statistics']
\ No newline at end of file
+__all__ = ['Results_Store', 'Runtime_Statistics', 'Tool_Statistics']
@@ -1,63 +1,57 @@
 from Entities.Tool import Tool
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
+from Services.Logging import Console
 from Services.FileSystem import File_Management
 from RuntimeContants import Runtime_Datasets
+from RuntimeContants import Runtime_Folders
 from Services.Configuration.Config import Config
+from pathlib import Path
+import pandas as pd
 import os
 import logging
-from pathlib import Path
 
 
 def load_tools():
     """
     Gathers all data, which is required. Takes command line args into account.
+    Only the header and the line count of each file are read. The files are loaded once their tool is evaluated.
     :return:
     """
 
     logging.info(f"Detecting tools...")
-    sleep(1)
-    for file in os.listdir(Config.DATA_RAW_DIRECTORY):
-        file_path = os.fsdecode(file)
-        try:
-            if file_path.endswith(".csv") or file_path.endswith(".tsv"):
-                file_name: str = File_Management.get_file_name(file_path)
-                # Remove the files version number if present, then remove the file extension to get a clean name
-
-                if any(char.isdigit() for char in file_name):
-                    tool_name: str = os.path.splitext(str(file_name.rsplit('_', 1)[0]))[0]
-                else:
-                    tool_name = Path(file_path).stem
-
-                tool = Tool(tool_name)
-
-                tool_found: bool = False
-                for stored_tool in Runtime_Datasets.DETECTED_TOOLS:
-                    if not tool_found:
-                        if stored_tool.__eq__(tool):
-                            stored_tool.add_file(file_path)
-                            tool_found = True
-                            break
-
-                if tool_found:
-                    continue
-                else:
-                    logging.info(f"Detected tool {tool.name}")
-                    tool.add_file(file_path)
-                    Runtime_Datasets.DETECTED_TOOLS.append(tool)
-        except OSError as ex:
-            logging.warning(ex)
-        except BaseException as ex:
-            logging.warning(ex)
-
-    # Verify all tools
-    for tool in Runtime_Datasets.DETECTED_TOOLS:
-        tool.verify()
-        if Config.DEBUG_MODE:
-            if tool.verified:
-                logging.debug(f"Tool {tool.name} is verified.")
-            else:
-                logging.debug(f"Tool {tool.name} is not verified.")
+    Console.pause(1)
+    file_paths = sorted(os.fsdecode(file) for file in os.listdir(Config.DATA_RAW_DIRECTORY))
+    file_paths = [file_path for file_path in file_paths if file_path.endswith(".csv") or file_path.endswith(".tsv")]
+
+    # Files are discovered in parallel. The results keep the order of the file paths, so tools are always the same.
+    with ThreadPoolExecutor(max_workers=Config.LOAD_WORKERS) as executor:
+        discovered_files = list(executor.map(__try_discover_file, file_paths))
+
+    excluded_files = Runtime_Datasets.EXCLUDED_FILES
+    tools = dict()
+    for file_path, discovered_file in zip(file_paths, discovered_files):
+        if discovered_file is None:
+            continue
+
+        if discovered_file['Reason'] is not None:
+            if Config.VERBOSE:
+                logging.warning(f"{file_path} will not be evaluated. {discovered_file['Reason']}")
+            excluded_files.append(discovered_file)
+            continue
 
+        tool = tools.get(discovered_file['Tool'])
+        if tool is None:
+            tool = Tool(discovered_file['Tool'])
+            logging.info(f"Detected tool {tool.name}")
+            tools[tool.name] = tool
+            Runtime_Datasets.DETECTED_TOOLS.append(tool)
+
+        tool.add_file(file_path)
+
+    logging.info(f"Excluded {len(excluded_files)} files.")
+    __write_excluded_files_report(excluded_files)
+
+    # The files of the tools are verified, once they are loaded
     Runtime_Datasets.VERIFIED_TOOLS = [tool for tool in Runtime_Datasets.DETECTED_TOOLS if tool.verified]
     Runtime_Datasets.EXCLUDED_TOOLS = [tool for tool in Runtime_Datasets.DETECTED_TOOLS if not tool.verified]
     print()
@@ -66,4 +60,79 @@ def load_tools():
         f" {len(Runtime_Datasets.EXCLUDED_TOOLS)} tools.")
 
     print()
-    sleep(2)
+    Console.pause(2)
+
+
+def __try_discover_file(file_path: str):
+    """
+    Discovers the given file. Returns None, if the discovery failed.
+    :param file_path:
+    :return:
+    """
+    try:
+        return discover_file(file_path)
+    except BaseException as ex:
+        logging.warning(ex)
+        return None
+
+
+def discover_file(file_path: str) -> dict:
+    """
+    Decides whether a file is eligible to be evaluated, by only reading its header and counting its lines.
+    Row and column count are upper bounds, so a file is only excluded if a full load would exclude it too.
+    :param file_path:
+    :return:
+    """
+    discovered_file = {'File Name': file_path, 'Tool': File_Management.get_tool_name(file_path), 'Rows': 0,
+                       'Columns': 0, 'Labels': [], 'Reason': None}
+
+    columns = File_Management.read_file_header(file_path)
+    if columns is None:
+        discovered_file['Reason'] = "The file could not be read."
+        return discovered_file
+
+    discovered_file['Columns'] = len(columns)
+    discovered_file['Rows'] = File_Management.count_rows(file_path)
+    discovered_file['Labels'] = [label for label in Config.LABELS if label in columns]
+
+    if discovered_file['Rows'] < Config.MINIMUM_ROW_COUNT:
+        discovered_file['Reason'] = f"Insufficient rows ({discovered_file['Rows']})."
+    elif discovered_file['Columns'] < Config.MINIMUM_COLUMN_COUNT:
+        discovered_file['Reason'] = f"Insufficient columns ({discovered_file['Columns']})."
+    elif len(discovered_file['Labels']) == 0:
+        discovered_file['Reason'] = "No labels detected."
+
+    return discovered_file
+
+
+def update_excluded_files_report(tools: list):
+    """
+    Adds the files, which did not pass the verification once their tool was loaded, to the excluded files report
+    :param tools:
+    :return:
+    """
+    excluded_files = list(Runtime_Datasets.EXCLUDED_FILES)
+    for tool in tools:
+        for file in tool.excluded_files:
+            columns, rows, features = file.get_raw_df_statistics()
+            excluded_files.append({'File Name': file.full_name, 'Tool': tool.name, 'Rows': rows, 'Columns': columns,
+                                   'Labels': file.detected_labels, 'Reason': file.exclusion_reason})
+
+    if len(excluded_files) > len(Runtime_Datasets.EXCLUDED_FILES):
+        logging.info(f"Excluded {len(excluded_files) - len(Runtime_Datasets.EXCLUDED_FILES)} more files, "
+                     f"once they were loaded.")
+
+    __write_excluded_files_report(excluded_files)
+
+
+def __write_excluded_files_report(excluded_files: list):
+    """
+    Writes all files, which are excluded from the evaluation and the reason why, to the excluded files report
+    :param excluded_files:
+    :return:
+    """
+    try:
+        report = pd.DataFrame(excluded_files, columns=['File Name', 'Tool', 'Rows', 'Columns', 'Labels', 'Reason'])
+        report.to_csv(Path(Runtime_Folders.EVALUATION_DIRECTORY, f"{Config.FILE_EXCLUDED_FILES}.csv"), index=False)
+    except BaseException as ex:
+        logging.exception(ex)
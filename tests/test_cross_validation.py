@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+from Services.Configuration.Config import Config
+from Services.Predictions import Cross_Validation, Predictions
+from test_feature_importances import create_file, create_data_set
+
+
+class RecordingModel:
+    """
+    Predicts the mean of the label and records the rows it is trained with
+    """
+    fitted_rows = []
+
+    def fit(self, X, y):
+        RecordingModel.fitted_rows.append(X[:, 0].copy())
+        self.mean = y.mean()
+        return self
+
+    def predict(self, X):
+        return np.full(len(X), self.mean)
+
+
+def test_parts_keep_the_folds_of_their_rows(monkeypatch):
+    monkeypatch.setattr(Config, 'FOREST_ESTIMATORS', 10)
+    monkeypatch.setattr(Config, 'FIT_CACHE', False)
+    monkeypatch.setattr(Config, 'CROSS_VALIDATION', True)
+    monkeypatch.setattr(Config, 'SPLIT_WORKERS', 1)
+    evaluated_folds = []
+    monkeypatch.setattr(Cross_Validation, 'cross_validate',
+                        lambda label, df, profile, folds: evaluated_folds.append((df, folds)) or None)
+    file = create_file(create_data_set(12000))
+
+    file.calculate_partial_prediction('runtime')
+
+    positions = pd.Series(np.arange(len(file.preprocessed_df)), index=file.preprocessed_df.index)
+    assert len(evaluated_folds) > 0
+    for df, folds in evaluated_folds:
+        np.testing.assert_array_equal(folds, file.get_folds()[:, positions[df.index].to_numpy()])
+
+
+def test_removed_rows_are_removed_from_the_folds(monkeypatch):
+    monkeypatch.setattr(Config, 'K_FOLDS', 5)
+    monkeypatch.setattr(Config, 'REPETITIONS', 2)
+    monkeypatch.setattr(Config, 'CROSS_VALIDATION_WORKERS', 1)
+    monkeypatch.setattr(Predictions, 'create_model', lambda: RecordingModel())
+    RecordingModel.fitted_rows = []
+    # Every third row only contains zeros and is removed before training
+    df = pd.DataFrame({'row': np.arange(60, dtype=float), 'runtime': np.arange(60, dtype=float)})
+    df.loc[df.index % 3 == 0, 'row'] = 0
+    folds = Cross_Validation.create_folds(len(df))
+
+    scores = Cross_Validation.cross_validate('runtime', df, folds=folds)
+
+    assert scores['Cross Validation Fits'] == 10
+    kept = df['row'].to_numpy() != 0
+    for (repetition, k), fitted_rows in zip([(r, k) for r in range(2) for k in range(5)], RecordingModel.fitted_rows):
+        expected_rows = df['row'].to_numpy()[kept & (folds[repetition] != k)]
+        np.testing.assert_array_equal(np.sort(fitted_rows), np.sort(expected_rows))
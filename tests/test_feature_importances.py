@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+from Entities.File import File
+from Services.Configuration.Config import Config
+
+
+def create_file(df) -> File:
+    file = File.__new__(File)
+    file.name = 'test'
+    file.preprocessed_df = df
+    file.column_profile = None
+    file.folds = None
+    file.spilled_matrix = None
+    return file
+
+
+def create_data_set(row_count: int = 600):
+    rng = np.random.RandomState(1)
+    df = pd.DataFrame({'first': rng.rand(row_count), 'constant': 1.0, 'noise': rng.rand(row_count),
+                       'important': rng.rand(row_count)})
+    df['runtime'] = df['important'] * 100 + df['first']
+    return df
+
+
+def test_feature_importances_skip_pruned_columns(monkeypatch):
+    monkeypatch.setattr(Config, 'FOREST_ESTIMATORS', 10)
+    monkeypatch.setattr(Config, 'FIT_CACHE', False)
+    monkeypatch.setattr(Config, 'CROSS_VALIDATION', False)
+    file = create_file(create_data_set())
+
+    result = file.calculate_prediction('runtime')
+    importance = result['feature_importance']
+
+    assert 'constant' not in result['features']
+    assert sorted(importance.index) == sorted(result['features'])
+    assert importance.index[0] == 'important'
+
+
+def test_split_feature_importances_skip_pruned_columns(monkeypatch):
+    monkeypatch.setattr(Config, 'FOREST_ESTIMATORS', 10)
+    monkeypatch.setattr(Config, 'FIT_CACHE', False)
+    monkeypatch.setattr(Config, 'CROSS_VALIDATION', False)
+    monkeypatch.setattr(Config, 'SPLIT_WORKERS', 1)
+    file = create_file(create_data_set())
+
+    result = file.calculate_partial_prediction('runtime')
+    importance = result['feature_importance']
+
+    assert 'constant' not in importance.index
+    assert importance.index[0] == 'important'
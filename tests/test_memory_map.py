@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+from Services.Configuration.Config import Config
+from Services.Processing import Memory_Map
+
+
+def test_spilled_data_set_keeps_column_types(monkeypatch, tmp_path):
+    monkeypatch.setattr(Config, 'DATA_CACHE_DIRECTORY', str(tmp_path))
+    # Integers above 2^53 can not be represented as float, the type all columns shared before
+    df = pd.DataFrame({'count': np.arange(5, dtype=np.int64) + 2 ** 55, 'ratio': np.linspace(0, 1, 5),
+                       'flag': [True, False, True, False, True], 'code': np.arange(5, dtype=np.int64)},
+                      index=[4, 4, 1, 2, 0])
+
+    handle = Memory_Map.spill(df)
+    spilled_df = Memory_Map.load(handle)
+
+    pd.testing.assert_frame_equal(spilled_df, df)
+    Memory_Map.remove(handle)
+    assert list(tmp_path.joinpath('Spill').iterdir()) == []